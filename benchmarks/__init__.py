@@ -0,0 +1,4 @@
+"""
+Upwork Assistant Benchmarks
+Offline benchmarks that run without network access or a browser
+"""
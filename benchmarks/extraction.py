@@ -0,0 +1,65 @@
+"""
+Extraction Throughput Benchmark
+Replays the recorded search pages through the offline extraction engine
+
+Usage:
+    python -m benchmarks.extraction --rounds 20 --workers 1 2 4
+"""
+
+import argparse
+import json
+import os
+import time
+
+from scrapper.html_extractor import extract_fixtures, list_page_fixtures
+
+
+def run_benchmark(rounds=10, worker_counts=(1, 2, 4), fixture_dir=None):
+    """Extract the fixture corpus `rounds` times for each worker count"""
+    fixtures = list_page_fixtures(fixture_dir) if fixture_dir else list_page_fixtures()
+    if not fixtures:
+        raise RuntimeError("No HTML fixtures found to benchmark")
+    corpus = fixtures * rounds
+
+    results = []
+    for workers in worker_counts:
+        started = time.perf_counter()
+        extracted = extract_fixtures(corpus, workers=workers)
+        elapsed = time.perf_counter() - started
+        jobs = sum(len(r['jobs']) for r in extracted)
+        page_times = sorted(r['seconds'] for r in extracted)
+        results.append({
+            'workers': workers,
+            'pages': len(corpus),
+            'jobs': jobs,
+            'seconds': round(elapsed, 3),
+            'pages_per_sec': round(len(corpus) / elapsed, 1),
+            'jobs_per_sec': round(jobs / elapsed, 1),
+            'median_page_ms': round(page_times[len(page_times) // 2] * 1000, 2),
+        })
+    return {'fixtures': len(fixtures), 'rounds': rounds, 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline job extraction")
+    parser.add_argument("--rounds", type=int, default=10, help="Times to replay the fixture corpus")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Process pool sizes to compare")
+    parser.add_argument("--fixtures", default=None, help="Directory of recorded .html pages")
+    parser.add_argument("--out-json", default=None, help="Optional JSON report file")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.rounds, args.workers, args.fixtures)
+    print(f"📊 {report['fixtures']} fixtures x {report['rounds']} rounds")
+    for row in report['results']:
+        print(f"   workers={row['workers']:<3} {row['pages_per_sec']:>8} pages/s "
+              f"{row['jobs_per_sec']:>9} jobs/s  median page {row['median_page_ms']} ms")
+
+    if args.out_json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out_json)), exist_ok=True)
+        with open(args.out_json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved to: {args.out_json}")
+
+
+if __name__ == "__main__":
+    main()
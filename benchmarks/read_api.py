@@ -0,0 +1,251 @@
+"""
+Read API Load Benchmark
+Drives /api/jobs (every filter, sort, page size and page position),
+/api/stats and /api/profile in-process over synthetic databases of each
+size, and reports throughput and p50/p95/p99 latency as JSON that can be
+compared across commits
+
+Usage:
+    python -m benchmarks.read_api --rows 10000 100000 1000000 --out-json reports/read_api.json
+    python -m benchmarks.read_api --rows 10000 --compare reports/read_api.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sqlite3
+import subprocess
+import time
+from datetime import datetime
+
+import httpx
+
+from benchmarks.synthetic_jobs import DEFAULT_DATA_DIR, build_database
+
+REPORT_VERSION = 1
+PAGE_SIZES = (20, 100)
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _percentile(sorted_values, fraction):
+    # Nearest-rank percentile, as in scrape_metrics
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_DIR,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def build_scenarios(conn):
+    """(name, path, params) for every /api/jobs combination, then stats and profile.
+
+    Pages are the first, middle and last page of each filter, so deep OFFSETs
+    are measured too.
+    """
+    threshold = conn.execute("SELECT score_threshold FROM profile ORDER BY updated_at DESC LIMIT 1").fetchone()[0]
+    counts = {
+        'all': conn.execute("SELECT COUNT(*) FROM jobs WHERE is_active = 1").fetchone()[0],
+        'above': conn.execute("SELECT COUNT(*) FROM jobs WHERE score >= ? AND is_active = 1",
+                              (threshold,)).fetchone()[0],
+    }
+    scenarios = []
+    for job_filter, count in counts.items():
+        for sort_by in ('time', 'score'):
+            for page_size in PAGE_SIZES:
+                last_page = max(1, -(-count // page_size))
+                for position, page in (('first', 1), ('middle', max(1, last_page // 2)), ('last', last_page)):
+                    scenarios.append((
+                        f"jobs_{job_filter}_{sort_by}_size{page_size}_{position}",
+                        '/api/jobs',
+                        {
+                            'show_above_threshold_only': str(job_filter == 'above').lower(),
+                            'sort_by': sort_by,
+                            'page': page,
+                            'page_size': page_size,
+                        },
+                    ))
+    scenarios.append(('stats', '/api/stats', {}))
+    scenarios.append(('profile', '/api/profile', {}))
+    return scenarios, counts
+
+
+async def _drive(client, path, params, requests, concurrency, max_seconds):
+    """Send up to `requests` GETs from `concurrency` workers; stop early after max_seconds"""
+    latencies = []
+    errors = 0
+    remaining = requests
+    deadline = time.perf_counter() + max_seconds
+
+    async def worker():
+        nonlocal errors, remaining
+        while remaining > 0 and time.perf_counter() < deadline:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                resp = await client.get(path, params=params)
+                failed = resp.status_code != 200
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+async def _run_scenarios(app, scenarios, requests, warmup, concurrency, max_seconds):
+    results = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark') as client:
+        for name, path, params in scenarios:
+            await _drive(client, path, params, warmup, 1, max_seconds)
+            latencies, errors, elapsed = await _drive(client, path, params, requests, concurrency, max_seconds)
+            latencies.sort()
+            results.append({
+                'name': name,
+                'path': path,
+                'params': params,
+                'requests': len(latencies),
+                'errors': errors,
+                'seconds': round(elapsed, 3),
+                'requests_per_sec': round(len(latencies) / elapsed, 1) if elapsed else None,
+                'latency_ms': {
+                    'mean': round(sum(latencies) / len(latencies) * 1000, 3),
+                    'p50': round(_percentile(latencies, 0.50) * 1000, 3),
+                    'p95': round(_percentile(latencies, 0.95) * 1000, 3),
+                    'p99': round(_percentile(latencies, 0.99) * 1000, 3),
+                    'max': round(latencies[-1] * 1000, 3),
+                } if latencies else None,
+            })
+    return results
+
+
+def run_benchmark(row_counts=(10000, 100000, 1000000), requests=200, warmup=5, concurrency=1,
+                  max_seconds=10.0, seed=0, data_dir=DEFAULT_DATA_DIR, only=None):
+    """Benchmark the read endpoints against a synthetic database of each size.
+
+    The app runs in this process without its startup tasks (no scheduler or
+    scraping); requests go through the full middleware stack over ASGI.
+    `only` restricts the run to scenarios whose name contains one of its
+    strings.
+    """
+    commit, dirty = _git_commit()
+    report = {
+        'benchmark': 'read_api',
+        'version': REPORT_VERSION,
+        'commit': commit,
+        'dirty': dirty,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'settings': {'requests': requests, 'warmup': warmup, 'concurrency': concurrency,
+                     'max_seconds': max_seconds, 'seed': seed},
+        'datasets': [],
+    }
+
+    previous_dir = os.getcwd()
+    for rows in row_counts:
+        info = build_database(data_dir, rows, seed)
+        os.chdir(info['directory'])
+        try:
+            from main import app, init_database
+
+            init_database()  # applies migrations of this commit to a database built by another
+            conn = sqlite3.connect('upwork_assistant.db')
+            try:
+                scenarios, counts = build_scenarios(conn)
+            finally:
+                conn.close()
+            if only:
+                scenarios = [scenario for scenario in scenarios if any(part in scenario[0] for part in only)]
+            results = asyncio.run(_run_scenarios(app, scenarios, requests, warmup, concurrency, max_seconds))
+        finally:
+            os.chdir(previous_dir)
+        report['datasets'].append({
+            'rows': rows,
+            'active_jobs': counts['all'],
+            'above_threshold_jobs': counts['above'],
+            'build_seconds': info['build_seconds'],
+            'scenarios': results,
+        })
+    return report
+
+
+def compare_reports(baseline, current):
+    """(rows, scenario, baseline p50, current p50, p50 change %, baseline rps, current rps) for shared scenarios"""
+    baseline_results = {
+        (dataset['rows'], result['name']): result
+        for dataset in baseline['datasets'] for result in dataset['scenarios']
+    }
+    rows = []
+    for dataset in current['datasets']:
+        for result in dataset['scenarios']:
+            before = baseline_results.get((dataset['rows'], result['name']))
+            if not before or not before['latency_ms'] or not result['latency_ms']:
+                continue
+            old_p50, new_p50 = before['latency_ms']['p50'], result['latency_ms']['p50']
+            change = round((new_p50 - old_p50) / old_p50 * 100, 1) if old_p50 else None
+            rows.append((dataset['rows'], result['name'], old_p50, new_p50, change,
+                         before['requests_per_sec'], result['requests_per_sec']))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load benchmark of the read API over synthetic job data")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000], help="Database sizes")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent in-flight requests")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="Time limit per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Where benchmark databases are kept")
+    parser.add_argument("--only", nargs="+", default=None, help="Run scenarios whose name contains any of these")
+    parser.add_argument("--out-json", default=None, help="Optional JSON report file")
+    parser.add_argument("--compare", default=None, help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    # The app logs at INFO; per-request client logs would swamp the output
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    report = run_benchmark(args.rows, args.requests, args.warmup, args.concurrency, args.max_seconds,
+                           args.seed, args.data_dir, args.only)
+
+    for dataset in report['datasets']:
+        print(f"📊 {dataset['rows']} rows ({dataset['active_jobs']} active, "
+              f"{dataset['above_threshold_jobs']} above threshold)")
+        for result in dataset['scenarios']:
+            latency = result['latency_ms'] or {}
+            print(f"   {result['name']:<36} {result['requests_per_sec']:>8} req/s  "
+                  f"p50 {latency.get('p50')} ms  p95 {latency.get('p95')} ms  p99 {latency.get('p99')} ms"
+                  + (f"  {result['errors']} errors" if result['errors'] else ""))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"🔁 p50 vs {args.compare} (commit {(baseline.get('commit') or 'unknown')[:10]})")
+        if baseline.get('settings') != report['settings']:
+            print(f"   ⚠️ Settings differ: {baseline.get('settings')} vs {report['settings']}")
+        for rows, name, old_p50, new_p50, change, old_rps, new_rps in compare_reports(baseline, report):
+            print(f"   {rows:>8} {name:<36} {old_p50:>9} -> {new_p50:>9} ms  "
+                  f"({'+' if change and change > 0 else ''}{change}%)  {old_rps} -> {new_rps} req/s")
+
+    if args.out_json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out_json)), exist_ok=True)
+        with open(args.out_json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved to: {args.out_json}")
+
+
+if __name__ == "__main__":
+    main()
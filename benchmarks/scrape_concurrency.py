@@ -0,0 +1,94 @@
+"""
+Scrape Concurrency Benchmark
+Runs the parallel scraper over the recorded search pages with a simulated
+page-load latency, showing how wall time scales with browser concurrency
+
+Usage:
+    python -m benchmarks.scrape_concurrency --urls 12 --latency 1.0 --concurrency 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from scrapper.html_extractor import extract_jobs_from_html, list_page_fixtures, load_page_fixture
+from scrapper.parallel_scraper import scrape_urls
+
+
+def make_fixture_fetcher(url_to_fixture, latency):
+    """Stand-in for manual_upwork_viewer: sleep like a page load, then extract"""
+
+    def fetch(url, slot, wait_turn):
+        time.sleep(latency)
+        page_source, base_url = load_page_fixture(url_to_fixture[url])
+        return extract_jobs_from_html(page_source, base_url)
+
+    return fetch
+
+
+async def _timed_run(urls, fetch, concurrency, per_domain, min_interval):
+    started = time.perf_counter()
+    first_result_at = None
+    jobs = 0
+    async for result in scrape_urls(urls, fetch, concurrency, per_domain, min_interval):
+        if first_result_at is None:
+            first_result_at = time.perf_counter() - started
+        jobs += len(result['jobs'])
+    return time.perf_counter() - started, first_result_at, jobs
+
+
+def run_benchmark(url_count=12, latency=1.0, concurrency_levels=(1, 2, 4, 8), min_interval=0.0):
+    fixtures = list_page_fixtures()
+    if not fixtures:
+        raise RuntimeError("No HTML fixtures found to benchmark")
+    url_to_fixture = {
+        f"https://www.upwork.com/nx/search/jobs/?q=bench{i}": fixtures[i % len(fixtures)]
+        for i in range(url_count)
+    }
+    urls = list(url_to_fixture)
+    fetch = make_fixture_fetcher(url_to_fixture, latency)
+
+    results = []
+    baseline = None
+    for concurrency in concurrency_levels:
+        elapsed, first_result, jobs = asyncio.run(
+            _timed_run(urls, fetch, concurrency, per_domain=concurrency, min_interval=min_interval)
+        )
+        baseline = baseline or elapsed
+        results.append({
+            'concurrency': concurrency,
+            'urls': len(urls),
+            'jobs': jobs,
+            'seconds': round(elapsed, 3),
+            'first_result_seconds': round(first_result, 3),
+            'speedup': round(baseline / elapsed, 2),
+        })
+    return {'latency_seconds': latency, 'min_interval_seconds': min_interval, 'results': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel scraping over HTML fixtures")
+    parser.add_argument("--urls", type=int, default=12, help="Number of search URLs to scrape")
+    parser.add_argument("--latency", type=float, default=1.0, help="Simulated page load seconds per URL")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8], help="Browser slots to compare")
+    parser.add_argument("--min-interval", type=float, default=0.0, help="Per-domain seconds between page starts")
+    parser.add_argument("--out-json", default=None, help="Optional JSON report file")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.urls, args.latency, args.concurrency, args.min_interval)
+    print(f"📊 {args.urls} URLs, {args.latency}s simulated load each")
+    for row in report['results']:
+        print(f"   concurrency={row['concurrency']:<3} {row['seconds']:>7}s wall  "
+              f"first result {row['first_result_seconds']}s  speedup x{row['speedup']}")
+
+    if args.out_json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out_json)), exist_ok=True)
+        with open(args.out_json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report saved to: {args.out_json}")
+
+
+if __name__ == "__main__":
+    main()
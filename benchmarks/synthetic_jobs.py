@@ -0,0 +1,184 @@
+"""
+Synthetic Job Data
+Deterministic generator of realistic job rows (skills, budgets, clients,
+timestamps) and builder of benchmark databases at a given size. The same
+rows and seed always produce the same database, so runs on different commits
+read identical data.
+
+Usage:
+    python -m benchmarks.synthetic_jobs --rows 100000 --data-dir /tmp/upwork_bench
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from skill_index import SKILL_VOCABULARY
+
+GENERATOR_VERSION = 1  # bump when generated rows change, so cached databases are rebuilt
+EPOCH = datetime(2025, 1, 1)
+HISTORY_DAYS = 90
+INACTIVE_FRACTION = 0.05
+INSERT_BATCH_SIZE = 10000
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'upwork_assistant_bench')
+
+# Profile stored in benchmark databases; jobs are scored against its skills
+PROFILE_SKILLS = ['python', 'fastapi', 'web scraping', 'automation', 'sql', 'docker']
+PROFILE_GITHUB_USERNAME = 'bench-user'
+PROFILE_REPOS = 30
+
+# Profile skills first, so Zipf weighting makes them the common ones
+SKILL_POOL = PROFILE_SKILLS + [skill for skill in SKILL_VOCABULARY if skill not in PROFILE_SKILLS]
+SKILL_WEIGHTS = [1 / (rank + 1) ** 0.8 for rank in range(len(SKILL_POOL))]
+
+ROLES = ['Python Developer', 'Data Engineer', 'Automation Expert', 'Full Stack Developer', 'ML Engineer',
+         'Backend Developer', 'Web Scraping Specialist', 'DevOps Engineer', 'AI Consultant', 'API Developer']
+PROJECTS = ['e-commerce dashboard', 'lead generation pipeline', 'chatbot MVP', 'price monitoring tool',
+            'CRM integration', 'data migration', 'reporting automation', 'SaaS backend', 'LLM agent',
+            'inventory sync', 'analytics platform', 'scraper maintenance']
+WORDS = ('we need an experienced developer to build and maintain a reliable service that integrates our '
+         'existing tools with third party apis the project includes data collection cleaning storage '
+         'scheduling monitoring and documentation you will work with our team to deliver clean tested code '
+         'long term collaboration is possible for the right freelancer please share relevant past work').split()
+DURATIONS = ['Less than 1 month', '1 to 3 months', '3 to 6 months', 'More than 6 months']
+EXPERIENCE_LEVELS = ['Entry level', 'Intermediate', 'Expert']
+LOCATIONS = ['United States', 'United Kingdom', 'Germany', 'Canada', 'Australia', 'India', 'UAE',
+             'Netherlands', 'Singapore', 'France']
+HOURLY_RATES = [10, 15, 20, 25, 30, 40, 50, 60, 70, 90]
+FIXED_PRICES = [50, 100, 250, 500, 1000, 2500, 5000]
+
+
+def generate_job(rng: random.Random):
+    """One (job_id, job_data) record in the scraper's field format"""
+    skills = list(dict.fromkeys(rng.choices(SKILL_POOL, SKILL_WEIGHTS, k=rng.randint(2, 8))))
+    if rng.random() < 0.6:
+        low = rng.choice(HOURLY_RATES)
+        budget = f"Hourly: ${low}.00-${low + rng.choice([10, 20, 30])}.00"
+    else:
+        budget = f"Fixed-price: ${rng.choice(FIXED_PRICES):,}"
+    posted = EPOCH - timedelta(seconds=rng.uniform(0, HISTORY_DAYS * 86400))
+    job_id = f"~01{rng.getrandbits(72):018x}"
+    job_data = {
+        'title': f"{rng.choice(ROLES)} for {rng.choice(PROJECTS)}",
+        'description': ' '.join(rng.choices(WORDS, k=rng.randint(40, 200))).capitalize() + '.',
+        'job_url': f"https://www.upwork.com/jobs/{job_id}",
+        'budget': budget,
+        'duration': rng.choice(DURATIONS),
+        'experience_level': rng.choice(EXPERIENCE_LEVELS),
+        'skills': [skill.title() for skill in skills],
+        'posted_time': posted.isoformat(),
+        'client_rating': round(rng.uniform(3.5, 5.0), 1) if rng.random() < 0.8 else 'N/A',
+        'client_location': rng.choice(LOCATIONS),
+        'client_verified': rng.random() < 0.7,
+        'client_spent': f"${rng.choice([0, 1, 5, 10, 50, 100])}K+",
+        'payment_verified': rng.random() < 0.75,
+        'proposals': rng.randint(0, 50),
+        # Storage fields (not scraper output): when it was scraped, and whether still open
+        'scraped_at': min(EPOCH, posted + timedelta(minutes=rng.uniform(1, 600))).strftime('%Y-%m-%d %H:%M:%S'),
+        'is_active': rng.random() >= INACTIVE_FRACTION,
+    }
+    return job_id, job_data
+
+
+def generate_jobs(count: int, seed: int = 0):
+    """`count` records; the same seed always yields the same records"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield generate_job(rng)
+
+
+def database_dir(data_dir: str, rows: int, seed: int) -> str:
+    return os.path.join(data_dir, f"jobs_{rows}_seed{seed}_v{GENERATOR_VERSION}")
+
+
+def build_database(data_dir: str, rows: int, seed: int = 0) -> dict:
+    """Create (or reuse) a benchmark database of `rows` jobs and a profile.
+
+    The database is an upwork_assistant.db in its own directory, since the API
+    opens that file relative to the working directory. Returns the info
+    stored next to it, with build_seconds None when it was reused.
+    """
+    directory = database_dir(data_dir, rows, seed)
+    info_path = os.path.join(directory, 'bench_info.json')
+    if os.path.exists(info_path):
+        with open(info_path, encoding='utf-8') as f:
+            return dict(json.load(f), directory=directory, build_seconds=None)
+
+    os.makedirs(directory, exist_ok=True)
+    db_path = os.path.join(directory, 'upwork_assistant.db')
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)  # left by an interrupted build
+
+    started = time.perf_counter()
+    previous_dir = os.getcwd()
+    os.chdir(directory)
+    try:
+        from github_readmes import save_readmes
+        from main import JOB_INSERT_COLUMNS, get_db_connection, init_database, job_row
+
+        init_database()
+        conn = get_db_connection()
+        try:
+            # Same columns as scraped jobs, with the generated scraped_at and is_active
+            columns = JOB_INSERT_COLUMNS.split('VALUES')[0].strip()
+            insert = f"INSERT OR IGNORE INTO jobs {columns} VALUES ({', '.join(['?'] * (columns.count(',') + 1))})"
+            batch = []
+            for job_id, job_data in generate_jobs(rows, seed):
+                batch.append(job_row(job_data, PROFILE_SKILLS, job_id) + (job_data['scraped_at'], job_data['is_active']))
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    conn.executemany(insert, batch)
+                    conn.commit()
+                    batch = []
+            if batch:
+                conn.executemany(insert, batch)
+                conn.commit()
+
+            conn.execute("""
+                INSERT INTO profile (github_username, skills, rate_min, rate_max, score_threshold, scrape_frequency)
+                VALUES (?, ?, 25, 90, 0.6, '30min')
+            """, (PROFILE_GITHUB_USERNAME, json.dumps(PROFILE_SKILLS)))
+            rng = random.Random(seed)
+            save_readmes(conn, PROFILE_GITHUB_USERNAME, [
+                {
+                    'full_name': f"{PROFILE_GITHUB_USERNAME}/repo-{i}",
+                    'repo': f"repo-{i}",
+                    'readme_path': 'README.md',
+                    'pushed_at': (EPOCH - timedelta(days=i * 7)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'topics': rng.sample(SKILL_POOL, 3),
+                    'readme_text': ' '.join(rng.choices(WORDS + SKILL_POOL, k=400)),
+                }
+                for i in range(PROFILE_REPOS)
+            ])
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+    finally:
+        os.chdir(previous_dir)
+
+    info = {'rows': rows, 'seed': seed, 'generator_version': GENERATOR_VERSION}
+    with open(info_path, 'w', encoding='utf-8') as f:
+        json.dump(info, f, indent=2)
+    return dict(info, directory=directory, build_seconds=round(time.perf_counter() - started, 2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build deterministic synthetic job databases")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000], help="Database sizes to build")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Where benchmark databases are kept")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        info = build_database(args.data_dir, rows, args.seed)
+        state = f"built in {info['build_seconds']}s" if info['build_seconds'] is not None else "already built"
+        print(f"📦 {rows:>9} rows: {info['directory']} ({state})")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,52 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///upwork_assistant.db")
 
 # GitHub settings
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
+GITHUB_PERSIST_BATCH_SIZE = int(os.getenv("GITHUB_PERSIST_BATCH_SIZE", "20"))  # README results written per commit during a refresh
+GITHUB_SKILLS_IN_SEARCH_TERMS = int(os.getenv("GITHUB_SKILLS_IN_SEARCH_TERMS", "0"))  # top mined skills also searched automatically; never used for scoring
 
 # Upwork scraping settings
 SCRAPING_INTERVAL_MINUTES = int(os.getenv("SCRAPING_INTERVAL_MINUTES", "30"))
 MAX_JOBS_PER_SCRAPE = int(os.getenv("MAX_JOBS_PER_SCRAPE", "60"))
+# Browser sessions run in parallel, and the politeness limits per domain
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "2"))
+SCRAPE_PER_DOMAIN_LIMIT = int(os.getenv("SCRAPE_PER_DOMAIN_LIMIT", "2"))
+SCRAPE_DOMAIN_MIN_INTERVAL_SECONDS = float(os.getenv("SCRAPE_DOMAIN_MIN_INTERVAL_SECONDS", "5"))
+SCRAPE_INGEST_QUEUE_SIZE = int(os.getenv("SCRAPE_INGEST_QUEUE_SIZE", "100"))  # jobs buffered between browsers and ingest
+SCRAPE_INGEST_BATCH_SIZE = int(os.getenv("SCRAPE_INGEST_BATCH_SIZE", "10"))
+SCRAPE_INGEST_FLUSH_SECONDS = float(os.getenv("SCRAPE_INGEST_FLUSH_SECONDS", "1"))
+# Result pages followed per search term; paging stops early at a page of known jobs
+SCRAPE_MAX_PAGES = int(os.getenv("SCRAPE_MAX_PAGES", "5"))
+SCRAPE_CACHE_TTL_SECONDS = float(os.getenv("SCRAPE_CACHE_TTL_SECONDS", "600"))  # 0 disables the URL result cache
+SCRAPE_CACHE_STALE_SECONDS = float(os.getenv("SCRAPE_CACHE_STALE_SECONDS", "1800"))  # served past the TTL while a queued task refreshes it
+# Chrome request blocking profile: off, standard or aggressive
+BROWSER_BLOCKING_PROFILE = os.getenv("BROWSER_BLOCKING_PROFILE", "standard")
+# Reuse Chrome profiles and cookies between scrapes until the session is this old
+BROWSER_SESSION_MAX_AGE_HOURS = float(os.getenv("BROWSER_SESSION_MAX_AGE_HOURS", "12"))
+
+# Scrape worker settings (scrape_worker.py)
+# Scrapes hold a global lease, so workers beyond the first are failover standbys
+SCRAPE_WORKER_PROCESSES = int(os.getenv("SCRAPE_WORKER_PROCESSES", "1"))
+SCRAPE_TASK_LEASE_SECONDS = float(os.getenv("SCRAPE_TASK_LEASE_SECONDS", "120"))
+SCRAPE_TASK_TIMEOUT_SECONDS = float(os.getenv("SCRAPE_TASK_TIMEOUT_SECONDS", "1800"))
+SCRAPE_TASK_MAX_ATTEMPTS = int(os.getenv("SCRAPE_TASK_MAX_ATTEMPTS", "3"))
+SCRAPE_WORKER_POLL_SECONDS = float(os.getenv("SCRAPE_WORKER_POLL_SECONDS", "5"))
+
+# Cross-process leases: one active scrape, one scheduler across all processes
+SCRAPE_LOCK_TTL_SECONDS = float(os.getenv("SCRAPE_LOCK_TTL_SECONDS", "300"))
+SCHEDULER_LEASE_TTL_SECONDS = float(os.getenv("SCHEDULER_LEASE_TTL_SECONDS", "60"))
+
+# Automatic scraping: per-search-term scheduling (term_scheduler.py)
+SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", "60"))
+SCHEDULER_MAX_TERMS = int(os.getenv("SCHEDULER_MAX_TERMS", "6"))
+SCRAPE_HOURLY_BUDGET = int(os.getenv("SCRAPE_HOURLY_BUDGET", "12"))  # search-term scrapes per hour
+
+# Profiling settings (opt-in sampling profiler, output under PROFILING_DIR)
+PROFILING_DIR = os.getenv("PROFILING_DIR", "profiles")
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")  # requests sending it in the X-Profile-Token header are profiled; empty disables
+PROFILING_TASKS = [name.strip() for name in os.getenv("PROFILING_TASKS", "").split(",") if name.strip()]  # background tasks to profile, e.g. "recalculate_job_scores"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "1.0"))  # fraction of eligible requests/tasks actually profiled
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_KEEP = int(os.getenv("PROFILING_KEEP", "200"))  # newest profiles kept
 
 # Scoring settings
 DEFAULT_SCORE_THRESHOLD = float(os.getenv("DEFAULT_SCORE_THRESHOLD", "0.6"))
@@ -25,6 +67,8 @@ CORS_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
 # File paths
 PROFILE_DATA_DIR = "profile/data"
 SCRAPPER_DATA_DIR = "scrapper/data"
+JOB_IMPORT_DIR = os.getenv("JOB_IMPORT_DIR", SCRAPPER_DATA_DIR)  # POST /api/jobs/import only reads files under it
+GITHUB_HTTP_CACHE_DIR = os.getenv("GITHUB_HTTP_CACHE_DIR", os.path.join(PROFILE_DATA_DIR, "http_cache"))  # ETag cache for GitHub API requests
 
 # Default skills for matching
 DEFAULT_SKILLS = [
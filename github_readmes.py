@@ -0,0 +1,158 @@
+"""
+GitHub README Storage
+One zlib-compressed row per repo, so profile reads and saves never touch
+README texts; /api/profile gets a metadata summary and the texts are served
+page by page from /api/profile/github/readmes
+"""
+
+import json
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+# Repo metadata kept alongside each README (keys of fetch_all_readmes entries)
+METADATA_COLUMNS = (
+    'repo', 'readme_path', 'readme_sha', 'pushed_at', 'size', 'html_url', 'description',
+    'fork', 'archived', 'topics', 'default_branch', 'fetched_at', 'error',
+)
+RECENT_REPOS_IN_SUMMARY = 10
+
+
+def init_readme_table(cursor):
+    """Create the README table and move a legacy profile.github_data blob into it
+    (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS github_readmes (
+            username TEXT NOT NULL,  -- lowercased GitHub username
+            full_name TEXT NOT NULL,
+            repo TEXT,
+            readme_path TEXT,
+            readme_sha TEXT,
+            pushed_at TEXT,
+            size INTEGER DEFAULT 0,  -- decoded README bytes
+            html_url TEXT,
+            description TEXT,
+            fork INTEGER,
+            archived INTEGER,
+            topics TEXT,  -- JSON array
+            default_branch TEXT,
+            fetched_at TEXT,
+            error TEXT,
+            readme_zlib BLOB,  -- zlib-compressed UTF-8 README text
+            PRIMARY KEY (username, full_name)
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_github_readmes_pushed ON github_readmes(username, pushed_at DESC)")
+
+    cursor.execute("SELECT github_username, github_data FROM profile WHERE github_data IS NOT NULL")
+    for username, github_data in cursor.fetchall():
+        try:
+            entries = json.loads(github_data)
+        except ValueError:
+            entries = []
+        if username and isinstance(entries, list):
+            _upsert(cursor, username, entries)
+    cursor.execute("UPDATE profile SET github_data = NULL WHERE github_data IS NOT NULL")
+
+
+def _row(username: str, entry: Dict) -> tuple:
+    text = (entry.get('readme_text') or '').encode('utf-8')
+    values = dict(entry, size=entry.get('size') or len(text), topics=json.dumps(entry.get('topics') or []))
+    return (
+        username.lower(), entry['full_name'],
+        *(values.get(column) for column in METADATA_COLUMNS),
+        zlib.compress(text) if text else None,
+    )
+
+
+def _upsert(cursor, username: str, entries: Iterable[Dict]):
+    cursor.executemany(f"""
+        INSERT OR REPLACE INTO github_readmes (username, full_name, {', '.join(METADATA_COLUMNS)}, readme_zlib)
+        VALUES (?, ?, {', '.join('?' * len(METADATA_COLUMNS))}, ?)
+    """, [_row(username, entry) for entry in entries if entry.get('full_name')])
+
+
+def _metadata(row) -> Dict:
+    entry = dict(zip(('full_name',) + METADATA_COLUMNS, row))
+    entry['topics'] = json.loads(entry['topics']) if entry['topics'] else []
+    for column in ('fork', 'archived'):
+        entry[column] = bool(entry[column]) if entry[column] is not None else None
+    return entry
+
+
+def load_manifest(conn, username: str) -> List[Dict]:
+    """Stored entries without README texts, as `previous` for an incremental refresh"""
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT full_name, {', '.join(METADATA_COLUMNS)} FROM github_readmes
+        WHERE username = ?
+    """, (username.lower(),))
+    return [_metadata(row) for row in cursor.fetchall()]
+
+
+def save_readmes(conn, username: str, entries: List[Dict]):
+    """Write a batch of freshly fetched entries"""
+    _upsert(conn.cursor(), username, entries)
+    conn.commit()
+
+
+def prune_readmes(conn, username: str, keep: Iterable[str]) -> int:
+    """Delete stored repos of username whose full_name is not in keep"""
+    keep = set(keep)
+    cursor = conn.cursor()
+    cursor.execute("SELECT full_name FROM github_readmes WHERE username = ?", (username.lower(),))
+    gone = [(username.lower(), row[0]) for row in cursor.fetchall() if row[0] not in keep]
+    cursor.executemany("DELETE FROM github_readmes WHERE username = ? AND full_name = ?", gone)
+    conn.commit()
+    return len(gone)
+
+
+def readme_summary(conn, username: Optional[str]) -> Optional[Dict]:
+    """Counts, sizes and the most recently pushed repos, without README texts"""
+    if not username:
+        return None
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COUNT(*), COUNT(readme_zlib), COALESCE(SUM(size), 0), MAX(fetched_at)
+        FROM github_readmes WHERE username = ?
+    """, (username.lower(),))
+    repos, with_readme, total_bytes, last_fetched_at = cursor.fetchone()
+    if not repos:
+        return None
+    cursor.execute(f"""
+        SELECT full_name, {', '.join(METADATA_COLUMNS)} FROM github_readmes
+        WHERE username = ?
+        ORDER BY pushed_at DESC LIMIT ?
+    """, (username.lower(), RECENT_REPOS_IN_SUMMARY))
+    return {
+        "repos": repos,
+        "with_readme": with_readme,
+        "readme_bytes": total_bytes,
+        "last_fetched_at": last_fetched_at,
+        "recent_repos": [_metadata(row) for row in cursor.fetchall()],
+    }
+
+
+def list_readmes(conn, username: str, page: int = 1, page_size: int = 20, repo: Optional[str] = None) -> Dict:
+    """One page of stored READMEs with their texts, most recently pushed first"""
+    cursor = conn.cursor()
+    filters = "username = ?"
+    params = [username.lower()]
+    if repo:
+        filters += " AND repo = ?"
+        params.append(repo)
+
+    cursor.execute(f"SELECT COUNT(*) FROM github_readmes WHERE {filters}", params)
+    total = cursor.fetchone()[0]
+    cursor.execute(f"""
+        SELECT full_name, {', '.join(METADATA_COLUMNS)}, readme_zlib FROM github_readmes
+        WHERE {filters}
+        ORDER BY pushed_at DESC, full_name
+        LIMIT ? OFFSET ?
+    """, params + [page_size, (page - 1) * page_size])
+
+    readmes = []
+    for row in cursor.fetchall():
+        entry = _metadata(row[:-1])
+        entry['readme_text'] = zlib.decompress(row[-1]).decode('utf-8') if row[-1] else ''
+        readmes.append(entry)
+    return {"total": total, "page": page, "page_size": page_size, "readmes": readmes}
@@ -0,0 +1,213 @@
+"""
+Job Import
+Streams scraper dumps (CSV, JSON arrays, NDJSON job store segments) into the
+jobs table in constant memory
+
+Usage:
+    python job_import.py manual_upwork_extraction_20250101_120000.csv
+    python job_import.py scrapper/data/manual_upwork_extraction
+"""
+
+import argparse
+import ast
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SUPPORTED_EXTENSIONS = ('.csv', '.json', '.ndjson', '.jsonl')
+_JSON_SEPARATORS = re.compile(r'[\s,]*')
+_JSON_WHITESPACE = re.compile(r'\s*')
+_JSON_NUMBER_TAIL = re.compile(r'[\d.eE+-]*')
+
+
+def iter_json_array(f, chunk_size: int = 1 << 16) -> Iterator:
+    """Yield the items of a top-level JSON array without loading the file"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    in_array = False
+    while True:
+        pos = (_JSON_SEPARATORS if in_array else _JSON_WHITESPACE).match(buffer, pos).end()
+        if pos < len(buffer):
+            if not in_array:
+                if buffer[pos] != '[':
+                    raise ValueError("expected a JSON array")
+                in_array = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                after = _JSON_WHITESPACE.match(buffer, end).end()
+                if after < len(buffer) and buffer[after] in ',]':
+                    yield item
+                    pos = after
+                    continue
+                # The next chunk holds the separator, or the rest of a number
+                # cut after its digits, '.' or exponent
+                if eof or not (after == len(buffer) or _JSON_NUMBER_TAIL.fullmatch(buffer, end)):
+                    raise ValueError("unterminated JSON array" if after == len(buffer)
+                                     else "expected ',' or ']' after an array item")
+        elif eof:
+            raise ValueError("unterminated JSON array" if in_array else "expected a JSON array")
+        # Keep only the unread tail and read the next chunk
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def iter_file_records(path: str) -> Iterator[Dict]:
+    """Yield raw job dicts from one dump file"""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if extension == '.csv':
+            yield from csv.DictReader(f)
+        elif extension == '.json':
+            yield from iter_json_array(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def is_within(path: str, root: str) -> bool:
+    """True if path, with symlinks resolved, is root or inside it"""
+    root = os.path.realpath(root)
+    return os.path.commonpath([os.path.realpath(path), root]) == root
+
+
+def resolve_import_paths(paths: List[str], root: str) -> List[str]:
+    """Resolve paths relative to the import directory root.
+
+    Raises ValueError for any path that resolves outside root, so callers
+    never open (or reveal the existence of) files elsewhere.
+    """
+    resolved = []
+    for path in paths:
+        full_path = os.path.realpath(os.path.join(root, path))
+        if not is_within(full_path, root):
+            raise ValueError(f"{path} is outside the import directory")
+        resolved.append(full_path)
+    return resolved
+
+
+def iter_dump_files(paths: List[str], root: Optional[str] = None) -> Iterator[str]:
+    """Expand directories (e.g. a job store) into their dump files, sorted.
+
+    With a root, files that resolve outside it (through symlinks) are skipped.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, files in sorted(os.walk(path)):
+                for name in sorted(files):
+                    file_path = os.path.join(directory, name)
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS) and (root is None or is_within(file_path, root)):
+                        yield file_path
+        else:
+            yield path
+
+
+def _parse_list(value):
+    # CSV dumps hold skills as the repr of a Python list
+    if isinstance(value, str) and value.startswith('['):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value.strip('[]')
+    return value
+
+
+def normalize_record(record: Dict) -> Optional[Tuple[str, Dict]]:
+    """(job_id, job_data) for a dump record, or None if it is not a usable job.
+
+    Records without an Upwork job ID get an ID derived from title and URL, so
+    importing the same dump twice does not duplicate them.
+    """
+    if not isinstance(record, dict) or record.get('known') in (True, 'True', 'true'):
+        return None
+    title = (record.get('title') or '').strip()
+    if not title or title == 'N/A':
+        return None
+
+    job = {key: value for key, value in record.items() if value not in ('', None)}
+    job['title'] = title
+    if 'skills' in job:
+        job['skills'] = _parse_list(job['skills'])
+    try:
+        job['proposals'] = int(job.get('proposals', 0))
+    except (TypeError, ValueError):
+        job['proposals'] = 0
+
+    job_id = job.get('id')
+    if not job_id:
+        digest = hashlib.sha1(f"{title.lower()}|{job.get('job_url', '')}".encode('utf-8')).hexdigest()[:16]
+        job_id = f"import_{digest}"
+    return job_id, job
+
+
+def iter_import_records(paths: List[str], errors: Optional[List[str]] = None,
+                        root: Optional[str] = None) -> Iterator[Tuple[str, Dict]]:
+    """Normalized (job_id, job_data) records from every dump under paths.
+
+    Files that fail to parse are skipped and listed in errors. With a root,
+    files outside it are never read (see iter_dump_files) and errors name
+    files relative to it, without server paths.
+    """
+    for path in iter_dump_files(paths, root):
+        try:
+            for record in iter_file_records(path):
+                normalized = normalize_record(record)
+                if normalized:
+                    yield normalized
+        except (OSError, ValueError, csv.Error) as e:
+            if errors is None:
+                raise
+            if root is None:
+                errors.append(f"{path}: {e}")
+            else:
+                reason = e.strerror if isinstance(e, OSError) else e
+                errors.append(f"{os.path.relpath(path, os.path.realpath(root))}: {reason}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import scraper CSV/JSON/NDJSON dumps into the jobs database")
+    parser.add_argument("paths", nargs="+", help="Dump files or directories (e.g. a job store)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per transaction")
+    args = parser.parse_args()
+
+    from main import bulk_import_jobs, get_db_connection, get_profile_skills, init_database
+
+    missing = [path for path in args.paths if not os.path.exists(path)]
+    if missing:
+        print(f"❌ Not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    init_database()
+    conn = get_db_connection()
+    errors = []
+    try:
+        report = bulk_import_jobs(conn, iter_import_records(args.paths, errors), get_profile_skills(conn), args.batch_size)
+    finally:
+        conn.close()
+
+    print(f"📥 Read {report['records_read']} jobs in {report['seconds']}s ({report['records_per_second']} jobs/s)")
+    print(f"   Inserted: {report['jobs_inserted']}")
+    print(f"   Already in database: {report['duplicates_skipped']}")
+    print(f"   Invalid: {report['invalid_skipped']}")
+    for error in errors:
+        print(f"   ⚠️ {error}")
+
+
+if __name__ == "__main__":
+    main()
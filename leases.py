@@ -0,0 +1,84 @@
+"""
+Database Leases
+Named, expiring locks in SQLite shared by every API and worker process,
+used for the single active scrape and for scheduler leader election
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+_INSTANCE_TAG = uuid.uuid4().hex[:6]
+
+
+def process_holder_id() -> str:
+    """Lease holder ID for this process (evaluated per call, so forks differ)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{_INSTANCE_TAG}"
+
+
+def init_lease_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS leases (
+            name TEXT PRIMARY KEY,
+            holder TEXT NOT NULL,
+            acquired_at REAL,
+            expires_at REAL NOT NULL
+        )
+    """)
+
+
+def acquire_lease(conn, name: str, ttl_seconds: float, holder: Optional[str] = None) -> bool:
+    """Take or renew the lease. Succeeds if it is free, expired or already ours."""
+    holder = holder or process_holder_id()
+    now = time.time()
+    cursor = conn.cursor()
+    # A single upsert is atomic in SQLite, so two processes cannot both win
+    cursor.execute("""
+        INSERT INTO leases (name, holder, acquired_at, expires_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            holder = excluded.holder,
+            acquired_at = CASE WHEN leases.holder = excluded.holder THEN leases.acquired_at ELSE excluded.acquired_at END,
+            expires_at = excluded.expires_at
+        WHERE leases.holder = excluded.holder OR leases.expires_at < ?
+    """, (name, holder, now, now + ttl_seconds, now))
+    conn.commit()
+    return cursor.rowcount == 1
+
+
+def release_lease(conn, name: str, holder: Optional[str] = None):
+    holder = holder or process_holder_id()
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder))
+    conn.commit()
+
+
+def get_lease(conn, name: str) -> Optional[Dict]:
+    cursor = conn.cursor()
+    cursor.execute("SELECT holder, acquired_at, expires_at FROM leases WHERE name = ?", (name,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    now = time.time()
+    return {
+        "name": name,
+        "holder": row[0],
+        "held_for_seconds": round(now - row[1]) if row[1] else None,
+        "expires_in_seconds": round(row[2] - now, 1),
+        "active": row[2] >= now,
+    }
+
+
+async def keep_lease_alive(connect: Callable, name: str, ttl_seconds: float, holder: Optional[str] = None):
+    """Renew a held lease every ttl/3 until cancelled; returns if it is lost"""
+    conn = connect()
+    try:
+        while True:
+            await asyncio.sleep(ttl_seconds / 3)
+            if not acquire_lease(conn, name, ttl_seconds, holder):
+                return
+    finally:
+        conn.close()
@@ -5,7 +5,7 @@ FastAPI server providing endpoints for job scraping, profile management, and job
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import json
@@ -23,13 +23,32 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import *
-from profile.github_scrapper import fetch_all_readmes
+from profile.async_github import AsyncGitHubReadmeExtractor
+from skill_index import get_skill_index, init_skill_index_table, merge_skills, suggest_skills
+from github_readmes import (
+    init_readme_table, list_readmes, load_manifest, prune_readmes, readme_summary, save_readmes,
+)
+from profile.http_cache import HttpCache
 
 
-from scrapper.upwork_job_scrapper import manual_upwork_viewer
+from scrapper.upwork_job_scrapper import extract_job_id, manual_upwork_viewer
+from scrapper.parallel_scraper import JobStream, scrape_urls
+from scrapper.telemetry import StageTimer
+from scrapper.browser_session import SessionStore
+from scrape_queue import enqueue_task, has_pending_task, init_queue_tables, pending_search_terms, queue_status
+from term_scheduler import due_terms, init_term_tables, postpone_term, record_term_result, runs_in_last_hour, term_schedule
+from scrape_cache import cache_stats, init_cache_table, lookup_cached_result, store_result
+from job_import import iter_import_records, resolve_import_paths
+from scrape_checkpoints import complete_url, incomplete_urls, ingest_totals, init_checkpoint_table, run_totals, start_run
+from scrape_metrics import STAGES, init_metrics_table, record_stage_timings, stage_metrics
+from leases import acquire_lease, get_lease, init_lease_table, keep_lease_alive, process_holder_id, release_lease
+import metrics
+from metrics import MetricsMiddleware, TimedConnection, monitor_event_loop_lag
+from profiling import Profiling, ProfilingMiddleware
 
-# Global variable to track scraping status
-_scraping_in_progress = False
+# Lease names shared by all API and worker processes
+SCRAPE_LOCK_NAME = "scrape"
+SCHEDULER_LEASE_NAME = "scheduler"
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -51,6 +70,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency per route for /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Opt-in profiling of requests sending PROFILING_TOKEN and of PROFILING_TASKS
+profiling = Profiling(
+    PROFILING_DIR, os.path.dirname(os.path.abspath(__file__)), token=PROFILING_TOKEN, tasks=PROFILING_TASKS,
+    sample_rate=PROFILING_SAMPLE_RATE, interval=PROFILING_INTERVAL_MS / 1000, keep=PROFILING_KEEP,
+)
+app.add_middleware(ProfilingMiddleware, profiling=profiling)
+
 # Pydantic models
 class ProfileConfig(BaseModel):
     github_username: Optional[str] = None
@@ -71,12 +100,17 @@ class JobFilter(BaseModel):
     sort_by: str = "time"  # "time" or "score"
     skills_filter: Optional[List[str]] = None
 
+class JobImportRequest(BaseModel):
+    paths: List[str]  # CSV/JSON/NDJSON dump files or directories under JOB_IMPORT_DIR
+    batch_size: int = 5000
+
 class ScrapingConfig(BaseModel):
     lower_rate: int = 0
     upper_rate: int = 100
     search_terms: Optional[List[str]] = ["Machine Learning", "n8n Automation", "Data Science"]
     max_jobs: int = MAX_JOBS_PER_SCRAPE
     auto_scrape: bool = False
+    use_cache: bool = True  # serve search URLs scraped within SCRAPE_CACHE_TTL_SECONDS from the cache
 
 # Database setup
 def init_database():
@@ -88,6 +122,9 @@ def init_database():
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    # WAL lets the API keep reading while scrape workers write
+    cursor.execute("PRAGMA journal_mode=WAL")
+    
     # Jobs table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS jobs (
@@ -105,7 +142,8 @@ def init_database():
             proposals INTEGER DEFAULT 0,
             above_threshold BOOLEAN DEFAULT FALSE,
             scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            is_active BOOLEAN DEFAULT TRUE
+            is_active BOOLEAN DEFAULT TRUE,
+            upwork_id TEXT  -- stable Upwork job ID from the URL, else id
         )
     """)
     
@@ -135,6 +173,19 @@ def init_database():
         print(f"⚠️ Migration note: {e}")
         # If migration fails, just continue - the table structure should be correct for new installs
     
+    # Add upwork_id, filled from the URL of existing rows: rows stored before
+    # IDs came from the URL have generated IDs (migration)
+    try:
+        cursor.execute("ALTER TABLE jobs ADD COLUMN upwork_id TEXT")
+        conn.create_function("extract_job_id", 1, extract_job_id, deterministic=True)
+        cursor.execute("UPDATE jobs SET upwork_id = COALESCE(extract_job_id(url), id)")
+        conn.commit()
+    except sqlite3.OperationalError:
+        # Column already exists
+        pass
+    # Scrapes look up each job card's ID here instead of loading every row
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_upwork_id ON jobs(upwork_id)")
+    
     # Profile table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS profile (
@@ -187,13 +238,48 @@ def init_database():
         )
     """)
     
+    # Link runs to queue tasks so an interrupted task resumes its run (migration)
+    for column_name, column_type in [("task_id", "INTEGER"), ("resumed", "INTEGER DEFAULT 0")]:
+        try:
+            cursor.execute(f"ALTER TABLE scraping_logs ADD COLUMN {column_name} {column_type}")
+            conn.commit()
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+    
+    # Per-URL progress of each scraping run
+    init_checkpoint_table(cursor)
+    
+    # Per-URL, per-stage timings of each scraping run
+    init_metrics_table(cursor)
+    
+    # Scrape task queue and worker registry
+    init_queue_tables(cursor)
+    
+    # Cross-process leases (scrape lock, scheduler leader)
+    init_lease_table(cursor)
+    
+    # Per-search-term yield and schedule
+    init_term_tables(cursor)
+    
+    # Extracted jobs per search URL
+    init_cache_table(cursor)
+    
+    # Compressed GitHub READMEs, one row per repo (migrates profile.github_data)
+    init_readme_table(cursor)
+    
+    # Skills mined from the READMEs, cached per corpus hash
+    init_skill_index_table(cursor)
+    
     conn.commit()
     conn.close()
 
 # Helper functions
 def get_db_connection():
     """Get database connection"""
-    return sqlite3.connect("upwork_assistant.db", check_same_thread=False)
+    # API and worker processes share the file, so wait on locks instead of failing
+    # TimedConnection records each statement's latency for /metrics
+    return sqlite3.connect("upwork_assistant.db", check_same_thread=False, timeout=30, factory=TimedConnection)
 
 def calculate_job_score(job_data: Dict, profile_skills: List[str]) -> float:
     """Calculate job relevance score based on profile skills"""
@@ -218,6 +304,34 @@ def calculate_job_score(job_data: Dict, profile_skills: List[str]) -> float:
     
     return min(score, 1.0)  # Cap at 1.0
 
+def get_profile_skills(conn) -> List[str]:
+    """Current profile skills used for scoring, or DEFAULT_SKILLS.
+
+    Only the skills the user typed; skills mined from GitHub are suggestions
+    and never change job scores.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT skills FROM profile ORDER BY updated_at DESC LIMIT 1")
+    result = cursor.fetchone()
+    return json.loads(result[0]) if result and result[0] else DEFAULT_SKILLS
+
+def get_search_terms(conn) -> List[str]:
+    """Profile skills for automatic search terms, best-evidenced first.
+
+    With a GitHub username, the typed skills are ranked by the skill index
+    mined from the user's READMEs and followed by its top
+    GITHUB_SKILLS_IN_SEARCH_TERMS skills. May rebuild the index, so async
+    callers run it in a thread.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT github_username FROM profile ORDER BY updated_at DESC LIMIT 1")
+    result = cursor.fetchone()
+    skills = get_profile_skills(conn)
+    if not result or not result[0]:
+        return skills
+    index = get_skill_index(conn, result[0], skills)
+    return merge_skills(skills, index["skills"], GITHUB_SKILLS_IN_SEARCH_TERMS)
+
 # API Endpoints
 
 @app.get("/")
@@ -333,6 +447,35 @@ async def get_jobs(
     finally:
         conn.close()
 
+@app.post("/api/jobs/import")
+def import_jobs(request: JobImportRequest):
+    """Stream scraper dumps into the jobs table, skipping jobs already stored.
+
+    Paths are relative to JOB_IMPORT_DIR; anything resolving outside it is
+    rejected before a file is opened.
+    """
+    try:
+        paths = resolve_import_paths(request.paths, JOB_IMPORT_DIR)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    missing = [path for path, full_path in zip(request.paths, paths) if not os.path.exists(full_path)]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Not found: {', '.join(missing)}")
+    
+    conn = get_db_connection()
+    errors = []
+    try:
+        report = bulk_import_jobs(
+            conn, iter_import_records(paths, errors, JOB_IMPORT_DIR), get_profile_skills(conn), request.batch_size
+        )
+        report["file_errors"] = errors
+        return report
+    except Exception as e:
+        logger.error(f"Error importing jobs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        conn.close()
+
 @app.get("/api/profile")
 async def get_profile():
     """Get current profile configuration"""
@@ -342,7 +485,7 @@ async def get_profile():
     try:
         cursor.execute("""
             SELECT github_username, upwork_profile_url, skills, rate_min, rate_max, 
-                   score_threshold, scrape_frequency, github_data, email_address, 
+                   score_threshold, scrape_frequency, email_address, 
                    whatsapp_number, notify_all_jobs, notify_above_threshold
             FROM profile 
             ORDER BY updated_at DESC 
@@ -359,11 +502,11 @@ async def get_profile():
                 "rate_max": row[4] or DEFAULT_RATE_MAX,
                 "score_threshold": row[5] or DEFAULT_SCORE_THRESHOLD,
                 "scrape_frequency": row[6] or "30min",
-                "github_data": json.loads(row[7]) if row[7] else None,
-                "email_address": row[8],
-                "whatsapp_number": row[9],
-                "notify_all_jobs": bool(row[10]) if row[10] is not None else False,
-                "notify_above_threshold": bool(row[11]) if row[11] is not None else True
+                "github_data": readme_summary(conn, row[0]),
+                "email_address": row[7],
+                "whatsapp_number": row[8],
+                "notify_all_jobs": bool(row[9]) if row[9] is not None else False,
+                "notify_above_threshold": bool(row[10]) if row[10] is not None else True
             }
         else:
             # Return default profile
@@ -388,6 +531,70 @@ async def get_profile():
     finally:
         conn.close()
 
+@app.get("/api/profile/github/readmes")
+async def get_github_readmes(page: int = 1, page_size: int = 20, repo: Optional[str] = None):
+    """Stored GitHub README texts of the profile's user, paginated"""
+    page = max(1, page)
+    page_size = max(1, min(page_size, 100))
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("SELECT github_username FROM profile ORDER BY updated_at DESC LIMIT 1")
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return {"total": 0, "page": page, "page_size": page_size, "readmes": []}
+        return list_readmes(conn, row[0], page, page_size, repo)
+    
+    except Exception as e:
+        logger.error(f"Error fetching GitHub READMEs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        conn.close()
+
+@app.get("/api/profile/github/skills")
+def get_github_skills():
+    """Skill index mined from the profile user's GitHub READMEs, topics and descriptions.
+
+    A sync endpoint, so rebuilding the index runs in the threadpool.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("SELECT skills, github_username FROM profile ORDER BY updated_at DESC LIMIT 1")
+        row = cursor.fetchone()
+        skills = json.loads(row[0]) if row and row[0] else DEFAULT_SKILLS
+        index = get_skill_index(conn, row[1] if row else None, skills)
+        return {
+            **index,
+            "profile_skills": skills,
+            "suggested_skills": suggest_skills(skills, index["skills"]),
+            "search_terms": merge_skills(skills, index["skills"], GITHUB_SKILLS_IN_SEARCH_TERMS),
+        }
+    
+    except Exception as e:
+        logger.error(f"Error building GitHub skill index: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        conn.close()
+
+@app.get("/api/profile/github/status")
+async def get_github_refresh_status():
+    """Progress and rate limit budget of the current or last GitHub refresh"""
+    status = getattr(app.state, "github_refresh_status", None)
+    if status is None:
+        return {"state": "idle"}
+    extractor = status.get("extractor")
+    progress = extractor.progress if extractor else {"total": 0, "done": 0, "unchanged": 0}
+    return {
+        **{key: value for key, value in status.items() if key != "extractor"},
+        "repos_done": progress["done"],
+        "repos_remaining": progress["total"] - progress["done"],
+        "repos_unchanged": progress["unchanged"],
+        "rate_limit": extractor.rate_limit_status() if extractor else None,
+    }
+
 @app.post("/api/profile")
 async def update_profile(profile: ProfileConfig, background_tasks: BackgroundTasks):
     """Update profile configuration"""
@@ -406,18 +613,13 @@ async def update_profile(profile: ProfileConfig, background_tasks: BackgroundTas
             existing_username = result[0] if result else None
             should_fetch_github = existing_username != profile.github_username
         
-        # If GitHub username provided and should fetch, schedule GitHub data fetch
-        github_data = None
-        if should_fetch_github:
-            background_tasks.add_task(fetch_github_data, profile.github_username)
-        
         # Insert or update profile
         cursor.execute("""
             INSERT OR REPLACE INTO profile 
             (id, github_username, upwork_profile_url, skills, rate_min, rate_max, 
-             score_threshold, scrape_frequency, github_data, email_address, whatsapp_number,
+             score_threshold, scrape_frequency, email_address, whatsapp_number,
              notify_all_jobs, notify_above_threshold, updated_at)
-            VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """, (
             profile.github_username,
             profile.upwork_profile_url,
@@ -426,7 +628,6 @@ async def update_profile(profile: ProfileConfig, background_tasks: BackgroundTas
             profile.rate_max,
             profile.score_threshold,
             profile.scrape_frequency,
-            json.dumps(github_data) if github_data else None,
             profile.email_address,
             profile.whatsapp_number,
             1 if profile.notify_all_jobs else 0,
@@ -435,8 +636,12 @@ async def update_profile(profile: ProfileConfig, background_tasks: BackgroundTas
         
         conn.commit()
         
+        # If GitHub username provided and should fetch, refresh GitHub data
+        if should_fetch_github:
+            start_github_refresh(profile.github_username)
+        
         # Recalculate job scores with new skills
-        background_tasks.add_task(recalculate_job_scores, profile.skills)
+        background_tasks.add_task(recalculate_job_scores, get_profile_skills(conn))
         
         return {"message": "Profile updated successfully"}
     
@@ -447,24 +652,28 @@ async def update_profile(profile: ProfileConfig, background_tasks: BackgroundTas
         conn.close()
 
 @app.post("/api/scrape/start")
-async def start_scraping(config: ScrapingConfig, background_tasks: BackgroundTasks):
-    """Start job scraping process"""
+async def start_scraping(config: ScrapingConfig):
+    """Queue a job scraping task for the scrape workers"""
+    conn = get_db_connection()
+    
     try:
-        background_tasks.add_task(scrape_jobs_background, config)
-        return {"message": "Scraping started", "status": "in_progress"}
+        task_id = enqueue_task(conn, config.dict(), source="manual", max_attempts=SCRAPE_TASK_MAX_ATTEMPTS)
+        return {"message": "Scraping queued", "status": "queued", "task_id": task_id}
     except Exception as e:
-        logger.error(f"Error starting scraping: {e}")
+        logger.error(f"Error queueing scraping: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        conn.close()
 
 @app.get("/api/scrape/status")
 async def get_scraping_status():
-    """Get latest scraping status"""
+    """Get latest scraping status, queue depth and worker state"""
     conn = get_db_connection()
     cursor = conn.cursor()
     
     try:
         cursor.execute("""
-            SELECT status, jobs_found, error_message, started_at, completed_at
+            SELECT status, jobs_found, error_message, started_at, completed_at, id, resumed
             FROM scraping_logs 
             ORDER BY started_at DESC 
             LIMIT 1
@@ -472,15 +681,25 @@ async def get_scraping_status():
         row = cursor.fetchone()
         
         if row:
-            return {
+            status = {
                 "status": row[0],
                 "jobs_found": row[1],
                 "error_message": row[2],
                 "started_at": row[3],
-                "completed_at": row[4]
+                "completed_at": row[4],
+                "times_resumed": row[6] or 0,
+                "urls": run_totals(conn, row[5])
             }
         else:
-            return {"status": "never_run"}
+            status = {"status": "never_run"}
+        
+        status.update(queue_status(conn, worker_timeout=SCRAPE_TASK_LEASE_SECONDS))
+        status["scrape_lock"] = get_lease(conn, SCRAPE_LOCK_NAME)
+        status["scheduler_leader"] = get_lease(conn, SCHEDULER_LEASE_NAME)
+        status["hourly_budget"] = {"used": runs_in_last_hour(conn), "limit": SCRAPE_HOURLY_BUDGET}
+        status["search_terms"] = term_schedule(conn)
+        status["url_cache"] = cache_stats(conn)
+        return status
     
     except Exception as e:
         logger.error(f"Error fetching scraping status: {e}")
@@ -488,6 +707,72 @@ async def get_scraping_status():
     finally:
         conn.close()
 
+@app.get("/api/scrape/metrics")
+async def get_scraping_metrics(hours: float = 24):
+    """Per-stage timing percentiles and jobs/sec over recent scrapes"""
+    conn = get_db_connection()
+    
+    try:
+        return stage_metrics(conn, hours)
+    except Exception as e:
+        logger.error(f"Error getting scraping metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        conn.close()
+
+@app.get("/metrics")
+def get_prometheus_metrics():
+    """Prometheus text exposition of request, query, scrape, scoring, GitHub and cache metrics"""
+    # A plain def runs in the threadpool, so the collectors' SQLite queries
+    # do not stall the event loop (and show up as its lag)
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+def collect_metrics():
+    """Refresh the /metrics gauges that are kept in the database or on app.state"""
+    conn = get_db_connection()
+    try:
+        summary = stage_metrics(conn, metrics.SCRAPE_WINDOW_HOURS)
+        ingested = ingest_totals(conn, metrics.SCRAPE_WINDOW_HOURS)
+        url_cache = cache_stats(conn)
+    finally:
+        conn.close()
+    
+    metrics.SCRAPE_URLS.set(summary["urls"])
+    stage_seconds = summary["stage_seconds_per_url"]
+    for stage in set(STAGES) | set(stage_seconds):
+        for quantile, key in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99")):
+            if stage in stage_seconds:
+                metrics.SCRAPE_STAGE_SECONDS.set(stage_seconds[stage][key], stage, quantile)
+            else:
+                # No URLs in the window: drop the series rather than report old values
+                metrics.SCRAPE_STAGE_SECONDS.remove(stage, quantile)
+    for source in ("browser", "cache"):
+        metrics.SCRAPE_JOBS_ADDED.set(ingested.get(source, {}).get("jobs_added") or 0, source)
+    
+    caches = {"scrape_url": url_cache}
+    if os.path.exists(os.path.join(GITHUB_HTTP_CACHE_DIR, "http_cache.db")):
+        http_cache = HttpCache(GITHUB_HTTP_CACHE_DIR)
+        try:
+            totals = http_cache.stats()["total"]
+        finally:
+            http_cache.close()
+        caches["github_http"] = {"hits": totals["revalidated"], "misses": totals["stored"] + totals["uncached"],
+                                 "hit_rate": totals["hit_rate"]}
+    for cache, stats in caches.items():
+        for result in ("hits", "stale_hits", "misses"):
+            if result in stats:
+                metrics.CACHE_LOOKUPS.set(stats[result], cache, result)
+        if stats["hit_rate"] is not None:
+            metrics.CACHE_HIT_RATIO.set(stats["hit_rate"], cache)
+    
+    refresh = getattr(app.state, "github_refresh_status", None)
+    if refresh and refresh.get("extractor") is not None:
+        for resource, bucket in refresh["extractor"].rate_limit_status().items():
+            if bucket["remaining"] is not None:
+                metrics.GITHUB_RATE_LIMIT_REMAINING.set(bucket["remaining"], resource)
+
+metrics.REGISTRY.add_collector(collect_metrics)
+
 @app.get("/api/stats")
 async def get_stats():
     """Get dashboard statistics"""
@@ -535,32 +820,80 @@ async def get_stats():
         conn.close()
 
 # Background tasks
+@profiling.task("fetch_github_data")
 async def fetch_github_data(username: str):
-    """Background task to fetch GitHub repository data"""
+    """Background task to fetch GitHub repository data.
+
+    Repos are persisted in batches as they complete, so progress is visible in
+    /api/profile/github/status and a late failure keeps what was fetched.
+    """
+    status = app.state.github_refresh_status = {
+        "state": "running",
+        "username": username,
+        "started_at": datetime.now().isoformat(),
+        "finished_at": None,
+        "error": None,
+    }
+    conn = get_db_connection()
+    http_cache = HttpCache(GITHUB_HTTP_CACHE_DIR)
+    extractor = None
     try:
         logger.info(f"Fetching GitHub data for user: {username}")
-        readmes = fetch_all_readmes(username, token=GITHUB_TOKEN)
+        extractor = AsyncGitHubReadmeExtractor(
+            username, token=GITHUB_TOKEN, wait_on_rate_limit=True, http_cache=http_cache,
+        )
+        status["extractor"] = extractor
 
-        logger.info(f"Fetched {len(readmes)}, {readmes} repositories for {username}")
-        
-        # Store GitHub data in profile
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE profile 
-            SET github_data = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = 1
-        """, (json.dumps(readmes),))
-        
-        conn.commit()
-        conn.close()
+        # The stored corpus is the manifest for an incremental refresh
+        batch = []
+        async for entry in extractor.aiter_fetch(load_manifest(conn, username)):
+            batch.append(entry)
+            if len(batch) >= GITHUB_PERSIST_BATCH_SIZE:
+                save_readmes(conn, username, batch)
+                batch = []
+        if batch:
+            save_readmes(conn, username, batch)
+
+        # Repos missing from a full listing were deleted or made private
+        pruned = 0
+        if extractor.plan["listing_complete"]:
+            pruned = prune_readmes(conn, username, [repo.get("full_name") for repo in extractor.plan["repos"]])
         
-        logger.info(f"Successfully fetched {len(readmes)} repositories for {username}")
+        # Changed READMEs change the mined skills; rebuild the index now, off
+        # the event loop, so later readers find it cached
+        if extractor.progress["done"] or pruned:
+            await asyncio.to_thread(get_skill_index, conn, username, get_profile_skills(conn))
+
+        status["state"] = "completed"
+        logger.info(f"GitHub HTTP cache: {http_cache.stats()['session']}")
+        logger.info(
+            f"Successfully fetched {extractor.progress['done']} changed repositories for {username} "
+            f"({extractor.progress['unchanged']} unchanged)"
+        )
     
+    except asyncio.CancelledError:
+        status["state"] = "cancelled"
+        logger.info(f"GitHub refresh for {username} cancelled")
+        raise
     except Exception as e:
+        status["state"] = "failed"
+        status["error"] = str(e)
         logger.error(f"Error fetching GitHub data for {username}: {e}")
+    finally:
+        status["finished_at"] = datetime.now().isoformat()
+        if extractor is not None:
+            metrics.GITHUB_API_REQUESTS.inc(extractor.requests_made)
+        http_cache.close()
+        conn.close()
 
+def start_github_refresh(username: str):
+    """Run fetch_github_data on the event loop, cancelling a refresh still in progress"""
+    running = getattr(app.state, "github_refresh", None)
+    if running is not None and not running.done():
+        running.cancel()
+    app.state.github_refresh = asyncio.create_task(fetch_github_data(username))
+
+@profiling.task("recalculate_job_scores")
 async def recalculate_job_scores(skills: List[str]):
     """Background task to recalculate job scores with new skills"""
     try:
@@ -576,6 +909,7 @@ async def recalculate_job_scores(skills: List[str]):
         jobs = cursor.fetchall()
         
         # Recalculate scores
+        started = time.perf_counter()
         for job in jobs:
             job_data = {
                 'skills': json.loads(job[3]) if job[3] else [],
@@ -590,6 +924,8 @@ async def recalculate_job_scores(skills: List[str]):
                 SET score = ?, above_threshold = ?
                 WHERE id = ?
             """, (new_score, above_threshold, job[0]))
+        metrics.JOBS_SCORED.inc(len(jobs), "rescore")
+        metrics.SCORING_SECONDS.inc(time.perf_counter() - started, "rescore")
         
         conn.commit()
         conn.close()
@@ -599,128 +935,350 @@ async def recalculate_job_scores(skills: List[str]):
     except Exception as e:
         logger.error(f"Error recalculating job scores: {e}")
 
-async def scrape_jobs_background(config: ScrapingConfig):
-    """Background task to scrape jobs"""
-    global _scraping_in_progress
+JOB_INSERT_COLUMNS = """
+    (id, title, description, score, posted_at, url, budget, duration, 
+     experience_level, skills, client_info, proposals, above_threshold, 
+     upwork_id, scraped_at, is_active)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, 1)
+"""
+
+def job_row(job_data: Dict, profile_skills: List[str], job_id: str) -> tuple:
+    """Normalize and score one scraped job into JOB_INSERT_COLUMNS order"""
+    # Extract and clean data
+    title = job_data.get('title', 'Untitled Job')
+    description = job_data.get('description', '')
+    job_url = job_data.get('job_url', job_data.get('url', ''))
+    budget = job_data.get('budget', '')
+    posted_time = job_data.get('posted_time', '')
     
-    # Check if scraping is already in progress
-    if _scraping_in_progress:
-        logger.info("Scraping already in progress, skipping...")
-        return
+    # If no posted time from scraper, use current time
+    if not posted_time:
+        posted_time = datetime.now().isoformat()
     
-    _scraping_in_progress = True
+    # Extract skills (might be in different formats)
+    job_skills = job_data.get('skills', [])
+    if isinstance(job_skills, str):
+        job_skills = [skill.strip() for skill in job_skills.split(',') if skill.strip()]
     
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    # Calculate score
+    score = calculate_job_score({'skills': job_skills, 'budget': budget}, profile_skills)
+    above_threshold = score >= DEFAULT_SCORE_THRESHOLD
+    
+    # Extract client info
+    client_info = {
+        'rating': job_data.get('client_rating', 'N/A'),
+        'location': job_data.get('client_location', 'N/A'),
+        'verified': job_data.get('client_verified', False),
+        'total_spent': job_data.get('client_spent', 'N/A'),
+        'payment_verified': job_data.get('payment_verified', False)
+    }
+    
+    return (
+        job_id,
+        title,
+        description,
+        score,
+        posted_time,
+        job_url,
+        budget,
+        job_data.get('duration', ''),
+        job_data.get('experience_level', ''),
+        json.dumps(job_skills),
+        json.dumps(client_info),
+        job_data.get('proposals', 0),
+        above_threshold,
+        extract_job_id(job_url) or job_id
+    )
+
+def ingest_scraped_jobs(cursor, scraped_jobs: List[Dict], profile_skills: List[str], id_offset: int = 0,
+                        timer: Optional[StageTimer] = None) -> int:
+    """Normalize, score and upsert scraped jobs, returning how many were written"""
+    timer = timer or StageTimer()
+    jobs_added = 0
+    for job_data in scraped_jobs:
+        # Generate unique ID if not present
+        job_id = job_data.get('id') or f"job_{datetime.now().timestamp()}_{id_offset + jobs_added}"
         
-        # Log scraping start
-        log_id = None
-        cursor.execute("""
-            INSERT INTO scraping_logs (status, started_at)
-            VALUES ('in_progress', CURRENT_TIMESTAMP)
-        """)
-        log_id = cursor.lastrowid
+        try:
+            with timer.stage('scoring'):
+                row = job_row(job_data, profile_skills, job_id)
+            with timer.stage('db_write'):
+                cursor.execute(f"INSERT OR REPLACE INTO jobs {JOB_INSERT_COLUMNS}", row)
+            jobs_added += 1
+        except Exception as e:
+            logger.error(f"Error inserting job {job_id}: {e}")
+            continue
+    
+    return jobs_added
+
+def bulk_import_jobs(conn, records, profile_skills: List[str], batch_size: int = 5000) -> Dict:
+    """Score and insert (job_id, job_data) records in batches of one transaction each.
+
+    Jobs whose ID is already stored are skipped rather than replaced, so an
+    import never overwrites the status of a live job.
+    """
+    cursor = conn.cursor()
+    started = time.perf_counter()
+    read = inserted = invalid = 0
+    scoring_seconds = 0.0
+    batch = []
+    
+    def flush():
+        nonlocal inserted
+        changes_before = conn.total_changes
+        cursor.executemany(f"INSERT OR IGNORE INTO jobs {JOB_INSERT_COLUMNS}", batch)
         conn.commit()
-        
-        logger.info("Starting job scraping...")
+        inserted += conn.total_changes - changes_before
+        batch.clear()
+    
+    for job_id, job_data in records:
+        read += 1
+        scoring_started = time.perf_counter()
+        try:
+            batch.append(job_row(job_data, profile_skills, job_id))
+            scoring_seconds += time.perf_counter() - scoring_started
+        except Exception as e:
+            invalid += 1
+            logger.warning(f"Skipping job {job_id}: {e}")
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    
+    seconds = time.perf_counter() - started
+    metrics.JOBS_IMPORTED.inc(inserted)
+    metrics.JOBS_SCORED.inc(read - invalid, "import")
+    metrics.SCORING_SECONDS.inc(scoring_seconds, "import")
+    return {
+        "records_read": read,
+        "jobs_inserted": inserted,
+        "duplicates_skipped": read - invalid - inserted,
+        "invalid_skipped": invalid,
+        "seconds": round(seconds, 2),
+        "records_per_second": round(read / seconds) if seconds > 0 else None,
+    }
+
+def search_url(search_term: str, config: ScrapingConfig) -> str:
+    """Upwork search URL of one search term within the config's rate range"""
+    search_query = "+" + search_term.replace(" ", "+")
+    return f"https://www.upwork.com/nx/search/jobs/?nbs=1&per_page=20&proposals=0-4,5-9,10-14&q={search_query}&hourly_rate={config.lower_rate}-{config.upper_rate}&sort=recency&t=0,1"
+
+class KnownJobIds:
+    """Set-like view of the Upwork job IDs stored in the jobs table.
+
+    Each `in` is one indexed lookup on its own connection (browser threads
+    check their cards concurrently), so a scrape never loads the table.
+    """
+
+    def __init__(self):
+        self._conn = get_db_connection()
+        self._lock = threading.Lock()
+        self._added = set()
+
+    def __contains__(self, job_id) -> bool:
+        if not job_id:
+            return False
+        if job_id in self._added:
+            return True
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM jobs WHERE upwork_id = ? LIMIT 1", (job_id,)).fetchone()
+        return row is not None
+
+    def add(self, job_id: str):
+        """Mark a job written by this run as known"""
+        self._added.add(job_id)
+
+    def close(self):
+        self._conn.close()
+
+@profiling.task("scrape_jobs_background")
+async def scrape_jobs_background(config: ScrapingConfig, task_id: Optional[int] = None):
+    """Background task to scrape jobs.
+
+    Returns False without scraping if another process holds the scrape lock.
+    With a queue task_id, an interrupted or failed run of the same task is
+    resumed from its incomplete URLs, and errors are raised so the worker
+    can retry the task.
+    """
+    # One active scrape across every API and worker process
+    lock_holder = f"{process_holder_id()}:{datetime.now().timestamp()}"
+    conn = get_db_connection()
+    if not acquire_lease(conn, SCRAPE_LOCK_NAME, SCRAPE_LOCK_TTL_SECONDS, lock_holder):
+        conn.close()
+        logger.info("Scraping already in progress, skipping...")
+        return False
+    lock_renewal = asyncio.create_task(
+        keep_lease_alive(get_db_connection, SCRAPE_LOCK_NAME, SCRAPE_LOCK_TTL_SECONDS, lock_holder)
+    )
+    
+    log_id = None
+    known_ids = None
+    try:
+        cursor = conn.cursor()
         
         # Use the actual upwork_job_scrapper module
         urls = [f"https://www.upwork.com/nx/search/jobs/?nbs=1&q=machine%20learning"]
 
         if config.search_terms:
             urls = []
+            url_terms = {}
             for search_term in config.search_terms:
-                # Use first search term or combine them
-                search_query = "+" + search_term.replace(" ", "+")
-                url = f"https://www.upwork.com/nx/search/jobs/?nbs=1&per_page=20&proposals=0-4,5-9,10-14&q={search_query}&hourly_rate={config.lower_rate}-{config.upper_rate}&sort=recency&t=0,1"
+                url = search_url(search_term, config)
                 urls.append(url)
-
+                url_terms[url] = search_term
+            
+            # Log scraping start with a checkpoint per URL, or pick up the
+            # incomplete URLs of this task's interrupted run
+            log_id, resumed = start_run(conn, url_terms, task_id)
+            urls = incomplete_urls(conn, log_id)
+            if resumed:
+                logger.info(f"Resuming scraping run {log_id}: {len(urls)} of {len(url_terms)} URLs left")
+            else:
+                logger.info("Starting job scraping...")
             
             # Get current profile skills for scoring
-            cursor.execute("SELECT skills FROM profile ORDER BY updated_at DESC LIMIT 1")
+            profile_skills = get_profile_skills(conn)
+            cursor.execute("SELECT scrape_frequency FROM profile ORDER BY updated_at DESC LIMIT 1")
             profile_result = cursor.fetchone()
-            profile_skills = json.loads(profile_result[0]) if profile_result and profile_result[0] else DEFAULT_SKILLS
-            scraped_jobs = []
+            # Per-term intervals scale from the profile's scrape frequency
+            base_interval = get_scrape_interval_minutes(profile_result[0] if profile_result else "30min") * 60
+            
+            # Stable job IDs already stored, so paging can stop at known jobs
+            known_ids = KnownJobIds()
+            
+            # Totals include URLs finished by earlier attempts of this run
+            previous = run_totals(conn, log_id)
+            jobs_added = 0
+            jobs_scraped = previous["jobs_found"]
+            browser_session = SessionStore(max_age_hours=BROWSER_SESSION_MAX_AGE_HOURS)
             
-            # Use asyncio to run blocking Selenium operations in a thread pool
-            loop = asyncio.get_event_loop()
+            # Browser threads stream each new job into a bounded queue as its
+            # card is extracted; the loop below scores and writes them in
+            # micro-batches while the browsers keep scraping. Items are
+            # (url, job), and (url, None) once a URL is finished.
+            job_stream = JobStream(SCRAPE_INGEST_QUEUE_SIZE, asyncio.get_running_loop())
+            url_results = {}
+            url_timers = {url: StageTimer() for url in urls}
+            
+            # Recently scraped URLs are served from the cache; stale entries
+            # are served too, and their terms are refreshed by a separate
+            # queued task so this run does not wait on their browsers
+            cached_items = []
+            urls_to_scrape = []
+            stale_terms = []
+            use_cache = config.use_cache and SCRAPE_CACHE_TTL_SECONDS > 0
             for url in urls:
-                logger.info(f"Scraping jobs for skill: {url.split('&q=')[-1].split('&')[0]}")
-                try:
-                    # Run the blocking scraper in a separate thread
-                    scraped_results = await loop.run_in_executor(
-                        None,  # Use default ThreadPoolExecutor
-                        manual_upwork_viewer, 
-                        url
-                    )
-                    scraped_jobs.extend(scraped_results)
-                except Exception as e:
-                    logger.error(f"Error scraping URL {url}: {e}")
+                cached = None
+                if use_cache:
+                    cached = lookup_cached_result(conn, url, SCRAPE_CACHE_TTL_SECONDS, SCRAPE_CACHE_STALE_SECONDS)
+                if cached:
+                    cached_items.extend((url, job) for job in cached['jobs'] if not job.get('known'))
+                    jobs_scraped += len(cached['jobs'])
+                    logger.info(f"Cache {'hit' if cached['fresh'] else 'stale hit'} for skill: {url_terms[url]} (scraped {cached['age_seconds']:.0f}s ago)")
+                if not cached:
+                    urls_to_scrape.append(url)
                     continue
+                if cached['fresh']:
+                    # Not due again before the cached result expires
+                    postpone_term(conn, url_terms[url], time.time() + SCRAPE_CACHE_TTL_SECONDS - cached['age_seconds'])
+                else:
+                    stale_terms.append(url_terms[url])
+                url_results[url] = {'status': 'done', 'source': 'cache', 'jobs_found': len(cached['jobs'])}
+                cached_items.append((url, None))
             
-            jobs_added = 0
-            if scraped_jobs and len(scraped_jobs) > 0:
-                logger.info(f"Successfully scraped {len(scraped_jobs)} jobs from Upwork")
-                for job_data in scraped_jobs[:config.max_jobs]:  # Limit to max_jobs
-                    # Generate unique ID if not present
-                    job_id = job_data.get('id') or f"job_{datetime.now().timestamp()}_{jobs_added}"
-                    
-                    # Extract and clean data
-                    title = job_data.get('title', 'Untitled Job')
-                    description = job_data.get('description', '')
-                    job_url = job_data.get('job_url', job_data.get('url', ''))
-                    budget = job_data.get('budget', '')
-                    posted_time = job_data.get('posted_time', '')
-                    
-                    # If no posted time from scraper, use current time
-                    if not posted_time:
-                        posted_time = datetime.now().isoformat()
-                    
-                    # Extract skills (might be in different formats)
-                    job_skills = job_data.get('skills', [])
-                    if isinstance(job_skills, str):
-                        job_skills = [skill.strip() for skill in job_skills.split(',') if skill.strip()]
-                    
-                    # Calculate score
-                    score = calculate_job_score({'skills': job_skills, 'budget': budget}, profile_skills)
-                    above_threshold = score >= DEFAULT_SCORE_THRESHOLD
-                    
-                    # Extract client info
-                    client_info = {
-                        'rating': job_data.get('client_rating', 'N/A'),
-                        'location': job_data.get('client_location', 'N/A'),
-                        'verified': job_data.get('client_verified', False),
-                        'total_spent': job_data.get('client_spent', 'N/A'),
-                        'payment_verified': job_data.get('payment_verified', False)
-                    }
+            # Terms already in a queued or running refresh are not queued again
+            if stale_terms:
+                refreshing = pending_search_terms(conn, source="refresh")
+                stale_terms = [term for term in dict.fromkeys(stale_terms) if term not in refreshing]
+            if stale_terms:
+                refresh = config.copy(update={'search_terms': stale_terms, 'use_cache': False})
+                refresh_task_id = enqueue_task(conn, refresh.dict(), source="refresh", max_attempts=SCRAPE_TASK_MAX_ATTEMPTS)
+                logger.info(f"Queued refresh task {refresh_task_id} for stale cache entries: {', '.join(stale_terms)}")
+            
+            async def scrape_all_urls():
+                nonlocal jobs_scraped
+                try:
+                    await job_stream.extend(cached_items)
+                    async for result in scrape_urls(
+                        urls_to_scrape,
+                        lambda url, slot, wait_turn: manual_upwork_viewer(
+                            url,
+                            known_ids=known_ids,
+                            max_pages=SCRAPE_MAX_PAGES,
+                            blocking_profile=BROWSER_BLOCKING_PROFILE,
+                            session=browser_session,
+                            session_slot=slot,
+                            on_job=lambda job: job_stream.put((url, job)),
+                            stage_timer=url_timers[url],
+                            wait_turn=wait_turn,
+                        ),
+                        concurrency=SCRAPE_CONCURRENCY,
+                        per_domain=SCRAPE_PER_DOMAIN_LIMIT,
+                        min_interval=SCRAPE_DOMAIN_MIN_INTERVAL_SECONDS,
+                    ):
+                        url = result['url']
+                        search_term = url_terms[url]
+                        if result['error']:
+                            logger.error(f"Error scraping URL {url}: {result['error']}")
+                            record_term_result(conn, search_term, 0, failed=True, base_seconds=base_interval)
+                            url_results[url] = {'status': 'failed', 'source': 'browser', 'seconds': result['seconds'], 'error': result['error']}
+                        else:
+                            if result['jobs']:
+                                store_result(conn, url, result['jobs'], result['seconds'])
+                            
+                            # Known tiles come back as stubs; new postings were already streamed
+                            new_count = sum(1 for job in result['jobs'] if not job.get('known'))
+                            record_term_result(conn, search_term, new_count, failed=False, base_seconds=base_interval)
+                            jobs_scraped += len(result['jobs'])
+                            logger.info(f"Scraped {len(result['jobs'])} jobs ({new_count} new) for skill: {search_term} in {result['seconds']:.1f}s")
+                            url_results[url] = {'status': 'done', 'source': 'browser', 'jobs_found': len(result['jobs']), 'seconds': result['seconds']}
+                        
+                        # Queued behind the URL's jobs, so it is checkpointed only after they are written
+                        await job_stream.extend([(url, None)])
+                finally:
+                    await job_stream.finish()
+            
+            producer = asyncio.create_task(scrape_all_urls())
+            added_by_url = {}
+            try:
+                async for batch in job_stream.batches(SCRAPE_INGEST_BATCH_SIZE, SCRAPE_INGEST_FLUSH_SECONDS):
+                    batch_urls = set()
+                    for url, job in batch:
+                        # Other search terms may list the same postings
+                        if job is None or job.get('id') in known_ids:
+                            continue
+                        if jobs_added >= config.max_jobs:  # Limit to max_jobs
+                            continue
+                        added = ingest_scraped_jobs(cursor, [job], profile_skills, jobs_added, url_timers[url])
+                        jobs_added += added
+                        added_by_url[url] = added_by_url.get(url, 0) + added
+                        batch_urls.add(url)
+                        if job.get('id'):
+                            known_ids.add(job['id'])
+                    commit_started = time.perf_counter()
+                    conn.commit()
+                    # The batch commit is shared by the URLs that wrote to it
+                    for url in batch_urls:
+                        url_timers[url].add('db_write', (time.perf_counter() - commit_started) / len(batch_urls))
                     
-                    try:
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO jobs 
-                            (id, title, description, score, posted_at, url, budget, duration, 
-                             experience_level, skills, client_info, proposals, above_threshold, 
-                             scraped_at, is_active)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, 1)
-                        """, (
-                            job_id,
-                            title,
-                            description,
-                            score,
-                            posted_time,
-                            job_url,
-                            budget,
-                            job_data.get('duration', ''),
-                            job_data.get('experience_level', ''),
-                            json.dumps(job_skills),
-                            json.dumps(client_info),
-                            job_data.get('proposals', 0),
-                            above_threshold
-                        ))
-                        jobs_added += 1
-                    except Exception as e:
-                        logger.error(f"Error inserting job {job_id}: {e}")
-                        continue
+                    for url, job in batch:
+                        if job is None:
+                            result = url_results[url]
+                            complete_url(conn, log_id, url, jobs_added=added_by_url.get(url, 0), **result)
+                            if result['source'] == 'cache':
+                                # Near-zero seconds for the cached jobs would skew the browser percentiles
+                                continue
+                            stage_seconds = dict(url_timers[url].totals)
+                            stage_seconds['total'] = result.get('seconds') or sum(stage_seconds.values())
+                            record_stage_timings(conn, log_id, url, stage_seconds, result.get('jobs_found', 0))
+            finally:
+                # Never leave a browser thread blocked on a full queue
+                job_stream.close()
+            await producer
+            
+            if jobs_scraped > 0:
+                logger.info(f"Successfully scraped {jobs_scraped} jobs from Upwork")
             else:
                 logger.warning("No jobs scraped from Upwork - this could be due to:")
                 logger.warning("1. Page loading issues or anti-bot measures")
@@ -790,14 +1348,20 @@ async def scrape_jobs_background(config: ScrapingConfig):
                             continue
             
             # Update scraping log
+            totals = run_totals(conn, log_id)
             cursor.execute("""
                 UPDATE scraping_logs 
                 SET status = 'completed', jobs_found = ?, completed_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            """, (jobs_added, log_id))
+            """, (previous["jobs_added"] + jobs_added, log_id))
             
             conn.commit()
             logger.info(f"Successfully scraped {jobs_added} jobs")
+            
+            if totals["failed"]:
+                # Fails the task so the worker retries it; the retry resumes
+                # at the failed URLs only
+                raise RuntimeError(f"{totals['failed']} of {sum(totals[k] for k in ('pending', 'done', 'failed'))} URLs failed")
     
     except Exception as e:
         logger.error(f"Error during scraping: {e}")
@@ -808,12 +1372,18 @@ async def scrape_jobs_background(config: ScrapingConfig):
                 WHERE id = ?
             """, (str(e), log_id))
             conn.commit()
+        if task_id is not None:
+            raise
     
     finally:
-        if 'conn' in locals():
-            conn.close()
-        # Always reset the scraping flag
-        _scraping_in_progress = False
+        # Always release the scrape lock
+        lock_renewal.cancel()
+        release_lease(conn, SCRAPE_LOCK_NAME, lock_holder)
+        conn.close()
+        if known_ids is not None:
+            known_ids.close()
+    
+    return True
 
 # Automatic scraping scheduler
 def get_scrape_interval_minutes(frequency: str) -> int:
@@ -828,58 +1398,109 @@ def get_scrape_interval_minutes(frequency: str) -> int:
         return 30  # default
 
 async def automatic_scraper():
-    """Background task that runs automatic scraping based on user preferences"""
+    """Background task that queues search terms as they come due.
+
+    Each term has its own interval derived from the profile's scrape frequency
+    and the new jobs it yielded recently (see term_scheduler.py); all terms
+    share SCRAPE_HOURLY_BUDGET.
+    """
     logger.info("Starting automatic scraper...")
     
     while True:
         try:
-            # Get current profile scraping frequency
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT scrape_frequency FROM profile ORDER BY updated_at DESC LIMIT 1")
-            result = cursor.fetchone()
-            conn.close()
+            await asyncio.sleep(SCHEDULER_TICK_SECONDS)
             
-            frequency = result[0] if result else "30min"
-            interval_minutes = get_scrape_interval_minutes(frequency)
-            
-            logger.info(f"Next scraping in {interval_minutes} minutes (frequency: {frequency})")
-            
-            # Wait for the specified interval
-            await asyncio.sleep(interval_minutes * 60)
-            
-            # Run scraping
-            logger.info("Running automatic scraping...")
-            
-            # Get user's top skills for search terms
+            # Get user's skills as candidate search terms
             conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT skills FROM profile ORDER BY updated_at DESC LIMIT 1")
-            profile_result = cursor.fetchone()
-            conn.close()
-            
-            if profile_result and profile_result[0]:
-                profile_skills = json.loads(profile_result[0])
-                # Use top 3 skills as search terms
-                search_terms = profile_skills[:3]
-            
-            config = ScrapingConfig(max_jobs=20, auto_scrape=True, search_terms=search_terms)
-            await scrape_jobs_background(config)
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT skills FROM profile ORDER BY updated_at DESC LIMIT 1")
+                profile_result = cursor.fetchone()
+                # Ranked by the GitHub skill index, so the best-evidenced skills are searched first
+                profile_skills = await asyncio.to_thread(get_search_terms, conn) if profile_result and profile_result[0] else []
+                search_terms = profile_skills[:SCHEDULER_MAX_TERMS] or ScrapingConfig().search_terms
+                
+                # Scrapes run in scrape_worker.py; don't pile up auto tasks if workers are behind
+                if has_pending_task(conn, source="auto"):
+                    continue
+                
+                terms = due_terms(conn, search_terms, SCRAPE_HOURLY_BUDGET)
+                if not terms:
+                    continue
+                
+                config = ScrapingConfig(max_jobs=20, auto_scrape=True, search_terms=terms)
+                task_id = enqueue_task(conn, config.dict(), source="auto", max_attempts=SCRAPE_TASK_MAX_ATTEMPTS)
+                logger.info(f"Queued automatic scrape task {task_id} for: {', '.join(terms)}")
+            finally:
+                conn.close()
             
         except Exception as e:
             logger.error(f"Error in automatic scraper: {e}")
             # Wait 5 minutes before retrying on error
             await asyncio.sleep(300)
 
+async def scheduler_leader_election():
+    """Run automatic_scraper only while this process holds the scheduler lease.
+
+    Every API worker runs this loop; the lease makes exactly one of them the
+    leader, and a new leader takes over once a dead leader's lease expires.
+    """
+    conn = get_db_connection()
+    scheduler_task = None
+    
+    try:
+        while True:
+            try:
+                is_leader = acquire_lease(conn, SCHEDULER_LEASE_NAME, SCHEDULER_LEASE_TTL_SECONDS)
+            except sqlite3.Error as e:
+                logger.error(f"Scheduler lease check failed: {e}")
+                is_leader = False
+            
+            if is_leader and scheduler_task is None:
+                logger.info("Acquired scheduler leadership, starting automatic scraper")
+                scheduler_task = asyncio.create_task(automatic_scraper())
+            elif not is_leader and scheduler_task is not None:
+                logger.info("Lost scheduler leadership, stopping automatic scraper")
+                scheduler_task.cancel()
+                scheduler_task = None
+            
+            await asyncio.sleep(SCHEDULER_LEASE_TTL_SECONDS / 3)
+    finally:
+        if scheduler_task is not None:
+            scheduler_task.cancel()
+            release_lease(conn, SCHEDULER_LEASE_NAME)
+        conn.close()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database and start automatic scraper on startup"""
     init_database()
     logger.info("Upwork Assistant API started successfully")
     
-    # Start automatic scraper in background
-    asyncio.create_task(automatic_scraper())
+    # Start the scheduler election; only the leader runs the automatic scraper
+    app.state.scheduler_election = asyncio.create_task(scheduler_leader_election())
+    # Event loop lag for /metrics
+    app.state.loop_lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Step down as scheduler leader so another process can take over at once,
+    and cancel a GitHub refresh and the event loop lag monitor"""
+    election = getattr(app.state, "scheduler_election", None)
+    if election:
+        election.cancel()
+        try:
+            await election
+        except asyncio.CancelledError:
+            pass
+
+    github_refresh = getattr(app.state, "github_refresh", None)
+    if github_refresh is not None and not github_refresh.done():
+        github_refresh.cancel()
+    
+    loop_lag_monitor = getattr(app.state, "loop_lag_monitor", None)
+    if loop_lag_monitor is not None:
+        loop_lag_monitor.cancel()
 
 if __name__ == "__main__":
     import uvicorn
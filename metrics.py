@@ -0,0 +1,274 @@
+"""
+Prometheus Metrics
+A small in-process registry rendered in the Prometheus text format by
+/metrics: request latency per route (ASGI middleware), SQLite query latency
+per query name (connection factory), event loop lag, counters of events in
+this process, and gauges main.py refreshes from the database at collection
+time (so they cover the worker processes)
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+LOOP_LAG_INTERVAL_SECONDS = 0.5
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values: Dict[Tuple, object] = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._values[()] = self._zero()
+        (registry or REGISTRY).register(self)
+
+    def _zero(self):
+        return 0
+
+    def _key(self, label_values: Sequence) -> Tuple:
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"{self.name} takes labels {self.label_names}, got {label_values}")
+        return tuple(str(value) for value in label_values)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.extend(self._samples(label_values, value))
+        return lines
+
+    def _samples(self, label_values: Tuple, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, *label_values):
+        if amount < 0:
+            raise ValueError(f"{self.name} can only increase")
+        key = self._key(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def set(self, value: float, *label_values):
+        with self._lock:
+            self._values[self._key(label_values)] = value
+
+    def remove(self, *label_values):
+        with self._lock:
+            self._values.pop(self._key(label_values), None)
+
+
+class Histogram(_Metric):
+    """Histogram with fixed upper bounds; stores [per-bucket counts..., +Inf count, sum]"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = REQUEST_BUCKETS, registry=None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labels, registry)
+
+    def _zero(self):
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def observe(self, value: float, *label_values):
+        key = self._key(label_values)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = self._zero()
+            state[index] += 1
+            state[-1] += value
+
+    def _samples(self, label_values: Tuple, state) -> List[str]:
+        names = self.label_names + ('le',)
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), state[:-1]):
+            cumulative += count
+            labels = _format_labels(names, label_values + (_format_value(bound),))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.label_names, label_values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric):
+        self._metrics.append(metric)
+
+    def add_collector(self, collector: Callable[[], None]):
+        """Call collector before each render, to refresh metrics kept elsewhere"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                # Serve the other metrics rather than failing the scrape
+                logger.error(f"Metrics collector {collector.__name__} failed: {e}")
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+REQUEST_LATENCY = Histogram(
+    'upwork_http_request_duration_seconds', 'HTTP request latency by route template',
+    ('method', 'route'), REQUEST_BUCKETS,
+)
+REQUESTS = Counter('upwork_http_requests_total', 'HTTP requests by route template and status', ('method', 'route', 'status'))
+DB_QUERY_LATENCY = Histogram(
+    'upwork_db_query_duration_seconds', 'SQLite statement execution time by query name (operation_table)',
+    ('query',), QUERY_BUCKETS,
+)
+EVENT_LOOP_LAG = Histogram('upwork_event_loop_lag_seconds', 'Event loop scheduling delay', buckets=LOOP_LAG_BUCKETS)
+
+# Counted in this process when the event happens
+JOBS_IMPORTED = Counter('upwork_jobs_imported_total', 'Jobs inserted by imports in this process')
+JOBS_SCORED = Counter('upwork_jobs_scored_total', 'Jobs scored in this process, by path (import, rescore)', ('path',))
+SCORING_SECONDS = Counter('upwork_scoring_seconds_total', 'Seconds spent scoring jobs in this process, by path', ('path',))
+GITHUB_API_REQUESTS = Counter('upwork_github_api_requests_total', 'GitHub API requests made by refreshes in this process')
+GITHUB_RATE_LIMIT_REMAINING = Gauge(
+    'upwork_github_rate_limit_remaining', 'Remaining GitHub rate limit reported to the last refresh', ('resource',),
+)
+
+# Refreshed from the database by main.py's collector. Scrapes run in the
+# worker processes and their history is pruned, so these are gauges over a
+# recent window rather than counters.
+SCRAPE_WINDOW_HOURS = 24
+SCRAPE_STAGE_SECONDS = Gauge(
+    'upwork_scrape_stage_seconds', 'Seconds per URL by scrape stage over the last 24h, by quantile (0.5, 0.9, 0.99)',
+    ('stage', 'quantile'),
+)
+SCRAPE_URLS = Gauge('upwork_scrape_urls', 'Search URLs scraped in the last 24h')
+SCRAPE_JOBS_ADDED = Gauge('upwork_scrape_jobs_added', 'Jobs written by scrapes in the last 24h, by source (browser, cache)', ('source',))
+CACHE_LOOKUPS = Gauge('upwork_cache_lookups', 'Lookups recorded by each cache, by result', ('cache', 'result'))
+CACHE_HIT_RATIO = Gauge('upwork_cache_hit_ratio', 'Fraction of cache lookups served from the cache', ('cache',))
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request under its route template
+    (e.g. /api/jobs), so path parameters do not create new series"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get('route'), 'path', 'unmatched')
+            REQUEST_LATENCY.observe(time.perf_counter() - started, scope['method'], route)
+            REQUESTS.inc(1, scope['method'], route, status)
+
+
+_QUERY_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE(?:\s+IF\s+NOT\s+EXISTS)?|ON)\s+([A-Za-z_]\w*)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def query_name(sql: str) -> str:
+    """'select_jobs' for "SELECT COUNT(*) FROM jobs ...": the statement's operation and first table"""
+    words = sql.split(None, 1)
+    operation = words[0].lower() if words else 'unknown'
+    match = _QUERY_TABLE.search(sql)
+    return f"{operation}_{match.group(1).lower()}" if match else operation
+
+
+class TimedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            DB_QUERY_LATENCY.observe(time.perf_counter() - started, query_name(sql))
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            DB_QUERY_LATENCY.observe(time.perf_counter() - started, query_name(sql))
+
+
+class TimedConnection(sqlite3.Connection):
+    """sqlite3.connect(..., factory=TimedConnection) times every statement"""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+async def monitor_event_loop_lag(interval: float = LOOP_LAG_INTERVAL_SECONDS):
+    """Observe how late a sleep of `interval` wakes up, until cancelled"""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - started - interval))
@@ -0,0 +1,258 @@
+"""Asyncio GitHub README Extractor
+
+Same results as GitHubReadmeExtractor (profile/github_scrapper.py), fetched
+over one pooled keep-alive httpx.AsyncClient so it can be awaited from
+FastAPI without blocking the event loop. Cancelling the awaiting task cancels
+every in-flight request.
+
+Requests pass through a token bucket per GitHub rate limit resource (core,
+graphql) that is refilled from the X-RateLimit-Remaining / X-RateLimit-Reset
+headers of each response: once the remaining budget is spent, requests wait
+(asynchronously) for the reset instead of running into 403s.
+
+Usage:
+    readmes = await fetch_all_readmes_async("octocat", token=GITHUB_TOKEN)
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from profile.github_scrapper import GitHubRateLimitError, GitHubReadmeExtractor
+
+
+class RateLimitBucket:
+    """Token bucket mirroring one GitHub rate limit resource.
+
+    Tokens are the requests GitHub reports as remaining, minus requests in
+    flight; the bucket refills at the reset time the headers announce. Until
+    the first response arrives the budget is unknown and requests pass.
+    """
+
+    def __init__(self, wait: bool = True, max_sleep: float = 600, reserve: int = 0) -> None:
+        self.wait = wait
+        self.max_sleep = max_sleep
+        self.reserve = reserve
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.in_flight = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Held while sleeping, so every waiting request resumes after the reset
+        async with self._lock:
+            while self.remaining is not None and self.remaining - self.in_flight <= self.reserve:
+                sleep_for = self.reset_at - time.time() + 1
+                if sleep_for <= 0:
+                    self.remaining = None  # window has reset; next response refills
+                    break
+                if not self.wait or sleep_for > self.max_sleep:
+                    raise GitHubRateLimitError(f"Rate limit exceeded. Reset at epoch {int(self.reset_at)}")
+                await asyncio.sleep(sleep_for)
+            self.in_flight += 1
+
+    def release(self, headers=None) -> None:
+        """Return the in-flight slot and refill from the response headers"""
+        self.in_flight = max(0, self.in_flight - 1)
+        if headers is None:
+            return
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers["X-RateLimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if reset_at > self.reset_at or self.remaining is None:
+            self.remaining, self.reset_at = remaining, reset_at
+        else:
+            # Responses of one window can arrive out of order
+            self.remaining = min(self.remaining, remaining)
+
+    def exhaust(self, reset_at: float) -> None:
+        """Mark the budget spent until reset_at (primary or secondary limit hit)"""
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, reset_at)
+
+    def snapshot(self) -> Dict:
+        return {"remaining": self.remaining, "reset_at": self.reset_at or None, "in_flight": self.in_flight}
+
+
+class AsyncGitHubReadmeExtractor(GitHubReadmeExtractor):
+    """GitHubReadmeExtractor whose I/O runs on asyncio.
+
+    Refresh planning, GraphQL batching, README parsing and the HTTP cache are
+    inherited; only the request layer differs. `max_workers` bounds both the
+    concurrent README fetches and the connection pool.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = {
+            "core": RateLimitBucket(self.wait_on_rate_limit, self.max_rate_limit_sleep),
+            "graphql": RateLimitBucket(self.wait_on_rate_limit, self.max_rate_limit_sleep),
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def fetch(self, previous: Optional[List[Dict]] = None) -> List[Dict]:
+        """Fetch READMEs; with `previous`, refetch only repos pushed since then."""
+        return self._merge([entry async for entry in self.aiter_fetch(previous)])
+
+    async def aiter_fetch(self, previous: Optional[List[Dict]] = None) -> AsyncIterator[Dict]:
+        """Yield each refetched repo's result as soon as it completes (see iter_fetch)"""
+        limits = httpx.Limits(max_connections=self.max_workers, max_keepalive_connections=self.max_workers)
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers), timeout=self.request_timeout, limits=limits
+        ) as client:
+            self._client = client
+            try:
+                manifest, newest = self._manifest(previous)
+                repos, listing_complete = await self._list_repositories(stop_at_pushed=newest)
+                changed = self._plan_refresh(repos, manifest, listing_complete)
+
+                if self._use_graphql():
+                    for start in range(0, len(changed), self.graphql_batch_size):
+                        for entry in await self._fetch_graphql_batch(changed[start:start + self.graphql_batch_size]):
+                            yield self._progressed(entry)
+                    return
+
+                semaphore = asyncio.Semaphore(self.max_workers)
+
+                async def fetch_one(repo: Dict) -> Dict:
+                    async with semaphore:
+                        return await self._fetch_single_readme(repo)
+
+                tasks = [asyncio.ensure_future(fetch_one(repo)) for repo in changed]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        yield self._progressed(await next_done)
+                finally:
+                    for task in tasks:
+                        task.cancel()
+            finally:
+                self._client = None
+
+    def rate_limit_status(self) -> Dict:
+        return {resource: bucket.snapshot() for resource, bucket in self.buckets.items()}
+
+    async def _list_repositories(self, stop_at_pushed: Optional[str] = None):
+        repos: List[Dict] = []
+        page = 1
+        while True:
+            url = f"{self.api_url}/users/{self.username}/repos"
+            resp = await self._request("GET", url, params=self._repos_page_params(page))
+            data = resp.json()
+            if isinstance(data, list):
+                repos.extend(data)
+            listing_complete = self._page_ends_listing(data, repos, stop_at_pushed)
+            if listing_complete is not None:
+                return repos, listing_complete
+            page += 1
+
+    async def _fetch_graphql_batch(self, batch: List[Dict]) -> List[Dict]:
+        try:
+            resp = await self._request("POST", f"{self.api_url}/graphql", json={"query": self._graphql_query(batch)})
+            data = resp.json().get("data") if resp.status_code == 200 else None
+        except (httpx.HTTPError, GitHubRateLimitError, ValueError):
+            data = None
+        if not data:
+            return list(await asyncio.gather(*(self._fetch_single_readme(repo) for repo in batch)))
+        return self._graphql_results(batch, data)
+
+    async def _fetch_single_readme(self, repo: Dict) -> Dict:
+        chosen_path = None
+        sha = None
+        decoded = ""
+        error: Optional[str] = None
+
+        for url, path in self._readme_endpoints(repo):
+            try:
+                done, found_path, found_sha, text, err = self._parse_readme(await self._request("GET", url), path)
+                error = err or error
+                if done:
+                    chosen_path, sha, decoded = found_path, found_sha, text
+                    break
+            except GitHubRateLimitError as rl:
+                error = f"rate-limit:{rl}"
+                break
+            except (httpx.HTTPError, ValueError) as e:
+                error = f"request-error:{e}"
+                break
+
+        if not chosen_path and not error:
+            error = "readme-not-found"
+
+        return self._result(repo, chosen_path, decoded, error, sha)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Perform a request through the rate limit bucket, conditionally if cached."""
+        cache_key = None
+        if self.http_cache is not None and method == "GET":
+            url = str(httpx.URL(url, params=kwargs.pop("params", None)))
+            cache_key = self.http_cache.key(url, self._client.headers.get("Authorization"))
+            conditional = await asyncio.to_thread(self.http_cache.conditional_headers, cache_key)
+            kwargs["headers"] = {**kwargs.get("headers", {}), **conditional}
+
+        bucket = self.buckets["graphql" if url.endswith("/graphql") else "core"]
+        while True:
+            await bucket.acquire()
+            self.requests_made += 1
+            try:
+                resp = await self._client.request(method, url, **kwargs)
+            except BaseException:
+                bucket.release()
+                raise
+            bucket.release(resp.headers)
+
+            if resp.status_code in (403, 429):
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after is not None:
+                    # Secondary rate limit: back off for the announced time
+                    bucket.exhaust(time.time() + float(retry_after))
+                    continue
+                if resp.headers.get("X-RateLimit-Remaining") == "0":
+                    continue  # the bucket now waits for the reset, or raises
+            break
+
+        if cache_key is not None:
+            if resp.status_code == 304:
+                cached = await asyncio.to_thread(self.http_cache.revalidated, cache_key)
+                if cached is not None:
+                    content_type, body = cached
+                    headers = httpx.Headers(resp.headers)
+                    headers["Content-Type"] = content_type
+                    for name in ("Content-Length", "Content-Encoding"):
+                        headers.pop(name, None)
+                    return httpx.Response(200, headers=headers, content=body, request=resp.request)
+            elif resp.status_code == 200:
+                await asyncio.to_thread(self.http_cache.store, cache_key, url, resp.headers, resp.content)
+        return resp
+
+
+async def fetch_all_readmes_async(
+    username: str,
+    token: Optional[str] = None,
+    include_forks: bool = False,
+    max_repos: Optional[int] = None,
+    max_workers: int = 8,
+    wait_on_rate_limit: bool = True,
+    max_rate_limit_sleep: int = 600,
+    strategy: str = "auto",
+    http_cache=None,
+    previous: Optional[List[Dict]] = None,
+) -> List[Dict]:
+    """Async fetch_all_readmes; waits for rate limit resets by default since it
+    only suspends this coroutine. See fetch_all_readmes for the arguments."""
+    extractor = AsyncGitHubReadmeExtractor(
+        username=username,
+        token=token,
+        include_forks=include_forks,
+        max_repos=max_repos,
+        max_workers=max_workers,
+        wait_on_rate_limit=wait_on_rate_limit,
+        max_rate_limit_sleep=max_rate_limit_sleep,
+        strategy=strategy,
+        http_cache=http_cache,
+    )
+    return await extractor.fetch(previous)
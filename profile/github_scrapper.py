@@ -7,6 +7,25 @@ Primary implementation uses the GitHub REST API (no external deps beyond
 `requests`). Optional personal access token greatly increases the rate limit
 (60 -> 5,000 requests / hour) and allows private repos if the token has scope.
 
+README resolution (strategy="auto"):
+    - with a token: one GraphQL query per `graphql_batch_size` repos that
+      looks up every README_CANDIDATE_PATHS entry of each repo at once
+    - without a token (GraphQL requires auth): the REST readme endpoint, one
+      request per repo, which finds READMEs at the root, docs/ and .github/
+    - the contents API only probes candidates the readme endpoint does not
+      cover (e.g. Docs/README.md); strategy="probe" restores the old
+      one-request-per-candidate behaviour
+
+With an `http_cache` (profile/http_cache.py), GET requests are sent with
+If-None-Match / If-Modified-Since; unchanged resources come back as 304s,
+which GitHub does not count against the rate limit, and are served from disk.
+
+Incremental refresh: pass the previous result list as `previous`. Its entries
+act as the per-repo manifest (pushed_at, readme_sha, fetched_at); only repos
+pushed since they were fetched are refetched, repo listing stops at the first
+page reaching repos older than the newest manifest entry, and unchanged
+entries are carried over into the returned corpus.
+
 Usage (basic):
     from github_readme_extractor import fetch_all_readmes
     readmes = fetch_all_readmes("octocat")
@@ -20,6 +39,8 @@ Returned data list entry keys:
     repo: repository name
     full_name: owner/repo
     readme_path: the path that succeeded (or None)
+    readme_sha: git blob SHA of the README (or None)
+    pushed_at: repo pushed_at when the README was fetched
     readme_text: decoded README content ('' if missing)
     size: bytes (decoded)
     html_url: repo HTML URL
@@ -36,10 +57,12 @@ from __future__ import annotations
 
 import base64
 import concurrent.futures as cf
+import json
 import os
 import sys
+import threading
 import time
-from typing import Iterable, List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional
 import requests
 from datetime import datetime
 
@@ -61,11 +84,16 @@ README_CANDIDATE_PATHS = [
     "docs/README.md",
     "Docs/README.md",
 ]
+# Directories the REST readme endpoint already searches
+README_ENDPOINT_DIRS = ("", "docs", ".github")
+STRATEGIES = ("auto", "graphql", "rest", "probe")
 
 class GitHubRateLimitError(RuntimeError):
     pass
 
 class GitHubReadmeExtractor:
+    REPOS_PER_PAGE = 100
+
     def __init__(
         self,
         username: str,
@@ -76,7 +104,13 @@ class GitHubReadmeExtractor:
         max_workers: int = 8,
         wait_on_rate_limit: bool = False,
         max_rate_limit_sleep: int = 600,
+        strategy: str = "auto",
+        graphql_batch_size: int = 25,
+        api_url: str = GITHUB_API,
+        http_cache=None,
     ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Choose from: {', '.join(STRATEGIES)}")
         self.username = username
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.include_forks = include_forks
@@ -85,6 +119,16 @@ class GitHubReadmeExtractor:
         self.max_workers = max_workers
         self.wait_on_rate_limit = wait_on_rate_limit
         self.max_rate_limit_sleep = max_rate_limit_sleep
+        self.strategy = strategy
+        self.graphql_batch_size = max(1, graphql_batch_size)
+        self.api_url = api_url.rstrip("/")
+        self.http_cache = http_cache
+        self.requests_made = 0
+        self.last_refresh: Dict = {}
+        self.plan: Dict = {}
+        self.progress: Dict = {"total": 0, "done": 0, "unchanged": 0}
+        self.rate_limit: Dict[str, Dict] = {}
+        self._count_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             "Accept": "application/vnd.github+json",
@@ -94,67 +138,215 @@ class GitHubReadmeExtractor:
             self.session.headers["Authorization"] = f"Bearer {self.token}"
 
     # ----------------------------- Public API ----------------------------- #
-    def fetch(self) -> List[Dict]:
-        repos = self._list_repositories()
+    def fetch(self, previous: Optional[List[Dict]] = None) -> List[Dict]:
+        """Fetch READMEs; with `previous`, refetch only repos pushed since then."""
+        return self._merge(list(self.iter_fetch(previous)))
+
+    def iter_fetch(self, previous: Optional[List[Dict]] = None) -> Iterator[Dict]:
+        """Yield each refetched repo's result as soon as it completes.
+
+        Entries carried over from `previous` are not yielded; they are in
+        `self.plan["carried"]` once the first result (or the end) is reached.
+        `self.progress` counts repos done and remaining meanwhile.
+        """
+        manifest, newest = self._manifest(previous)
+        repos, listing_complete = self._list_repositories(stop_at_pushed=newest)
+        changed = self._plan_refresh(repos, manifest, listing_complete)
+
+        if self._use_graphql():
+            for start in range(0, len(changed), self.graphql_batch_size):
+                for entry in self._fetch_graphql_batch(changed[start:start + self.graphql_batch_size]):
+                    yield self._progressed(entry)
+            return
+
+        executor = cf.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [executor.submit(self._fetch_single_readme, repo) for repo in changed]
+            for fut in cf.as_completed(futures):
+                yield self._progressed(fut.result())
+        finally:
+            # A consumer that stops early should not wait for the remaining repos
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def rate_limit_status(self) -> Dict:
+        """Last rate limit budget GitHub reported, per resource (core, graphql)"""
+        return dict(self.rate_limit)
+
+    # ------------------------- Internal Helpers --------------------------- #
+    # The planning and parsing helpers below do no I/O and are shared with
+    # AsyncGitHubReadmeExtractor (profile/async_github.py).
+    @staticmethod
+    def _manifest(previous: Optional[List[Dict]]):
+        """Usable entries of a previous result by full_name, and the newest pushed_at"""
+        manifest = {
+            r["full_name"]: r for r in previous or []
+            if r.get("full_name") and r.get("pushed_at") and r.get("error") in (None, "readme-not-found")
+        }
+        return manifest, max((r["pushed_at"] for r in manifest.values()), default=None)
+
+    def _plan_refresh(self, repos: List[Dict], manifest: Dict[str, Dict], listing_complete: bool) -> List[Dict]:
+        """Repos to refetch; manifest entries to carry over are kept in self.plan"""
         if not self.include_forks:
             repos = [r for r in repos if not r.get("fork")]
         if self.max_repos is not None:
             repos = repos[: self.max_repos]
 
-        results: List[Dict] = []
-        with cf.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_map = {
-                executor.submit(self._fetch_single_readme, repo): repo for repo in repos
-            }
-            for fut in cf.as_completed(future_map):
-                results.append(fut.result())
-        return results
+        changed = [
+            r for r in repos
+            if r.get("full_name") not in manifest or manifest[r["full_name"]]["pushed_at"] != r.get("pushed_at")
+        ]
+        if listing_complete:
+            # Repos missing from a full listing were deleted or made private
+            listed = {r.get("full_name") for r in repos}
+            carried = [entry for name, entry in manifest.items() if name in listed]
+        else:
+            # Repos beyond the last page listed were not pushed since the newest entry
+            carried = list(manifest.values())
+        refetched = {r.get("full_name") for r in changed}
+        carried = [entry for entry in carried if entry["full_name"] not in refetched]
 
-    # ------------------------- Internal Helpers --------------------------- #
-    def _list_repositories(self) -> List[Dict]:
+        self.plan = {"repos": repos, "listing_complete": listing_complete, "carried": carried}
+        self.progress = {"total": len(changed), "done": 0, "unchanged": len(carried)}
+        return changed
+
+    def _progressed(self, entry: Dict) -> Dict:
+        self.progress["done"] += 1
+        return entry
+
+    def _merge(self, results: List[Dict]) -> List[Dict]:
+        carried = self.plan["carried"]
+        self.last_refresh = {
+            "repos_listed": len(self.plan["repos"]),
+            "listing_complete": self.plan["listing_complete"],
+            "refetched": len(results),
+            "unchanged": len(carried),
+        }
+        return sorted(results + carried, key=lambda r: r.get("pushed_at") or "", reverse=True)
+
+    def _use_graphql(self) -> bool:
+        return self.strategy == "graphql" or (self.strategy == "auto" and bool(self.token))
+
+    def _repos_page_params(self, page: int) -> Dict:
+        return {"page": page, "per_page": self.REPOS_PER_PAGE, "sort": "pushed"}
+
+    def _page_ends_listing(self, data, repos: List[Dict], stop_at_pushed: Optional[str]) -> Optional[bool]:
+        """None to fetch the next page, else whether the listing is complete"""
+        if not isinstance(data, list):
+            raise RuntimeError(f"Unexpected repos response: {data}")
+        if len(data) < self.REPOS_PER_PAGE:
+            return True
+        if stop_at_pushed and (data[-1].get("pushed_at") or "") <= stop_at_pushed:
+            return False
+        if self.max_repos and len(repos) >= self.max_repos:
+            return False
+        return None
+
+    def _list_repositories(self, stop_at_pushed: Optional[str] = None):
+        """List repos, most recently pushed first.
+
+        Stops after the first page that reaches a repo pushed no later than
+        `stop_at_pushed`. Returns (repos, listing_complete).
+        """
         repos: List[Dict] = []
         page = 1
-        per_page = 100
         while True:
-            url = f"{GITHUB_API}/users/{self.username}/repos"
-            params = {"page": page, "per_page": per_page, "sort": "pushed"}
-            resp = self._request("GET", url, params=params)
+            url = f"{self.api_url}/users/{self.username}/repos"
+            resp = self._request("GET", url, params=self._repos_page_params(page))
             data = resp.json()
-            if not isinstance(data, list):
-                raise RuntimeError(f"Unexpected repos response: {data}")
-            repos.extend(data)
-            if len(data) < per_page:
-                break
+            if isinstance(data, list):
+                repos.extend(data)
+            listing_complete = self._page_ends_listing(data, repos, stop_at_pushed)
+            if listing_complete is not None:
+                return repos, listing_complete
             page += 1
-            if self.max_repos and len(repos) >= self.max_repos:
-                break
-        return repos
 
-    def _fetch_single_readme(self, repo: Dict) -> Dict:
-        repo_name = repo.get("name")
+    def _fetch_graphql_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Resolve READMEs for up to `graphql_batch_size` repos in one GraphQL request.
+
+        A batch the GraphQL API rejects as a whole is resolved through REST.
+        """
+        try:
+            resp = self._request("POST", f"{self.api_url}/graphql", json={"query": self._graphql_query(batch)})
+            data = resp.json().get("data") if resp.status_code == 200 else None
+        except Exception:
+            data = None
+        if not data:
+            return [self._fetch_single_readme(repo) for repo in batch]
+        return self._graphql_results(batch, data)
+
+    def _graphql_query(self, repos: List[Dict]) -> str:
+        # Aliases r<i> / p<j> map each answer back to repo i, candidate path j
+        lookups = " ".join(
+            f"p{j}: object(expression: {json.dumps('HEAD:' + path)}) {{ ... on Blob {{ oid text }} }}"
+            for j, path in enumerate(README_CANDIDATE_PATHS)
+        )
+        repositories = " ".join(
+            f"r{i}: repository(owner: {json.dumps(repo.get('owner', {}).get('login', self.username))}, "
+            f"name: {json.dumps(repo.get('name'))}) {{ {lookups} }}"
+            for i, repo in enumerate(repos)
+        )
+        return f"query {{ {repositories} }}"
+
+    def _graphql_results(self, batch: List[Dict], data: Dict) -> List[Dict]:
+        results: List[Dict] = []
+        for i, repo in enumerate(batch):
+            blobs = data.get(f"r{i}") or {}
+            for j, path in enumerate(README_CANDIDATE_PATHS):
+                blob = blobs.get(f"p{j}")
+                if blob and blob.get("text") is not None:
+                    results.append(self._result(repo, path, blob["text"], None, blob.get("oid")))
+                    break
+            else:
+                results.append(self._result(repo, None, "", "readme-not-found"))
+        return results
+
+    def _readme_endpoints(self, repo: Dict):
+        """(url, candidate path) pairs to try in order for one repo"""
         owner = repo.get("owner", {}).get("login", self.username)
-        base = f"{GITHUB_API}/repos/{owner}/{repo_name}/contents"
+        base = f"{self.api_url}/repos/{owner}/{repo.get('name')}"
+        # The readme endpoint finds the README wherever GitHub would render it
+        # from; only candidates outside those directories are probed one by one
+        endpoints = [(f"{base}/readme", None)] if self.strategy != "probe" else []
+        endpoints += [
+            (f"{base}/contents/{path}", path) for path in README_CANDIDATE_PATHS
+            if self.strategy == "probe" or os.path.dirname(path) not in README_ENDPOINT_DIRS
+        ]
+        return endpoints
+
+    @staticmethod
+    def _parse_readme(resp, path: Optional[str]):
+        """(done, chosen_path, sha, decoded, error) for one readme/contents response.
+
+        Works on both requests and httpx responses.
+        """
+        if resp.status_code == 200 and resp.headers.get("Content-Type", "").startswith("application/json"):
+            data = resp.json()
+            if data.get("type") == "file" and data.get("encoding") == "base64":
+                try:
+                    decoded = base64.b64decode(data.get("content", "")).decode("utf-8", errors="replace")
+                    error = None
+                except Exception as dec_err:
+                    decoded = ""
+                    error = f"decode-error:{dec_err}"
+                return True, path or data.get("path"), data.get("sha"), decoded, error
+            return False, None, None, "", None
+        if resp.status_code == 404:
+            return False, None, None, "", None  # try next candidate
+        return False, None, None, "", f"unexpected-status:{resp.status_code}"
+
+    def _fetch_single_readme(self, repo: Dict) -> Dict:
         chosen_path = None
+        sha = None
         decoded = ""
         error: Optional[str] = None
 
-        for path in README_CANDIDATE_PATHS:
+        for url, path in self._readme_endpoints(repo):
             try:
-                resp = self._request("GET", f"{base}/{path}")
-                if resp.status_code == 200 and resp.headers.get("Content-Type", "").startswith("application/json"):
-                    data = resp.json()
-                    if data.get("type") == "file" and data.get("encoding") == "base64":
-                        try:
-                            decoded = base64.b64decode(data.get("content", "")).decode("utf-8", errors="replace")
-                        except Exception as dec_err:
-                            decoded = ""
-                            error = f"decode-error:{dec_err}"
-                        chosen_path = path
-                        break
-                elif resp.status_code == 404:
-                    continue  # try next candidate
-                else:
-                    error = f"unexpected-status:{resp.status_code}"
+                done, found_path, found_sha, text, err = self._parse_readme(self._request("GET", url), path)
+                error = err or error
+                if done:
+                    chosen_path, sha, decoded = found_path, found_sha, text
+                    break
             except GitHubRateLimitError as rl:
                 error = f"rate-limit:{rl}"
                 break
@@ -165,10 +357,17 @@ class GitHubReadmeExtractor:
         if not chosen_path and not error:
             error = "readme-not-found"
 
+        return self._result(repo, chosen_path, decoded, error, sha)
+
+    def _result(
+        self, repo: Dict, chosen_path: Optional[str], decoded: str, error: Optional[str], sha: Optional[str] = None
+    ) -> Dict:
         return {
-            "repo": repo_name,
+            "repo": repo.get("name"),
             "full_name": repo.get("full_name"),
             "readme_path": chosen_path,
+            "readme_sha": sha,
+            "pushed_at": repo.get("pushed_at"),
             "readme_text": decoded,
             "size": len(decoded.encode("utf-8")) if decoded else 0,
             "html_url": repo.get("html_url"),
@@ -181,12 +380,32 @@ class GitHubReadmeExtractor:
             "error": error,
         }
 
+    def _note_rate_limit(self, headers) -> None:
+        if "X-RateLimit-Remaining" in headers:
+            self.rate_limit[headers.get("X-RateLimit-Resource", "core")] = {
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "limit": int(headers.get("X-RateLimit-Limit", 0)) or None,
+                "reset_at": float(headers.get("X-RateLimit-Reset", 0)) or None,
+            }
+
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Perform a request with optional rate-limit wait/retry."""
+        """Perform a request with optional rate-limit wait/retry.
+
+        GET requests are made conditional when an HTTP cache is configured.
+        """
+        cache_key = None
+        if self.http_cache is not None and method == "GET":
+            url = requests.Request(method, url, params=kwargs.pop("params", None)).prepare().url
+            cache_key = self.http_cache.key(url, self.session.headers.get("Authorization"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), **self.http_cache.conditional_headers(cache_key)}
+
         attempt = 0
         while True:
             attempt += 1
+            with self._count_lock:
+                self.requests_made += 1
             resp = self.session.request(method, url, timeout=self.request_timeout, **kwargs)
+            self._note_rate_limit(resp.headers)
             if resp.status_code == 403 and "rate limit" in resp.text.lower():
                 reset = resp.headers.get("X-RateLimit-Reset")
                 remaining = resp.headers.get("X-RateLimit-Remaining")
@@ -206,6 +425,8 @@ class GitHubReadmeExtractor:
                     # avoid excessively long waits unless user explicitly allowed via max_rate_limit_sleep
                     time.sleep(sleep_for)
                     continue  # retry after sleep
+            if cache_key is not None:
+                return self.http_cache.update(cache_key, resp)
             return resp
 
 # ------------------------------ Convenience ------------------------------- #
@@ -218,6 +439,9 @@ def fetch_all_readmes(
     max_workers: int = 8,
     wait_on_rate_limit: bool = False,
     max_rate_limit_sleep: int = 600,
+    strategy: str = "auto",
+    http_cache=None,
+    previous: Optional[List[Dict]] = None,
 ) -> List[Dict]:
     """Fetch README content for all public repos of a user.
 
@@ -227,6 +451,10 @@ def fetch_all_readmes(
         include_forks: Include forked repos if True.
         max_repos: Limit number of repos processed (early stop).
         max_workers: Thread pool size for parallel README fetches.
+        strategy: README resolution: auto, graphql, rest or probe.
+        http_cache: Optional HttpCache for conditional (ETag) requests.
+        previous: Earlier result list; only repos pushed since are refetched
+            and the rest are carried over.
 
     Returns:
         List of metadata dicts (see module docstring for keys).
@@ -239,8 +467,10 @@ def fetch_all_readmes(
         max_workers=max_workers,
         wait_on_rate_limit=wait_on_rate_limit,
         max_rate_limit_sleep=max_rate_limit_sleep,
+        strategy=strategy,
+        http_cache=http_cache,
     )
-    return extractor.fetch()
+    return extractor.fetch(previous)
 
 # ------------------------------- CLI Runner ------------------------------- #
 
@@ -264,10 +494,17 @@ def main(argv: Optional[Iterable[str]] = None):
     parser.add_argument("--workers", type=int, default=8, help="Max concurrent fetch workers")
     parser.add_argument("--wait", action="store_true", help="Wait & retry when hitting rate limit (may sleep)")
     parser.add_argument("--max-wait", type=int, default=600, help="Max seconds to sleep on rate limit")
-    parser.add_argument("--out-json", help="Optional JSON output file")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="auto", help="README resolution strategy")
+    parser.add_argument("--cache-dir", help="On-disk HTTP cache directory for conditional requests")
+    parser.add_argument("--out-json", help="Optional JSON output file; refreshed incrementally if it exists")
     args = parser.parse_args(list(argv) if argv is not None else None)
 
-    results = fetch_all_readmes(
+    http_cache = None
+    if args.cache_dir:
+        from profile.http_cache import HttpCache
+        http_cache = HttpCache(args.cache_dir)
+
+    extractor = GitHubReadmeExtractor(
         username=args.username,
         token=args.token,
         include_forks=args.include_forks,
@@ -275,11 +512,21 @@ def main(argv: Optional[Iterable[str]] = None):
         max_workers=args.workers,
         wait_on_rate_limit=args.wait,
         max_rate_limit_sleep=args.max_wait,
+        strategy=args.strategy,
+        http_cache=http_cache,
     )
+    previous = None
+    if args.out_json and os.path.exists(args.out_json):
+        with open(args.out_json, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    results = extractor.fetch(previous)
     _print_summary(results)
+    print(f"API requests: {extractor.requests_made} | {extractor.last_refresh}")
+    if http_cache is not None:
+        print(f"HTTP cache: {http_cache.stats()['session']}")
+        http_cache.close()
 
     if args.out_json:
-        import json
         with open(args.out_json, "w", encoding="utf-8") as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"Saved JSON -> {args.out_json}")
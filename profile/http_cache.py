@@ -0,0 +1,140 @@
+"""On-disk HTTP cache for conditional GitHub API requests
+
+Stores the body and validators (ETag / Last-Modified) of GET responses in a
+SQLite file so later requests can be sent with If-None-Match /
+If-Modified-Since. GitHub answers unchanged resources with 304 Not Modified,
+which does not count against the rate limit, and the cached body is served.
+
+Usage:
+    cache = HttpCache("profile/data/http_cache")
+    extractor = GitHubReadmeExtractor("octocat", http_cache=cache)
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpCache:
+    def __init__(self, cache_dir: str) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(cache_dir, "http_cache.db"), timeout=30, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS stats (
+                name TEXT PRIMARY KEY,  -- revalidated (304), stored (200), uncached
+                count INTEGER DEFAULT 0
+            )
+        """)
+        self._db.commit()
+        self.session_stats = {"revalidated": 0, "stored": 0, "uncached": 0}
+
+    def close(self) -> None:
+        self._db.close()
+
+    @staticmethod
+    def key(url: str, auth: Optional[str] = None) -> str:
+        """Cache key for a fully encoded request URL.
+
+        The credential is part of the key so responses fetched with a token
+        (which may include private repos) are never served to another one.
+        """
+        return hashlib.sha1(f"{auth or ''}\n{url}".encode("utf-8")).hexdigest()
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached response"""
+        with self._lock:
+            row = self._db.execute("SELECT etag, last_modified FROM responses WHERE key = ?", (key,)).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def update(self, key: str, resp: requests.Response) -> requests.Response:
+        """Store a 200 that has validators, or turn a 304 into the cached 200"""
+        if resp.status_code == 304:
+            cached = self.revalidated(key)
+            if cached is not None:
+                content_type, body = cached
+                response = requests.Response()
+                response.status_code = 200
+                response._content = body
+                response.headers = CaseInsensitiveDict({**resp.headers, "Content-Type": content_type})
+                response.url = resp.url
+                response.request = resp.request
+                response.from_cache = True
+                return response
+        elif resp.status_code == 200:
+            self.store(key, resp.url, resp.headers, resp.content)
+            return resp
+        self._count("uncached")
+        return resp
+
+    def revalidated(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """(content type, body) to serve for a 304, or None if not cached"""
+        with self._lock:
+            row = self._db.execute("SELECT content_type, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._count("revalidated")
+        return row[0] or "", row[1]
+
+    def store(self, key: str, url: str, headers, body: bytes) -> None:
+        """Cache a 200 body if the response carries ETag or Last-Modified"""
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if not (etag or last_modified):
+            self._count("uncached")
+            return
+        with self._lock:
+            self._db.execute("""
+                INSERT OR REPLACE INTO responses (key, url, etag, last_modified, content_type, body, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (key, str(url), etag, last_modified, headers.get("Content-Type"), body, time.time()))
+            self._db.commit()
+        self._count("stored")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.session_stats[name] += 1
+            self._db.execute("""
+                INSERT INTO stats (name, count) VALUES (?, 1)
+                ON CONFLICT(name) DO UPDATE SET count = count + 1
+            """, (name,))
+            self._db.commit()
+
+    def stats(self) -> Dict:
+        """Hit rate of this session and since the cache was created"""
+        with self._lock:
+            totals = dict(self._db.execute("SELECT name, count FROM stats").fetchall())
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "entries": entries,
+            "session": _with_hit_rate(self.session_stats),
+            "total": _with_hit_rate({name: totals.get(name, 0) for name in self.session_stats}),
+        }
+
+
+def _with_hit_rate(counts: Dict[str, int]) -> Dict:
+    requests_seen = sum(counts.values())
+    return {**counts, "hit_rate": round(counts["revalidated"] / requests_seen, 3) if requests_seen else None}
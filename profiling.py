@@ -0,0 +1,191 @@
+"""
+Request Profiling
+Opt-in sampling profiler that can stay enabled in production: requests
+carrying the profiling token and configured background tasks are sampled
+and written as collapsed stacks ("thread;frame;frame count" per line), the
+input format of flamegraph.pl, inferno and speedscope
+"""
+
+import functools
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Optional
+
+TOKEN_HEADER = b'x-profile-token'
+FILE_HEADER = b'x-profile-file'
+
+
+class SamplingProfiler:
+    """Samples the Python stacks of all threads every `interval` seconds from
+    a background thread.
+
+    Only stacks with a frame under `root` (application code) are kept, so idle
+    threads and an event loop waiting for I/O do not swamp the flamegraph.
+    Every thread is sampled, so a profile also holds whatever else ran
+    meanwhile: other requests, background tasks and scraper threads.
+    """
+
+    def __init__(self, root: str, interval: float = 0.005):
+        self.root = os.path.abspath(root) + os.sep
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.seconds = 0.0
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self._started
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = self._stack(frame)
+                if stack:
+                    self.stacks[(names.get(ident, str(ident)),) + stack] += 1
+
+    def _stack(self, frame) -> Optional[tuple]:
+        labels = []
+        in_app = False
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = self._label(code)
+            labels.append(label[0])
+            in_app = in_app or label[1]
+            frame = frame.f_back
+        return tuple(reversed(labels)) if in_app else None
+
+    def _label(self, code):
+        filename = code.co_filename
+        in_app = filename.startswith(self.root) and 'site-packages' not in filename
+        location = os.path.relpath(filename, self.root) if in_app else os.path.basename(filename)
+        name = getattr(code, 'co_qualname', code.co_name)
+        return f"{name} ({location})".replace(';', ':'), in_app
+
+    def folded(self) -> str:
+        """Collapsed stacks, most sampled first"""
+        return ''.join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class Profiling:
+    """Decides what gets profiled and writes the results to `directory`.
+
+    Requests are eligible when they send `token` (empty disables request
+    profiling), background tasks when their name is in `tasks`. Eligible runs
+    are profiled with probability `sample_rate`, one at a time; only the
+    newest `keep` files are kept.
+    """
+
+    def __init__(self, directory: str, root: str, token: str = '', tasks: Iterable[str] = (),
+                 sample_rate: float = 1.0, interval: float = 0.005, keep: int = 200):
+        self.directory = directory
+        self.root = root
+        self.token = token
+        self.tasks = set(tasks)
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.keep = keep
+        self._running = threading.Lock()
+
+    def authorized(self, token: Optional[str]) -> bool:
+        return bool(self.token and token) and hmac.compare_digest(token.encode(), self.token.encode())
+
+    def filename(self, name: str) -> str:
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_') or 'root'
+        return f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}_{slug}.folded"
+
+    @contextmanager
+    def session(self, filename: str):
+        """Profile the body into `filename`; yields False (and does nothing) if
+        not sampled or another profile is running"""
+        if random.random() >= self.sample_rate or not self._running.acquire(blocking=False):
+            yield False
+            return
+        profiler = SamplingProfiler(self.root, self.interval)
+        try:
+            profiler.start()
+            try:
+                yield True
+            finally:
+                profiler.stop()
+            self._write(filename, profiler)
+        finally:
+            self._running.release()
+
+    def _write(self, filename: str, profiler: SamplingProfiler):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, filename), 'w') as f:
+            f.write(profiler.folded())
+        profiles = sorted(name for name in os.listdir(self.directory) if name.endswith('.folded'))
+        for name in profiles[:max(0, len(profiles) - self.keep)]:
+            os.remove(os.path.join(self.directory, name))
+
+    def task(self, name: str):
+        """Decorator for async background tasks, profiled when `name` is in tasks"""
+
+        def decorate(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if name not in self.tasks:
+                    return await func(*args, **kwargs)
+                with self.session(self.filename(name)):
+                    return await func(*args, **kwargs)
+            return wrapper
+
+        return decorate
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that send the token in the
+    X-Profile-Token header (never a query parameter, which access logs
+    record); the profile's file name is returned in the X-Profile-File
+    response header"""
+
+    def __init__(self, app, profiling: Profiling):
+        self.app = app
+        self.profiling = profiling
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not self.profiling.token or not self.profiling.authorized(self._token(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        filename = self.profiling.filename(f"{scope['method']}_{scope['path']}")
+        with self.profiling.session(filename) as profiled:
+            async def send_with_file(message):
+                if profiled and message['type'] == 'http.response.start':
+                    message = {**message, 'headers': [*message.get('headers', []), (FILE_HEADER, filename.encode())]}
+                await send(message)
+
+            await self.app(scope, receive, send_with_file)
+
+    @staticmethod
+    def _token(scope) -> Optional[str]:
+        for name, value in scope.get('headers', []):
+            if name == TOKEN_HEADER:
+                return value.decode('latin-1')
+        return None
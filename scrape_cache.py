@@ -0,0 +1,110 @@
+"""
+Scrape Result Cache
+Extracted jobs per normalized search URL, so a search scraped minutes ago is
+served from SQLite instead of launching another browser session
+"""
+
+import json
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+
+def init_cache_table(cursor):
+    """Create the URL result cache table (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_url_cache (
+            url_key TEXT PRIMARY KEY,
+            jobs TEXT,  -- JSON list of extracted jobs
+            scraped_at REAL,
+            scrape_seconds REAL,  -- browser time the cached scrape took
+            hits INTEGER DEFAULT 0,
+            stale_hits INTEGER DEFAULT 0,
+            misses INTEGER DEFAULT 0,
+            seconds_saved REAL DEFAULT 0
+        )
+    """)
+
+
+def normalize_url(url: str) -> str:
+    """Cache key: scheme and host lowercased, query sorted, search text case-folded"""
+    parsed = urlparse(url)
+    params = []
+    for key, value in parse_qsl(parsed.query, keep_blank_values=True):
+        if key == 'q':
+            value = ' '.join(value.replace('+', ' ').lower().split())
+        params.append((key, value))
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path.rstrip('/') or '/',
+        '',
+        urlencode(sorted(params)),
+        '',
+    ))
+
+
+def lookup_cached_result(conn, url: str, ttl_seconds: float, stale_seconds: float) -> Optional[Dict]:
+    """Cached jobs for url, or None on a miss.
+
+    Entries younger than ttl_seconds are fresh. Entries up to stale_seconds
+    past the TTL are returned with fresh=False: callers use them right away
+    and schedule a scrape of the URL to revalidate. Every lookup is counted.
+    """
+    key = normalize_url(url)
+    now = time.time()
+    cursor = conn.cursor()
+    cursor.execute("SELECT jobs, scraped_at, scrape_seconds FROM scrape_url_cache WHERE url_key = ?", (key,))
+    row = cursor.fetchone()
+    age = now - row[1] if row and row[1] else None
+
+    if age is None or age > ttl_seconds + stale_seconds:
+        cursor.execute("""
+            INSERT INTO scrape_url_cache (url_key, misses) VALUES (?, 1)
+            ON CONFLICT(url_key) DO UPDATE SET misses = misses + 1
+        """, (key,))
+        conn.commit()
+        return None
+
+    fresh = age <= ttl_seconds
+    if fresh:
+        # A fresh hit replaces a whole browser session
+        cursor.execute("""
+            UPDATE scrape_url_cache SET hits = hits + 1, seconds_saved = seconds_saved + ?
+            WHERE url_key = ?
+        """, (row[2] or 0, key))
+    else:
+        cursor.execute("UPDATE scrape_url_cache SET stale_hits = stale_hits + 1 WHERE url_key = ?", (key,))
+    conn.commit()
+    return {'jobs': json.loads(row[0]), 'age_seconds': age, 'fresh': fresh}
+
+
+def store_result(conn, url: str, jobs, scrape_seconds: float):
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO scrape_url_cache (url_key, jobs, scraped_at, scrape_seconds) VALUES (?, ?, ?, ?)
+        ON CONFLICT(url_key) DO UPDATE SET
+            jobs = excluded.jobs,
+            scraped_at = excluded.scraped_at,
+            scrape_seconds = excluded.scrape_seconds
+    """, (normalize_url(url), json.dumps(jobs), time.time(), scrape_seconds))
+    conn.commit()
+
+
+def cache_stats(conn) -> Dict:
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COALESCE(SUM(hits), 0), COALESCE(SUM(stale_hits), 0), COALESCE(SUM(misses), 0),
+               COALESCE(SUM(seconds_saved), 0), COUNT(jobs)
+        FROM scrape_url_cache
+    """)
+    hits, stale_hits, misses, seconds_saved, entries = cursor.fetchone()
+    lookups = hits + stale_hits + misses
+    return {
+        "entries": entries,
+        "hits": hits,
+        "stale_hits": stale_hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 3) if lookups else None,
+        "browser_seconds_saved": round(seconds_saved, 1),
+    }
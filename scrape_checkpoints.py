@@ -0,0 +1,120 @@
+"""
+Scrape Run Checkpoints
+Per-URL progress of each scraping_logs run, so a run interrupted by a crash,
+restart or failed URL resumes at its first incomplete URL instead of
+scraping everything again
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+def init_checkpoint_table(cursor):
+    """Create the per-URL checkpoint table (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+            log_id INTEGER NOT NULL,  -- scraping_logs.id
+            url TEXT NOT NULL,
+            search_term TEXT,
+            status TEXT DEFAULT 'pending',  -- pending, done, failed
+            source TEXT,  -- browser or cache
+            attempts INTEGER DEFAULT 0,
+            jobs_found INTEGER DEFAULT 0,
+            jobs_added INTEGER DEFAULT 0,
+            seconds REAL,
+            error_message TEXT,
+            completed_at TIMESTAMP,
+            PRIMARY KEY (log_id, url)
+        )
+    """)
+
+
+def start_run(conn, url_terms: Dict[str, str], task_id: Optional[int] = None) -> Tuple[int, bool]:
+    """Create a scraping_logs run with a pending checkpoint per URL, or resume one.
+
+    Must be called while holding the scrape lock: any run still marked
+    in_progress then belongs to a process that died, and is marked
+    interrupted. A task that already has an interrupted or failed run
+    resumes that run. Returns (log_id, resumed).
+    """
+    cursor = conn.cursor()
+    cursor.execute("UPDATE scraping_logs SET status = 'interrupted' WHERE status = 'in_progress'")
+
+    if task_id is not None:
+        cursor.execute("""
+            SELECT id FROM scraping_logs
+            WHERE task_id = ? AND status IN ('interrupted', 'failed')
+            ORDER BY id DESC LIMIT 1
+        """, (task_id,))
+        row = cursor.fetchone()
+        if row:
+            cursor.execute("""
+                UPDATE scraping_logs
+                SET status = 'in_progress', error_message = NULL, completed_at = NULL,
+                    resumed = COALESCE(resumed, 0) + 1
+                WHERE id = ?
+            """, (row[0],))
+            conn.commit()
+            return row[0], True
+
+    cursor.execute("""
+        INSERT INTO scraping_logs (status, started_at, task_id)
+        VALUES ('in_progress', CURRENT_TIMESTAMP, ?)
+    """, (task_id,))
+    log_id = cursor.lastrowid
+    cursor.executemany("""
+        INSERT OR IGNORE INTO scrape_checkpoints (log_id, url, search_term) VALUES (?, ?, ?)
+    """, [(log_id, url, term) for url, term in url_terms.items()])
+    conn.commit()
+    return log_id, False
+
+
+def incomplete_urls(conn, log_id: int) -> List[str]:
+    """URLs of the run not yet done, in their original order"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT url FROM scrape_checkpoints
+        WHERE log_id = ? AND status != 'done'
+        ORDER BY rowid
+    """, (log_id,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def complete_url(conn, log_id: int, url: str, status: str, source: str, jobs_found: int = 0,
+                 jobs_added: int = 0, seconds: Optional[float] = None, error: Optional[str] = None):
+    """Record a URL's outcome; call only once its jobs are committed"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE scrape_checkpoints
+        SET status = ?, source = ?, attempts = attempts + 1, jobs_found = ?,
+            jobs_added = jobs_added + ?, seconds = ?, error_message = ?,
+            completed_at = CURRENT_TIMESTAMP
+        WHERE log_id = ? AND url = ?
+    """, (status, source, jobs_found, jobs_added, seconds, error, log_id, url))
+    conn.commit()
+
+
+def run_totals(conn, log_id: int) -> Dict:
+    """Checkpoint counts by status plus jobs found and added over all attempts"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT status, COUNT(*), COALESCE(SUM(jobs_found), 0), COALESCE(SUM(jobs_added), 0)
+        FROM scrape_checkpoints WHERE log_id = ?
+        GROUP BY status
+    """, (log_id,))
+    totals = {"pending": 0, "done": 0, "failed": 0, "jobs_found": 0, "jobs_added": 0}
+    for status, count, jobs_found, jobs_added in cursor.fetchall():
+        totals[status] = count
+        totals["jobs_found"] += jobs_found
+        totals["jobs_added"] += jobs_added
+    return totals
+
+
+def ingest_totals(conn, hours: float = 24) -> Dict:
+    """Jobs found and added by URLs completed in the last `hours`, by source (browser or cache)"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT source, SUM(jobs_found), SUM(jobs_added) FROM scrape_checkpoints
+        WHERE source IS NOT NULL AND completed_at > datetime('now', ?)
+        GROUP BY source
+    """, (f"-{hours} hours",))
+    return {source: {"jobs_found": found, "jobs_added": added} for source, found, added in cursor.fetchall()}
@@ -0,0 +1,96 @@
+"""
+Scrape Metrics
+Per-URL, per-stage timings of browser scrapes and the percentile summary
+served by /api/scrape/metrics
+"""
+
+import time
+from typing import Dict, List
+
+STAGES = ('driver_start', 'navigation', 'wait', 'extraction', 'scoring', 'db_write', 'driver_stop', 'total')
+TIMING_HISTORY_SECONDS = 30 * 24 * 3600
+
+
+def init_metrics_table(cursor):
+    """Create the stage timing table (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_stage_timings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            log_id INTEGER NOT NULL,  -- scraping_logs.id
+            url TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            jobs INTEGER DEFAULT 0,  -- jobs found, on the 'total' row
+            recorded_at REAL NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_scrape_stage_timings_recorded ON scrape_stage_timings(recorded_at)")
+
+
+def record_stage_timings(conn, log_id: int, url: str, stage_seconds: Dict[str, float], jobs: int):
+    """Store one URL's stage totals; stage_seconds should include 'total'"""
+    now = time.time()
+    cursor = conn.cursor()
+    cursor.executemany("""
+        INSERT INTO scrape_stage_timings (log_id, url, stage, seconds, jobs, recorded_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [
+        (log_id, url, stage, seconds, jobs if stage == 'total' else 0, now)
+        for stage, seconds in stage_seconds.items()
+    ])
+    cursor.execute("DELETE FROM scrape_stage_timings WHERE recorded_at < ?", (now - TIMING_HISTORY_SECONDS,))
+    conn.commit()
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    # Nearest-rank percentile
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _summary(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4),
+        "p50": round(_percentile(values, 0.50), 4),
+        "p90": round(_percentile(values, 0.90), 4),
+        "p99": round(_percentile(values, 0.99), 4),
+        "max": round(values[-1], 4),
+    }
+
+
+def stage_metrics(conn, hours: float = 24) -> Dict:
+    """Percentiles of seconds per URL for each stage, and jobs/sec, over the last `hours`"""
+    since = time.time() - hours * 3600
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT stage, seconds, jobs FROM scrape_stage_timings
+        WHERE recorded_at > ?
+    """, (since,))
+
+    by_stage = {}
+    jobs_per_second = []
+    total_jobs = 0
+    total_seconds = 0.0
+    for stage, seconds, jobs in cursor.fetchall():
+        by_stage.setdefault(stage, []).append(seconds)
+        if stage == 'total':
+            total_jobs += jobs
+            total_seconds += seconds
+            if seconds > 0:
+                jobs_per_second.append(jobs / seconds)
+
+    stages = {stage: _summary(by_stage[stage]) for stage in STAGES if stage in by_stage}
+    stages.update({stage: _summary(values) for stage, values in by_stage.items() if stage not in stages})
+    return {
+        "window_hours": hours,
+        "urls": len(by_stage.get('total', [])),
+        "stage_seconds_per_url": stages,
+        "jobs_per_second": {
+            "overall": round(total_jobs / total_seconds, 3) if total_seconds else None,
+            "per_url": _summary(jobs_per_second) if jobs_per_second else None,
+        },
+    }
+
+
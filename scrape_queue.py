@@ -0,0 +1,218 @@
+"""
+Scrape Task Queue
+Durable SQLite-backed queue of scrape tasks, claimed by out-of-process
+workers (scrape_worker.py) under renewable leases
+"""
+
+import json
+import time
+from typing import Dict, Optional, Set
+
+
+def init_queue_tables(cursor):
+    """Create the task and worker tables (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            config TEXT NOT NULL,  -- JSON ScrapingConfig
+            source TEXT DEFAULT 'manual',  -- 'manual' or 'auto'
+            status TEXT DEFAULT 'queued',  -- queued, running, completed, failed
+            attempts INTEGER DEFAULT 0,
+            max_attempts INTEGER DEFAULT 3,
+            lease_owner TEXT,
+            lease_expires_at REAL,
+            error_message TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            completed_at TIMESTAMP
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_scrape_tasks_status ON scrape_tasks(status, id)")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_workers (
+            worker_id TEXT PRIMARY KEY,
+            pid INTEGER,
+            hostname TEXT,
+            status TEXT,  -- idle, busy, stopped
+            current_task_id INTEGER,
+            started_at REAL,
+            heartbeat_at REAL
+        )
+    """)
+
+
+def enqueue_task(conn, config: Dict, source: str = "manual", max_attempts: int = 3) -> int:
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO scrape_tasks (config, source, max_attempts)
+        VALUES (?, ?, ?)
+    """, (json.dumps(config), source, max_attempts))
+    conn.commit()
+    return cursor.lastrowid
+
+
+def has_pending_task(conn, source: str) -> bool:
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT 1 FROM scrape_tasks
+        WHERE source = ? AND status IN ('queued', 'running')
+        LIMIT 1
+    """, (source,))
+    return cursor.fetchone() is not None
+
+
+def pending_search_terms(conn, source: str) -> Set[str]:
+    """Search terms of the queued or running tasks from source"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT config FROM scrape_tasks
+        WHERE source = ? AND status IN ('queued', 'running')
+    """, (source,))
+    return {term for (config,) in cursor.fetchall() for term in json.loads(config).get('search_terms', [])}
+
+
+def claim_task(conn, worker_id: str, lease_seconds: float) -> Optional[Dict]:
+    """Atomically lease the oldest queued task, or one whose lease has expired"""
+    now = time.time()
+    cursor = conn.cursor()
+    # BEGIN IMMEDIATE takes the write lock up front so two workers cannot
+    # select the same row
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute("""
+            SELECT id, config, attempts, max_attempts FROM scrape_tasks
+            WHERE status = 'queued'
+               OR (status = 'running' AND lease_expires_at < ?)
+            ORDER BY id
+            LIMIT 1
+        """, (now,))
+        row = cursor.fetchone()
+        if not row:
+            conn.commit()
+            return None
+
+        task_id, config, attempts, max_attempts = row
+        if attempts >= max_attempts:
+            # Its last holder died mid-run too many times
+            cursor.execute("""
+                UPDATE scrape_tasks
+                SET status = 'failed', error_message = 'lease expired on final attempt',
+                    lease_owner = NULL, completed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (task_id,))
+            conn.commit()
+            return claim_task(conn, worker_id, lease_seconds)
+
+        cursor.execute("""
+            UPDATE scrape_tasks
+            SET status = 'running', attempts = attempts + 1, lease_owner = ?,
+                lease_expires_at = ?, started_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (worker_id, now + lease_seconds, task_id))
+        conn.commit()
+        return {'id': task_id, 'config': json.loads(config), 'attempt': attempts + 1}
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def renew_lease(conn, task_id: int, worker_id: str, lease_seconds: float) -> bool:
+    """Extend a task lease; False means the lease was lost to another worker"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE scrape_tasks SET lease_expires_at = ?
+        WHERE id = ? AND lease_owner = ? AND status = 'running'
+    """, (time.time() + lease_seconds, task_id, worker_id))
+    conn.commit()
+    return cursor.rowcount == 1
+
+
+def complete_task(conn, task_id: int, worker_id: str):
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE scrape_tasks
+        SET status = 'completed', lease_owner = NULL, completed_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND lease_owner = ?
+    """, (task_id, worker_id))
+    conn.commit()
+
+
+def requeue_task(conn, task_id: int, worker_id: str):
+    """Give a claimed task back without counting the attempt"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE scrape_tasks
+        SET status = 'queued', attempts = MAX(attempts - 1, 0),
+            lease_owner = NULL, lease_expires_at = NULL
+        WHERE id = ? AND lease_owner = ?
+    """, (task_id, worker_id))
+    conn.commit()
+
+
+def fail_task(conn, task_id: int, worker_id: str, error: str):
+    """Requeue the task for another attempt, or fail it for good"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE scrape_tasks
+        SET status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END,
+            completed_at = CASE WHEN attempts < max_attempts THEN NULL ELSE CURRENT_TIMESTAMP END,
+            error_message = ?, lease_owner = NULL, lease_expires_at = NULL
+        WHERE id = ? AND lease_owner = ?
+    """, (error, task_id, worker_id))
+    conn.commit()
+
+
+def heartbeat_worker(conn, worker_id: str, status: str, task_id: Optional[int] = None,
+                     pid: Optional[int] = None, hostname: Optional[str] = None):
+    now = time.time()
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO scrape_workers (worker_id, pid, hostname, status, current_task_id, started_at, heartbeat_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(worker_id) DO UPDATE SET
+            status = excluded.status,
+            current_task_id = excluded.current_task_id,
+            heartbeat_at = excluded.heartbeat_at,
+            pid = COALESCE(excluded.pid, scrape_workers.pid),
+            hostname = COALESCE(excluded.hostname, scrape_workers.hostname)
+    """, (worker_id, pid, hostname, status, task_id, now, now))
+    conn.commit()
+
+
+def queue_status(conn, worker_timeout: float) -> Dict:
+    """Queue depth by status plus every worker seen recently"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT status, COUNT(*) FROM scrape_tasks GROUP BY status")
+    counts = dict(cursor.fetchall())
+
+    now = time.time()
+    cursor.execute("""
+        SELECT worker_id, pid, hostname, status, current_task_id, started_at, heartbeat_at
+        FROM scrape_workers
+        WHERE heartbeat_at > ?
+        ORDER BY worker_id
+    """, (now - 24 * 3600,))
+    workers = []
+    for worker_id, pid, hostname, status, task_id, started_at, heartbeat_at in cursor.fetchall():
+        alive = status != 'stopped' and now - heartbeat_at <= worker_timeout
+        workers.append({
+            "worker_id": worker_id,
+            "pid": pid,
+            "hostname": hostname,
+            "status": status if alive or status == 'stopped' else "unresponsive",
+            "current_task_id": task_id,
+            "uptime_seconds": round(now - started_at) if started_at else None,
+            "last_heartbeat_seconds_ago": round(now - heartbeat_at, 1),
+        })
+
+    return {
+        "queue": {
+            "queued": counts.get('queued', 0),
+            "running": counts.get('running', 0),
+            "completed": counts.get('completed', 0),
+            "failed": counts.get('failed', 0),
+        },
+        "workers": workers,
+        "workers_alive": sum(1 for w in workers if w["status"] in ("idle", "busy")),
+    }
@@ -0,0 +1,202 @@
+"""
+Scrape Worker
+Runs queued scrape tasks in a pool of worker processes, outside the API server.
+Scrapes are serialized by the global scrape lease, so one worker is the
+default; extra workers are standbys that take over when a worker dies.
+
+Usage:
+    python scrape_worker.py
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+
+from config import (
+    SCRAPE_TASK_LEASE_SECONDS,
+    SCRAPE_TASK_TIMEOUT_SECONDS,
+    SCRAPE_WORKER_POLL_SECONDS,
+    SCRAPE_WORKER_PROCESSES,
+)
+from leases import get_lease
+from scrape_queue import claim_task, complete_task, fail_task, heartbeat_worker, renew_lease, requeue_task
+
+logger = logging.getLogger("scrape_worker")
+
+
+class _Heartbeat(threading.Thread):
+    """Renews the task lease and worker heartbeat while a scrape runs.
+
+    Stops renewing once the task exceeds its timeout, so the supervisor sees
+    a stale heartbeat and replaces the process (e.g. after a hung driver).
+    """
+
+    def __init__(self, worker_id, task_id, lease_seconds, timeout_seconds):
+        super().__init__(daemon=True)
+        self.worker_id = worker_id
+        self.task_id = task_id
+        self.lease_seconds = lease_seconds
+        self.deadline = time.monotonic() + timeout_seconds
+        self.stopped = threading.Event()
+        self.lease_lost = False
+
+    def run(self):
+        from main import get_db_connection
+        conn = get_db_connection()
+        try:
+            while not self.stopped.wait(self.lease_seconds / 3):
+                if time.monotonic() > self.deadline:
+                    logger.error(f"Task {self.task_id} exceeded its timeout, no longer renewing lease")
+                    return
+                if not renew_lease(conn, self.task_id, self.worker_id, self.lease_seconds):
+                    self.lease_lost = True
+                    logger.error(f"Lost lease on task {self.task_id}")
+                    return
+                heartbeat_worker(conn, self.worker_id, 'busy', self.task_id)
+        finally:
+            conn.close()
+
+
+def worker_loop(worker_id, lease_seconds, timeout_seconds, poll_seconds, stop_event):
+    """Claim and run tasks until stop_event is set"""
+    # Imported here so each worker process loads the scraper in its own interpreter
+    from main import SCRAPE_LOCK_NAME, ScrapingConfig, get_db_connection, init_database, scrape_jobs_background
+
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s [{worker_id}] %(levelname)s %(message)s")
+    init_database()
+    conn = get_db_connection()
+    heartbeat_worker(conn, worker_id, 'idle', pid=os.getpid(), hostname=socket.gethostname())
+    logger.info("Worker started")
+
+    try:
+        while not stop_event.is_set():
+            # Only one scrape runs at a time; leave tasks queued rather than
+            # claiming and requeueing them while another worker scrapes
+            lock = get_lease(conn, SCRAPE_LOCK_NAME)
+            if lock and lock['active']:
+                heartbeat_worker(conn, worker_id, 'idle')
+                stop_event.wait(poll_seconds)
+                continue
+
+            task = claim_task(conn, worker_id, lease_seconds)
+            if not task:
+                heartbeat_worker(conn, worker_id, 'idle')
+                stop_event.wait(poll_seconds)
+                continue
+
+            logger.info(f"Running task {task['id']} (attempt {task['attempt']})")
+            heartbeat_worker(conn, worker_id, 'busy', task['id'])
+            heartbeat = _Heartbeat(worker_id, task['id'], lease_seconds, timeout_seconds)
+            heartbeat.start()
+            try:
+                ran = asyncio.run(scrape_jobs_background(ScrapingConfig(**task['config']), task_id=task['id']))
+                if ran is False:
+                    # Another process took the scrape lock after the check above; try again later
+                    requeue_task(conn, task['id'], worker_id)
+                    logger.info(f"Task {task['id']} requeued, another scrape is active")
+                    stop_event.wait(poll_seconds)
+                else:
+                    complete_task(conn, task['id'], worker_id)
+                    logger.info(f"Task {task['id']} completed")
+            except Exception as e:
+                logger.error(f"Task {task['id']} failed: {e}")
+                fail_task(conn, task['id'], worker_id, str(e))
+            finally:
+                heartbeat.stopped.set()
+                heartbeat.join()
+    finally:
+        heartbeat_worker(conn, worker_id, 'stopped')
+        conn.close()
+
+
+def _run_worker(worker_id, lease_seconds, timeout_seconds, poll_seconds):
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    worker_loop(worker_id, lease_seconds, timeout_seconds, poll_seconds, stop_event)
+
+
+def _last_heartbeat(worker_id):
+    from main import get_db_connection
+    conn = get_db_connection()
+    try:
+        row = conn.execute("SELECT heartbeat_at FROM scrape_workers WHERE worker_id = ?", (worker_id,)).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def run_pool(processes, lease_seconds, timeout_seconds, poll_seconds):
+    """Supervise `processes` workers, replacing any that exit or stop heartbeating"""
+    prefix = f"{socket.gethostname()}-{uuid.uuid4().hex[:6]}"
+    slots = {}
+    stopping = False
+
+    def stop(*_):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    def spawn(slot):
+        worker_id = f"{prefix}-{slot}-{uuid.uuid4().hex[:4]}"
+        process = mp.Process(
+            target=_run_worker,
+            args=(worker_id, lease_seconds, timeout_seconds, poll_seconds),
+            name=worker_id,
+        )
+        process.start()
+        slots[slot] = (worker_id, process, time.time())
+
+    for slot in range(processes):
+        spawn(slot)
+    print(f"🧵 Started {processes} scrape worker process(es)")
+    if processes > 1:
+        print("   Scrapes still run one at a time (scrape lease); the extra workers are standbys")
+
+    while not stopping:
+        time.sleep(poll_seconds)
+        for slot, (worker_id, process, spawned_at) in list(slots.items()):
+            if stopping:
+                break
+            heartbeat_at = _last_heartbeat(worker_id) or spawned_at
+            if not process.is_alive():
+                print(f"⚠️ Worker {worker_id} exited ({process.exitcode}), restarting")
+                spawn(slot)
+            elif time.time() - heartbeat_at > lease_seconds:
+                print(f"⚠️ Worker {worker_id} stopped heartbeating, replacing it")
+                process.kill()
+                process.join()
+                spawn(slot)
+
+    for worker_id, process, _ in slots.values():
+        process.terminate()
+    for worker_id, process, _ in slots.values():
+        # A worker mid-scrape finishes its current page wait first; don't wait forever
+        process.join(timeout=60)
+        if process.is_alive():
+            process.kill()
+            process.join()
+    print("✅ Scrape workers stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run scrape workers that consume the SQLite task queue")
+    parser.add_argument("--processes", type=int, default=SCRAPE_WORKER_PROCESSES, help="Worker processes to run")
+    parser.add_argument("--lease", type=float, default=SCRAPE_TASK_LEASE_SECONDS, help="Task lease seconds")
+    parser.add_argument("--timeout", type=float, default=SCRAPE_TASK_TIMEOUT_SECONDS, help="Max seconds per task")
+    parser.add_argument("--poll", type=float, default=SCRAPE_WORKER_POLL_SECONDS, help="Idle poll interval")
+    args = parser.parse_args()
+    run_pool(args.processes, args.lease, args.timeout, args.poll)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Persistent Browser Sessions
+Keeps Chrome profiles and Upwork cookies between runs so a verified session
+can be reused instead of starting cold (and re-solving verification) per URL
+"""
+
+import json
+import os
+import threading
+import time
+
+# Cookies and profiles are live Upwork logins, so they are kept outside the
+# repository, readable by the owner only
+DEFAULT_SESSION_DIR = os.getenv("BROWSER_SESSION_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "upwork_assistant", "browser_sessions"
+)
+DEFAULT_MAX_AGE_HOURS = 12
+
+# Cookie fields accepted back by Network.setCookies
+_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+# Markers of an interstitial verification page instead of search results
+_CHALLENGE_MARKERS = ('just a moment', 'verify you are human', 'challenges.cloudflare.com', 'cf-challenge')
+
+
+def profile_dir(slot, session_dir=DEFAULT_SESSION_DIR):
+    """Chrome user-data-dir for a browser slot.
+
+    Chrome locks a user-data-dir to one process, so every concurrent slot gets
+    its own profile; cookies are shared between them through SessionStore.
+    """
+    path = os.path.join(session_dir, f"chrome_profile_{slot}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def is_challenge_page(driver):
+    """True if the browser is showing a verification page rather than content"""
+    try:
+        title = (driver.title or '').lower()
+        source = driver.page_source[:20000].lower()
+    except Exception:
+        return False
+    return any(marker in title or marker in source for marker in _CHALLENGE_MARKERS)
+
+
+class SessionStore:
+    """Shared cookie jar with freshness tracking for all browser slots"""
+
+    def __init__(self, session_dir=DEFAULT_SESSION_DIR, max_age_hours=DEFAULT_MAX_AGE_HOURS):
+        self.session_dir = session_dir
+        self.max_age_seconds = max_age_hours * 3600
+        self.cookie_path = os.path.join(session_dir, "cookies.json")
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.cookie_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def status(self):
+        """Describe the stored session: age, cookie count and whether it is fresh"""
+        data = self._read()
+        if not data or not data.get('cookies'):
+            return {'fresh': False, 'reason': 'no saved session'}
+        now = time.time()
+        age = now - data.get('saved_at', 0)
+        expiries = [c['expires'] for c in data['cookies'] if c.get('expires', -1) > 0]
+        # The earliest expiring persistent cookie bounds how long the session lasts
+        expires_at = min(expiries) if expiries else None
+        reason = None
+        if data.get('invalidated'):
+            reason = 'invalidated after a verification page'
+        elif age > self.max_age_seconds:
+            reason = f'older than {self.max_age_seconds // 3600}h'
+        elif expires_at is not None and expires_at <= now:
+            reason = 'cookies expired'
+        return {
+            'fresh': reason is None,
+            'reason': reason,
+            'age_seconds': round(age),
+            'cookies': len(data['cookies']),
+            'expires_at': expires_at,
+        }
+
+    def is_fresh(self):
+        return self.status()['fresh']
+
+    def restore(self, driver):
+        """Load saved cookies into a new browser before its first navigation"""
+        data = self._read()
+        if not data or not data.get('cookies'):
+            return 0
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': data['cookies']})
+        return len(data['cookies'])
+
+    def save(self, driver):
+        """Persist every cookie of the browser (all domains) as the new session"""
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        cookies = [
+            {field: cookie[field] for field in _COOKIE_FIELDS if field in cookie}
+            for cookie in cookies
+        ]
+        # Session cookies report expires=-1 and must be sent without it
+        for cookie in cookies:
+            if cookie.get('expires', -1) <= 0:
+                cookie.pop('expires', None)
+        self._write({'saved_at': time.time(), 'cookies': cookies})
+        return len(cookies)
+
+    def invalidate(self):
+        data = self._read()
+        if data:
+            data['invalidated'] = True
+            self._write(data)
+
+    def _write(self, data):
+        os.makedirs(self.session_dir, mode=0o700, exist_ok=True)
+        with self._lock:
+            tmp_path = f"{self.cookie_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cookie_path)
@@ -0,0 +1,61 @@
+"""
+File Lock
+Exclusive lock on a lock file, shared by every process that opens the same
+path (fcntl on POSIX, msvcrt on Windows)
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+RETRY_SECONDS = 0.05
+
+
+def _acquire(f, blocking):
+    if fcntl:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            return True
+        except BlockingIOError:
+            return False
+    while True:
+        f.seek(0)
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(RETRY_SECONDS)
+
+
+def _release(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path, blocking=True):
+    """Hold the lock on `path` (created if missing) for the body.
+
+    Yields True once held; with blocking=False, yields False straight away
+    when another process holds it.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a+b') as f:
+        if not _acquire(f, blocking):
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            _release(f)
@@ -0,0 +1,192 @@
+"""
+Offline Upwork Job Extraction
+Runs the live viewer's selector cascade over saved page_source HTML, without a browser
+"""
+
+import concurrent.futures as cf
+import contextlib
+import glob
+import os
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from scrapper.upwork_job_scrapper import extract_comprehensive_job_data
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_BASE_URL = "https://www.upwork.com"
+
+# Elements that start a new line in rendered text (approximates innerText)
+_BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+    'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'tr', 'ul'
+}
+# Elements whose content is never rendered as text
+_HIDDEN_TAGS = {'head', 'script', 'style', 'noscript', 'template', 'svg', 'iframe'}
+_WHITESPACE = re.compile(r'\s+')
+_DISPLAY_NONE = re.compile(r'display\s*:\s*none')
+
+
+@lru_cache(maxsize=512)
+def _compile_selector(selector):
+    """Compile a CSS selector once per process"""
+    return CSSSelector(selector)
+
+
+def _is_hidden(element):
+    if element.tag in _HIDDEN_TAGS or element.get('hidden') is not None:
+        return True
+    style = element.get('style')
+    return bool(style and _DISPLAY_NONE.search(style))
+
+
+def _inner_text(element):
+    """Approximate Selenium's WebElement.text: visible text, one line per block"""
+    chunks = []
+
+    def walk(node):
+        if not isinstance(node.tag, str) or _is_hidden(node):
+            return
+        block = node.tag in _BLOCK_TAGS
+        if block:
+            chunks.append('\n')
+        if node.tag == 'br':
+            chunks.append('\n')
+        if node.text:
+            chunks.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                chunks.append(child.tail)
+        if block:
+            chunks.append('\n')
+
+    walk(element)
+    lines = (_WHITESPACE.sub(' ', line).strip() for line in ''.join(chunks).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class HtmlElement:
+    """Minimal WebElement stand-in backed by an lxml element"""
+
+    def __init__(self, element, base_url=DEFAULT_BASE_URL):
+        self._element = element
+        self._base_url = base_url
+
+    def find_elements(self, by, value):
+        if by == By.CSS_SELECTOR:
+            matches = _compile_selector(value)(self._element)
+        elif by == By.TAG_NAME:
+            matches = self._element.iter(value)
+        else:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+        return [HtmlElement(match, self._base_url) for match in matches if match is not self._element]
+
+    def find_element(self, by, value):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {by}={value!r}")
+        return elements[0]
+
+    @property
+    def text(self):
+        return _inner_text(self._element)
+
+    @property
+    def tag_name(self):
+        return self._element.tag
+
+    def get_attribute(self, name):
+        value = self._element.get(name)
+        # Selenium returns the resolved property for links, not the raw attribute
+        if value is not None and name in ('href', 'src'):
+            return urljoin(self._base_url, value)
+        return value
+
+
+class HtmlPage(HtmlElement):
+    """Minimal WebDriver stand-in over a saved page_source"""
+
+    def __init__(self, page_source, base_url=DEFAULT_BASE_URL):
+        super().__init__(lxml.html.document_fromstring(page_source), base_url)
+        self.page_source = page_source
+        self.current_url = base_url
+
+
+def extract_jobs_from_html(page_source, base_url=DEFAULT_BASE_URL, quiet=True, known_ids=None):
+    """Run the full extraction cascade (including text fallback) over raw HTML"""
+    page = HtmlPage(page_source, base_url)
+    if not quiet:
+        return extract_comprehensive_job_data(page, known_ids=known_ids)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return extract_comprehensive_job_data(page, known_ids=known_ids)
+
+
+def save_page_fixture(page_source, url, fixture_dir=FIXTURES_DIR, name=None):
+    """Record a page_source so it can be replayed offline"""
+    os.makedirs(fixture_dir, exist_ok=True)
+    if not name:
+        query = re.search(r'[?&]q=([^&]+)', url)
+        page = re.search(r'[?&]page=(\d+)', url)
+        slug = re.sub(r'[^a-z0-9]+', '_', (query.group(1) if query else 'page').lower()).strip('_')
+        name = f"search_{slug}_page{page.group(1) if page else 1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    path = os.path.join(fixture_dir, f"{name}.html")
+    with open(path, 'w', encoding='utf-8') as f:
+        # First line carries the source URL so relative links resolve on replay
+        f.write(f"<!-- source-url: {url} -->\n")
+        f.write(page_source)
+    return path
+
+
+def load_page_fixture(path):
+    """Read a recorded fixture, returning (page_source, base_url)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        page_source = f.read()
+    match = re.match(r'<!-- source-url: (\S+) -->', page_source)
+    return page_source, match.group(1) if match else DEFAULT_BASE_URL
+
+
+def list_page_fixtures(fixture_dir=FIXTURES_DIR):
+    return sorted(glob.glob(os.path.join(fixture_dir, "*.html")))
+
+
+def _extract_fixture(path):
+    started = time.perf_counter()
+    page_source, base_url = load_page_fixture(path)
+    jobs = extract_jobs_from_html(page_source, base_url)
+    return path, jobs, time.perf_counter() - started
+
+
+def extract_fixtures(paths=None, workers=None):
+    """Extract every fixture in a process pool.
+
+    Returns a list of {'path', 'jobs', 'seconds'} dicts in input order.
+    """
+    paths = list(paths) if paths is not None else list_page_fixtures()
+    if workers == 1:
+        extracted = map(_extract_fixture, paths)
+        return [{'path': path, 'jobs': jobs, 'seconds': elapsed} for path, jobs, elapsed in extracted]
+
+    with cf.ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+        extracted = executor.map(_extract_fixture, paths, chunksize=chunksize)
+        return [{'path': path, 'jobs': jobs, 'seconds': elapsed} for path, jobs, elapsed in extracted]
+
+
+if __name__ == "__main__":
+    import sys
+
+    fixture_paths = sys.argv[1:] or list_page_fixtures()
+    for result in extract_fixtures(fixture_paths, workers=1):
+        print(f"📄 {os.path.basename(result['path'])}: {len(result['jobs'])} jobs in {result['seconds'] * 1000:.1f} ms")
+        for job in result['jobs'][:3]:
+            print(f"   - {job.get('title', 'N/A')[:70]}")
@@ -0,0 +1,216 @@
+"""
+Append-only Job Store
+Saved extraction results as immutable NDJSON segments plus a persistent
+SQLite dedup index keyed by job ID, so each save costs O(new jobs) instead
+of rewriting the whole history
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import time
+
+from scrapper.file_lock import file_lock
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "job_store")
+
+# Segments below this size are merged once there are more than
+# COMPACT_MIN_SEGMENTS of them; larger segments are never rewritten
+COMPACT_BELOW_BYTES = 4 * 1024 * 1024
+COMPACT_MIN_SEGMENTS = 16
+
+
+def dedup_key(job):
+    """Stable Upwork job ID, or the lowercased title for jobs without one"""
+    if job.get('id'):
+        return f"id:{job['id']}"
+    title = (job.get('title') or '').lower().strip()
+    if title and title != 'n/a':
+        return f"title:{title}"
+    return None
+
+
+class JobStore:
+    """Append-only NDJSON segments with a dedup index and a streaming reader"""
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR, compact_below_bytes=COMPACT_BELOW_BYTES,
+                 compact_min_segments=COMPACT_MIN_SEGMENTS):
+        self.store_dir = store_dir
+        self.segment_dir = os.path.join(store_dir, "segments")
+        # Held while segments are merged or read, so no process deletes a
+        # segment another one is using
+        self.lock_path = os.path.join(store_dir, "compact.lock")
+        self.compact_below_bytes = compact_below_bytes
+        self.compact_min_segments = compact_min_segments
+        os.makedirs(self.segment_dir, exist_ok=True)
+        self._index = sqlite3.connect(os.path.join(store_dir, "index.db"), timeout=30)
+        self._index.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                key TEXT PRIMARY KEY,
+                segment TEXT NOT NULL
+            )
+        """)
+        self._index.commit()
+
+    def close(self):
+        self._index.close()
+
+    def segments(self):
+        """Segment file names, oldest first"""
+        return sorted(name for name in os.listdir(self.segment_dir) if name.endswith(".ndjson"))
+
+    def __len__(self):
+        return self._index.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def append(self, jobs):
+        """Write the jobs not already stored as a new segment.
+
+        Returns (saved, duplicates). Only the new jobs' keys are looked up in
+        the index, so the cost does not depend on how much is stored.
+        """
+        new_jobs = []
+        keys = set()
+        for job in jobs:
+            key = dedup_key(job)
+            if key is None or key in keys:
+                continue
+            if self._index.execute("SELECT 1 FROM jobs WHERE key = ?", (key,)).fetchone():
+                continue
+            keys.add(key)
+            new_jobs.append((key, job))
+        duplicates = len(jobs) - len(new_jobs)
+        if not new_jobs:
+            return 0, duplicates
+
+        segment = f"segment_{time.time_ns()}.ndjson"
+        path = os.path.join(self.segment_dir, segment)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for _, job in new_jobs:
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+        try:
+            self._index.executemany(
+                "INSERT OR IGNORE INTO jobs (key, segment) VALUES (?, ?)",
+                [(key, segment) for key, _ in new_jobs],
+            )
+            # The segment only becomes visible once its keys are indexed
+            os.replace(tmp_path, path)
+            self._index.commit()
+        except Exception:
+            self._index.rollback()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self._small_segments_count() > self.compact_min_segments:
+            # Left to the next save if another process is compacting or reading
+            self.compact(wait=False)
+        return len(new_jobs), duplicates
+
+    def iter_jobs(self):
+        """Yield every stored job, oldest first, one line at a time.
+
+        Compaction waits until the iteration is finished or closed.
+        """
+        with file_lock(self.lock_path):
+            for segment in self.segments():
+                with open(os.path.join(self.segment_dir, segment), 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+
+    def _small_segments(self):
+        return [
+            segment for segment in self.segments()
+            if os.path.getsize(os.path.join(self.segment_dir, segment)) < self.compact_below_bytes
+        ]
+
+    def _small_segments_count(self):
+        return len(self._small_segments())
+
+    def compact(self, wait=True):
+        """Merge all small segments into one, dropping repeated keys.
+
+        Runs under the store's file lock; with wait=False it returns 0 at
+        once when another process holds it. Returns the number of segments
+        merged.
+        """
+        with file_lock(self.lock_path, blocking=wait) as locked:
+            return self._compact() if locked else 0
+
+    def _compact(self):
+        # Listed under the lock, so these are not another compaction's inputs
+        small = self._small_segments()
+        if len(small) < 2:
+            return 0
+
+        # Named after the newest input so segment order stays chronological
+        merged = small[-1] if small[-1].endswith("_c.ndjson") else small[-1].replace(".ndjson", "_c.ndjson")
+        merged_path = os.path.join(self.segment_dir, merged)
+        seen = set()
+        with open(f"{merged_path}.tmp", 'w', encoding='utf-8') as out:
+            for segment in small:
+                with open(os.path.join(self.segment_dir, segment), 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        key = dedup_key(json.loads(line))
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        out.write(line if line.endswith("\n") else line + "\n")
+
+        placeholders = ",".join("?" * len(small))
+        self._index.execute(f"UPDATE jobs SET segment = ? WHERE segment IN ({placeholders})", [merged, *small])
+        os.replace(f"{merged_path}.tmp", merged_path)
+        self._index.commit()
+        for segment in small:
+            if segment != merged:
+                os.remove(os.path.join(self.segment_dir, segment))
+        return len(small)
+
+    def export_csv(self, csv_path):
+        """Stream the store into a CSV file; columns are the union of job fields"""
+        fieldnames = set()
+        for job in self.iter_jobs():
+            fieldnames.update(job.keys())
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=sorted(fieldnames))
+            writer.writeheader()
+            for job in self.iter_jobs():
+                writer.writerow(job)
+        return csv_path
+
+
+def save_jobs(jobs, store_dir=DEFAULT_STORE_DIR):
+    """Append jobs to the store at store_dir and report what was saved"""
+    store = JobStore(store_dir)
+    try:
+        saved, duplicates = store.append(jobs)
+        print(f"📊 Duplicate check results:")
+        print(f"   Total extracted: {len(jobs)}")
+        print(f"   Duplicates found: {duplicates}")
+        print(f"   New jobs saved: {saved}")
+        print(f"💾 Job store: {store.store_dir} ({len(store)} jobs, {len(store.segments())} segments)")
+        return saved
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect, compact or export the job store")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR, help="Store directory")
+    parser.add_argument("--compact", action="store_true", help="Merge small segments")
+    parser.add_argument("--export-csv", help="Write every stored job to this CSV file")
+    args = parser.parse_args()
+
+    store = JobStore(args.store)
+    if args.compact:
+        print(f"🗜️ Merged {store.compact()} segments")
+    if args.export_csv:
+        print(f"💾 Exported to {store.export_csv(args.export_csv)}")
+    print(f"📦 {len(store)} jobs in {len(store.segments())} segments")
+    store.close()
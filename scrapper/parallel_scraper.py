@@ -0,0 +1,168 @@
+"""
+Parallel Upwork Scraping
+Fans search URLs out over a bounded number of browser slots with per-domain
+politeness limits, yielding each URL's jobs as soon as it finishes, and
+streams single jobs from the browser threads to an async consumer
+"""
+
+import asyncio
+import concurrent.futures as cf
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class DomainThrottle:
+    """Caps concurrent requests per domain and spaces out their start times.
+
+    acquire() holds one of the domain's slots for a whole fetch; page loads
+    within a fetch (e.g. pagination) call wait_turn() from their thread so
+    they are spaced out with every other request to the domain.
+    """
+
+    def __init__(self, max_per_domain=1, min_interval=0.0):
+        self.max_per_domain = max(1, max_per_domain)
+        self.min_interval = max(0.0, min_interval)
+        self._semaphores = {}
+        self._next_start = {}
+        # Taken from the event loop and scraper threads, never held across a wait
+        self._lock = threading.Lock()
+
+    def _reserve(self, url):
+        """Reserve the next start slot for the URL's domain; returns (domain, seconds to wait)"""
+        domain = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(domain, now))
+            self._next_start[domain] = start_at + self.min_interval
+        return domain, start_at - now
+
+    async def acquire(self, url):
+        domain = urlparse(url).netloc.lower()
+        semaphore = self._semaphores.setdefault(domain, asyncio.Semaphore(self.max_per_domain))
+        await semaphore.acquire()
+        _, delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return domain
+
+    def wait_turn(self, url):
+        """Block the calling (scraper) thread until url may be loaded"""
+        _, delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self, domain):
+        self._semaphores[domain].release()
+
+
+async def scrape_urls(urls, fetch, concurrency=2, per_domain=1, min_interval=0.0):
+    """Run fetch(url, slot, wait_turn) for every URL and yield results as they complete.
+
+    `slot` is an integer in [0, concurrency) identifying the browser context
+    the call runs in, so a slot never drives two pages at once. The first
+    page load is throttled before fetch is called; fetch must call
+    wait_turn(page_url) before loading any further page.
+
+    Yields dicts with url, jobs, error and seconds.
+    """
+    concurrency = max(1, concurrency)
+    slots = asyncio.Queue()
+    for slot in range(concurrency):
+        slots.put_nowait(slot)
+    throttle = DomainThrottle(per_domain, min_interval)
+    loop = asyncio.get_running_loop()
+
+    # Not a `with` block: its shutdown(wait=True) would block the event loop
+    # until running fetches finish whenever the consumer stops early
+    executor = cf.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="scrape")
+
+    async def run(url):
+        slot = await slots.get()
+        domain = await throttle.acquire(url)
+        started = time.perf_counter()
+        try:
+            jobs = await loop.run_in_executor(executor, fetch, url, slot, throttle.wait_turn)
+            return {'url': url, 'jobs': jobs or [], 'error': None, 'seconds': time.perf_counter() - started}
+        except Exception as e:
+            return {'url': url, 'jobs': [], 'error': str(e), 'seconds': time.perf_counter() - started}
+        finally:
+            throttle.release(domain)
+            slots.put_nowait(slot)
+
+    tasks = [asyncio.ensure_future(run(url)) for url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Queued fetches are dropped; running ones finish in their threads
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class JobStream:
+    """Bounded hand-off of jobs from scraper threads to an async consumer.
+
+    put() blocks the scraper thread while the queue is full, so a slow
+    consumer throttles extraction instead of buffering without limit. Once
+    the consumer calls close(), further jobs are dropped so no thread stays
+    blocked.
+    """
+
+    def __init__(self, maxsize, loop):
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = loop
+        self.closed = threading.Event()
+
+    def put(self, job):
+        """Called from scraper threads"""
+        if self.closed.is_set():
+            return
+        future = asyncio.run_coroutine_threadsafe(self.queue.put(job), self.loop)
+        while True:
+            try:
+                future.result(timeout=1)
+                return
+            except cf.TimeoutError:
+                if self.closed.is_set():
+                    future.cancel()
+                    return
+
+    async def extend(self, jobs):
+        """Called from the event loop, e.g. for jobs served from a cache"""
+        for job in jobs:
+            await self.queue.put(job)
+
+    async def finish(self):
+        """Called by the producer once every URL is done"""
+        await self.queue.put(None)
+
+    def close(self):
+        self.closed.set()
+
+    async def batches(self, batch_size, max_wait):
+        """Yield lists of up to batch_size jobs until finish() is called.
+
+        A batch is flushed when full or max_wait seconds after its first job,
+        so the first jobs of a run are written without waiting for more.
+        """
+        while True:
+            job = await self.queue.get()
+            if job is None:
+                return
+            batch = [job]
+            deadline = self.loop.time() + max_wait
+            while len(batch) < batch_size:
+                timeout = deadline - self.loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    job = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if job is None:
+                    yield batch
+                    return
+                batch.append(job)
+            yield batch
@@ -0,0 +1,294 @@
+"""
+Browser Request Blocking
+Blocking profiles that keep Chrome from loading images, fonts, media and
+third-party trackers the job extraction never uses, plus a per-page report
+of the requests and bytes that were saved
+"""
+
+import json
+import threading
+import urllib.request
+from fnmatch import fnmatch
+from functools import lru_cache
+
+import websocket
+
+TRACKER_PATTERNS = [
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*facebook.com/tr*",
+    "*connect.facebook.net*",
+    "*bat.bing.com*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*static.ads-twitter.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*segment.io*",
+    "*cdn.segment.com*",
+    "*nr-data.net*",
+    "*js-agent.newrelic.com*",
+    "*browser-intake-datadoghq.com*",
+    "*sentry.io*",
+    "*cookielaw.org*",
+    "*onetrust.com*",
+    "*qualtrics.com*",
+]
+IMAGE_PATTERNS = ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico*", "*.svg*"]
+FONT_PATTERNS = ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"]
+MEDIA_PATTERNS = ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*"]
+
+# Resources the search page needs to render job tiles; never blocked
+DEFAULT_ALLOWLIST = [
+    "*://www.upwork.com/api/*",
+    "*://www.upwork.com/nx/*",
+    "*static-upwork.com*.js*",
+    "*static-upwork.com*.css*",
+    "*challenges.cloudflare.com*",
+]
+
+BLOCKING_PROFILES = {
+    'off': {
+        'patterns': [],
+        'content_settings': {},
+    },
+    'standard': {
+        'patterns': TRACKER_PATTERNS + IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS,
+        'content_settings': {'notifications': 2},
+    },
+    # Also disables image loading in the renderer; blocked images are then
+    # never requested, so they no longer show up in the savings report
+    'aggressive': {
+        'patterns': TRACKER_PATTERNS + IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS,
+        'content_settings': {'notifications': 2, 'images': 2, 'popups': 2, 'geolocation': 2},
+    },
+}
+
+# Typical transfer sizes, used to estimate bytes saved for requests that were
+# blocked before any response existed
+ESTIMATED_BYTES_BY_TYPE = {
+    'Image': 30_000,
+    'Font': 45_000,
+    'Media': 400_000,
+    'Script': 60_000,
+    'Stylesheet': 20_000,
+    'XHR': 2_000,
+    'Fetch': 2_000,
+    'Ping': 500,
+    'Other': 5_000,
+}
+
+
+def resolve_blocking_profile(name='standard'):
+    """Return (blocked_url_patterns, content_settings) for a profile name"""
+    if name not in BLOCKING_PROFILES:
+        raise ValueError(f"Unknown blocking profile '{name}'. Choose from: {', '.join(BLOCKING_PROFILES)}")
+    profile = BLOCKING_PROFILES[name]
+    return list(profile['patterns']), dict(profile['content_settings'])
+
+
+def is_allowlisted(url, allowlist):
+    return any(fnmatch(url, allowed) for allowed in allowlist)
+
+
+def is_blocked_url(url, patterns, allowlist):
+    """The blocking rule: a URL is blocked if it matches a pattern and no allowlist entry"""
+    return any(fnmatch(url, pattern) for pattern in patterns) and not is_allowlisted(url, allowlist)
+
+
+def patterns_overlap(first, second):
+    """True if some URL matches both wildcard patterns ('*' and '?' as in fnmatch)"""
+
+    @lru_cache(maxsize=None)
+    def match(i, j):
+        if i == len(first) and j == len(second):
+            return True
+        # A '*' may match nothing
+        if i < len(first) and first[i] == '*' and match(i + 1, j):
+            return True
+        if j < len(second) and second[j] == '*' and match(i, j + 1):
+            return True
+        if i == len(first) or j == len(second):
+            return False
+        # Otherwise both patterns consume the same character
+        if first[i] == '*':
+            return match(i, j + 1)
+        if second[j] == '*':
+            return match(i + 1, j)
+        return (first[i] == second[j] or '?' in (first[i], second[j])) and match(i + 1, j + 1)
+
+    return match(0, 0)
+
+
+def narrow_patterns(patterns, allowlist):
+    """Patterns that cannot block any allowlisted URL, for blocking without interception"""
+    return [
+        pattern for pattern in patterns
+        if not any(patterns_overlap(pattern, allowed) for allowed in allowlist)
+    ]
+
+
+def apply_chrome_options(chrome_options, name='standard', collect_stats=True):
+    """Set content-setting prefs and performance logging before Chrome starts"""
+    _, content_settings = resolve_blocking_profile(name)
+    if content_settings:
+        chrome_options.add_experimental_option('prefs', {
+            f"profile.managed_default_content_settings.{setting}": value
+            for setting, value in content_settings.items()
+        })
+    if collect_stats:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+class RequestInterceptor:
+    """Blocks requests through the DevTools Fetch domain on its own connection
+    to the page.
+
+    Network.setBlockedURLs has no exception syntax, so instead requests
+    matching a blocked pattern are paused and then either failed or, when
+    allowlisted, continued (is_blocked_url). The handler thread ends when
+    the browser closes the connection.
+    """
+
+    def __init__(self, websocket_url, patterns, allowlist):
+        self.websocket_url = websocket_url
+        self.patterns = patterns
+        self.allowlist = allowlist
+        self.blocked = 0
+        self.allowed = 0
+        self._socket = None
+        self._next_id = 0
+
+    def start(self):
+        # Chrome rejects DevTools websockets with an unexpected Origin header
+        self._socket = websocket.create_connection(self.websocket_url, timeout=10, suppress_origin=True)
+        enable_id = self._send('Fetch.enable', {'patterns': [{'urlPattern': pattern} for pattern in self.patterns]})
+        # Wait for the acknowledgement, so the next navigation is intercepted
+        while json.loads(self._socket.recv()).get('id') != enable_id:
+            pass
+        self._socket.settimeout(None)
+        threading.Thread(target=self._run, name='request-interceptor', daemon=True).start()
+
+    def _send(self, method, params):
+        self._next_id += 1
+        self._socket.send(json.dumps({'id': self._next_id, 'method': method, 'params': params}))
+        return self._next_id
+
+    def _run(self):
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+            except (websocket.WebSocketException, OSError, ValueError):
+                return
+            if message.get('method') != 'Fetch.requestPaused':
+                continue
+            params = message['params']
+            try:
+                if is_blocked_url(params['request']['url'], self.patterns, self.allowlist):
+                    self.blocked += 1
+                    self._send('Fetch.failRequest', {'requestId': params['requestId'], 'errorReason': 'BlockedByClient'})
+                else:
+                    self.allowed += 1
+                    self._send('Fetch.continueRequest', {'requestId': params['requestId']})
+            except (websocket.WebSocketException, OSError):
+                return
+
+
+def _page_websocket_url(driver):
+    """DevTools websocket URL of the driver's page, from chromedriver's debugger address"""
+    address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+    with urllib.request.urlopen(f"http://{address}/json", timeout=10) as response:
+        targets = json.load(response)
+    return next(target['webSocketDebuggerUrl'] for target in targets if target.get('type') == 'page')
+
+
+def apply_url_blocking(driver, name='standard', allowlist=None):
+    """Block the profile's URL patterns, except allowlisted URLs.
+
+    Uses a RequestInterceptor; if the page's DevTools websocket cannot be
+    reached, falls back to Network.setBlockedURLs with only the patterns
+    that cannot match an allowlisted URL (narrow_patterns). Returns the
+    patterns in effect.
+    """
+    patterns, _ = resolve_blocking_profile(name)
+    allowlist = DEFAULT_ALLOWLIST if allowlist is None else allowlist
+    try:
+        RequestInterceptor(_page_websocket_url(driver), patterns, allowlist).start()
+        return patterns
+    except Exception as e:
+        patterns = narrow_patterns(patterns, allowlist)
+        print(f"⚠️ Request interception unavailable ({e}), blocking {len(patterns)} patterns that miss the allowlist")
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    return patterns
+
+
+def summarize_network_log(entries, allowlist=None):
+    """Summarize Chrome performance-log entries for one page load.
+
+    Returns request and byte totals, blocked counts per resource type and an
+    estimate of the bytes the blocked requests would have transferred.
+    Requests are judged by the same allowlist rule as is_blocked_url: a
+    blocked request that is allowlisted is reported as an allowlist
+    violation, not as a saving.
+    """
+    allowlist = DEFAULT_ALLOWLIST if allowlist is None else allowlist
+    requests = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        method = message.get('method')
+        params = message.get('params', {})
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            requests.setdefault(request_id, {}).update({
+                'url': params.get('request', {}).get('url', ''),
+                'type': params.get('type') or 'Other',
+            })
+        elif method == 'Network.loadingFinished':
+            requests.setdefault(request_id, {})['bytes'] = params.get('encodedDataLength', 0)
+        elif method == 'Network.loadingFailed' and (
+                params.get('blockedReason') or params.get('errorText') == 'net::ERR_BLOCKED_BY_CLIENT'):
+            requests.setdefault(request_id, {}).update({
+                'blocked': True,
+                'type': params.get('type') or requests.get(request_id, {}).get('type') or 'Other',
+            })
+
+    blocked_by_type = {}
+    bytes_loaded = 0
+    estimated_bytes_saved = 0
+    allowlist_violations = []
+    for request in requests.values():
+        if request.get('blocked') and is_allowlisted(request.get('url', ''), allowlist):
+            allowlist_violations.append(request['url'])
+        elif request.get('blocked'):
+            resource_type = request.get('type', 'Other')
+            blocked_by_type[resource_type] = blocked_by_type.get(resource_type, 0) + 1
+            estimated_bytes_saved += ESTIMATED_BYTES_BY_TYPE.get(resource_type, ESTIMATED_BYTES_BY_TYPE['Other'])
+        else:
+            bytes_loaded += request.get('bytes', 0)
+
+    return {
+        'requests_total': len(requests),
+        'requests_blocked': sum(blocked_by_type.values()),
+        'blocked_by_type': blocked_by_type,
+        'bytes_loaded': bytes_loaded,
+        'estimated_bytes_saved': estimated_bytes_saved,
+        'allowlist_violations': allowlist_violations,
+    }
+
+
+def print_network_report(report):
+    saved_kb = report['estimated_bytes_saved'] / 1024
+    loaded_kb = report['bytes_loaded'] / 1024
+    print(f"🛡️ Blocked {report['requests_blocked']}/{report['requests_total']} requests, "
+          f"~{saved_kb:.0f} KB saved, {loaded_kb:.0f} KB loaded")
+    if report['blocked_by_type']:
+        print("   " + ", ".join(f"{kind}: {count}" for kind, count in sorted(report['blocked_by_type'].items())))
+    for url in report['allowlist_violations']:
+        print(f"   ⚠️ Allowlisted resource was blocked: {url}")
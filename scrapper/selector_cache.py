@@ -0,0 +1,184 @@
+"""
+Adaptive Selector Cache
+Remembers which CSS selector worked for each extracted field so the
+extraction cascade tries it first on the next card, page and run
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from scrapper.file_lock import file_lock
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "selector_stats.json")
+
+# Weight given to history when updating a selector's success score
+SCORE_DECAY = 0.8
+# Score assumed for selectors that have never been tried
+UNSEEN_SCORE = 0.5
+# Consecutive misses after which a selector is moved behind all others
+DEMOTE_AFTER = 5
+
+# Attribute, class or id constraints; a selector without one only names tags
+_SPECIFIC_PART = re.compile(r"\[[^\]]+\]|[.#][\w-]+")
+
+
+def is_broad_selector(selector):
+    """Fallbacks such as `article`, `h2 a` or `*[class*='card']`: tag-only
+    selectors and substring attribute matches, which also match unrelated
+    elements"""
+    if '*=' in selector:
+        return True
+    return not _SPECIFIC_PART.search(selector)
+
+
+class SelectorCache:
+    """Per-field selector hit/latency statistics with persistent ordering"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, decay=SCORE_DECAY, demote_after=DEMOTE_AFTER):
+        self.path = path
+        self.decay = decay
+        self.demote_after = demote_after
+        self._fields = {}
+        # Counts recorded since the last save, added to the file's on save
+        self._unsaved = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=DEFAULT_CACHE_PATH, **kwargs):
+        cache = cls(path, **kwargs)
+        if path:
+            cache._fields = _read_fields(path)
+        return cache
+
+    def order(self, field, selectors):
+        """Return selectors best-first: specific before broad fallbacks, then
+        within each group demoted last, then by score, then original order.
+
+        A broad fallback never ranks above a specific selector, however often
+        it matched, since it may be matching unrelated elements.
+        """
+        with self._lock:
+            return self._order(field, selectors)
+
+    def _order(self, field, selectors):
+        # Caller holds self._lock
+        stats = self._fields.get(field) or {}
+
+        def rank(item):
+            index, selector = item
+            entry = stats.get(selector)
+            if not entry:
+                return (is_broad_selector(selector), False, -UNSEEN_SCORE, index)
+            return (is_broad_selector(selector), entry['failure_streak'] >= self.demote_after, -entry['score'], index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record(self, field, selector, matched, seconds):
+        with self._lock:
+            entry = self._fields.setdefault(field, {}).setdefault(selector, _new_entry())
+            unsaved = self._unsaved.setdefault(field, {}).setdefault(selector, _new_entry())
+            for counts in (entry, unsaved):
+                counts['attempts'] += 1
+                counts['total_ms'] += seconds * 1000
+                counts['hits'] += 1 if matched else 0
+            entry['score'] = self.decay * entry['score'] + (1 - self.decay) * (1.0 if matched else 0.0)
+            entry['failure_streak'] = 0 if matched else entry['failure_streak'] + 1
+
+    def stats(self):
+        """Per-field, per-selector hit counts and latency, best selector first"""
+        report = {}
+        with self._lock:
+            for field, selectors in self._fields.items():
+                rows = []
+                for selector in self._order(field, list(selectors)):
+                    entry = selectors[selector]
+                    rows.append({
+                        'selector': selector,
+                        'attempts': entry['attempts'],
+                        'hits': entry['hits'],
+                        'hit_rate': round(entry['hits'] / entry['attempts'], 3) if entry['attempts'] else 0.0,
+                        'avg_ms': round(entry['total_ms'] / entry['attempts'], 3) if entry['attempts'] else 0.0,
+                        'demoted': entry['failure_streak'] >= self.demote_after,
+                    })
+                report[field] = rows
+        return report
+
+    def print_summary(self):
+        print("📊 Selector cache stats:")
+        for field, rows in self.stats().items():
+            attempts = sum(row['attempts'] for row in rows)
+            hits = sum(row['hits'] for row in rows)
+            best = rows[0]['selector'] if rows else 'N/A'
+            print(f"   {field}: {attempts} queries, {hits} hits, best={best}")
+
+    def save(self):
+        """Merge the counts recorded since the last save into the file.
+
+        Scrape workers share the file, so it is re-read under a file lock and
+        this process's counts are added to it; a selector's score and failure
+        streak are this process's latest where it recorded that selector.
+        Afterwards this cache holds the merged stats of all processes.
+        """
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        with file_lock(f"{self.path}.lock"), self._lock:
+            fields = _read_fields(self.path)
+            for field, selectors in self._unsaved.items():
+                for selector, counts in selectors.items():
+                    entry = fields.setdefault(field, {}).setdefault(selector, _new_entry())
+                    for key in ('attempts', 'hits', 'total_ms'):
+                        entry[key] += counts[key]
+                    latest = self._fields[field][selector]
+                    entry['score'] = latest['score']
+                    entry['failure_streak'] = latest['failure_streak']
+
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'updated_at': time.time(), 'fields': fields}, f, indent=2)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            self._fields = fields
+            self._unsaved = {}
+
+
+def _new_entry():
+    return {
+        'attempts': 0,
+        'hits': 0,
+        'total_ms': 0.0,
+        'score': UNSEEN_SCORE,
+        'failure_streak': 0,
+    }
+
+
+def _read_fields(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('fields', {})
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Ignoring unreadable selector cache {path}: {e}")
+        return {}
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_selector_cache():
+    """Process-wide cache loaded from disk on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SelectorCache.load()
+        return _default_cache
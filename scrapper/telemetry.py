@@ -0,0 +1,26 @@
+"""
+Scrape Telemetry
+Wall-clock time per scrape stage (driver start, navigation, waits,
+extraction, scoring, DB writes), collected per URL
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Accumulates seconds per named stage; a stage may be entered many times"""
+
+    def __init__(self):
+        self.totals = {}
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds):
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
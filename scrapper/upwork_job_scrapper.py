@@ -8,12 +8,25 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
+import os
 import time
-import csv
-import json
-import glob
 import re
 from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from scrapper.browser_session import is_challenge_page, profile_dir
+from scrapper.job_store import DEFAULT_STORE_DIR, save_jobs
+from scrapper.request_blocking import (
+    apply_chrome_options,
+    apply_url_blocking,
+    print_network_report,
+    summarize_network_log,
+)
+from scrapper.selector_cache import get_selector_cache
+from scrapper.telemetry import StageTimer
+
+# Job URLs end in "<slug>_~<ciphertext>/", the ciphertext is stable per posting
+JOB_ID_PATTERN = re.compile(r'_(~[0-9A-Za-z]+)')
 
 
 def convert_relative_time_to_timestamp(relative_time_str):
@@ -81,8 +94,14 @@ def convert_relative_time_to_timestamp(relative_time_str):
     return now.isoformat()
 
 
-def create_manual_browser():
-    """Create a browser that looks like manual usage"""
+def create_manual_browser(blocking_profile='standard', session_slot=None):
+    """Create a browser that looks like manual usage
+
+    blocking_profile names a scrapper.request_blocking profile ('off',
+    'standard', 'aggressive') that keeps images, fonts, media and trackers
+    from loading. With a session_slot the browser runs on that slot's
+    persistent Chrome profile instead of a throwaway one.
+    """
     chrome_options = Options()
     
     # Minimal options to appear human
@@ -95,118 +114,385 @@ def create_manual_browser():
     chrome_options.add_argument("--disable-extensions-except")
     chrome_options.add_argument("--disable-plugins-discovery")
     
+    if session_slot is not None:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir(session_slot)}")
+    
+    if blocking_profile != 'off':
+        apply_chrome_options(chrome_options, blocking_profile)
+    
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     
     # Minimal stealth
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
+    if blocking_profile != 'off':
+        blocked = apply_url_blocking(driver, blocking_profile)
+        print(f"🛡️ Request blocking '{blocking_profile}': {len(blocked)} URL patterns")
+    
     return driver
 
 
-def manual_upwork_viewer(url):
-    """Open Upwork and wait for manual interaction"""
+def report_network_savings(driver):
+    """Print and return the request/byte savings for the page load just finished"""
+    try:
+        report = summarize_network_log(driver.get_log('performance'))
+    except Exception as e:
+        print(f"   ⚠️ Network stats unavailable: {e}")
+        return None
+    print_network_report(report)
+    return report
+
+
+def extract_job_id(job_url):
+    """Return the stable Upwork job ID (the '~0...' ciphertext) from a job URL"""
+    if not job_url:
+        return None
+    match = JOB_ID_PATTERN.search(job_url)
+    return match.group(1) if match else None
+
+
+def search_page_url(url, page):
+    """Return the search URL pointing at the given results page"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != 'page']
+    if page > 1:
+        query.append(('page', str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query, safe=',+')))
+
+
+def manual_upwork_viewer(url, fixture_dir=None, known_ids=None, max_pages=1, blocking_profile='standard',
+                         session=None, session_slot=0, on_job=None, stage_timer=None, wait_turn=None):
+    """Open Upwork and wait for manual interaction
+
+    If fixture_dir is given, the loaded page_source is recorded there so the
+    page can be replayed later with scrapper.html_extractor.
+
+    With max_pages > 1 the viewer follows pagination in the same browser and
+    stops at the first page whose tiles are all in known_ids. Tiles already
+    in known_ids are returned as {'id', 'title', 'job_url', 'known': True}
+    stubs without extracting their remaining fields.
+
+    blocking_profile is passed to create_manual_browser; unless it is 'off',
+    the requests and bytes saved are reported after every page load.
+
+    With a SessionStore in session, the browser uses slot session_slot's
+    persistent profile and the shared cookies. A fresh session skips the
+    manual verification countdown; a session that lands on a verification
+    page is invalidated and the countdown runs as usual.
+
+    on_job is called with every new job as soon as it is extracted, so callers
+    can ingest jobs long before the returned list (which waits for all pages
+    and the keep-open period) is available.
+
+    stage_timer, a scrapper.telemetry.StageTimer, receives the seconds spent
+    in driver_start, navigation, wait, extraction and driver_stop.
+
+    wait_turn(page_url) is called before each pagination page load, so the
+    caller's per-domain throttle (scrapper.parallel_scraper.DomainThrottle)
+    spaces those loads too; url itself is expected to be throttled already.
+
+    Errors (e.g. a crashed browser) are raised once the browser is closed,
+    so callers can record the URL as failed and retry it.
+    """
     print("🌐 Manual Upwork Viewer")
     print("=" * 30)
     print(f"🔗 Opening: {url}")
+    timer = stage_timer or StageTimer()
     
-    driver = create_manual_browser()
+    with timer.stage('driver_start'):
+        driver = create_manual_browser(blocking_profile, session_slot if session else None)
     
     try:
+        warm_session = False
+        if session:
+            session_status = session.status()
+            if session_status['fresh']:
+                with timer.stage('driver_start'):
+                    restored = session.restore(driver)
+                warm_session = restored > 0
+                print(f"🍪 Restored {restored} cookies from a session saved {session_status['age_seconds']}s ago")
+            else:
+                print(f"🍪 No fresh session ({session_status['reason']}), starting cold")
+        
         # Open the URL
-        driver.get(url)
+        with timer.stage('navigation'):
+            driver.get(url)
         print("✅ Page opened in browser")
         
-        print("\n📋 INSTRUCTIONS:")
-        print("1. The browser window is now open")
-        print("2. Manually solve any verification if needed")
-        print("3. Wait for the job listings to load")
-        print("4. Extraction will start automatically in 20 seconds...")
+        if warm_session and is_challenge_page(driver):
+            print("⚠️ Saved session was challenged, it will be refreshed after verification")
+            session.invalidate()
+            warm_session = False
         
-        # Auto-start after 20 seconds with countdown
-        print("\n⏰ Auto-extraction countdown:")
-        for i in range(20, 0, -1):
-            print(f"   Starting in {i} seconds...", end='\r')
-            time.sleep(1)
+        if not warm_session:
+            print("\n📋 INSTRUCTIONS:")
+            print("1. The browser window is now open")
+            print("2. Manually solve any verification if needed")
+            print("3. Wait for the job listings to load")
+            print("4. Extraction will start automatically in 20 seconds...")
+            
+            # Auto-start after 20 seconds with countdown
+            print("\n⏰ Auto-extraction countdown:")
+            with timer.stage('wait'):
+                for i in range(20, 0, -1):
+                    print(f"   Starting in {i} seconds...", end='\r')
+                    time.sleep(1)
         print("\n🚀 Starting extraction now!                    ")
         
-        # Wait a bit more for dynamic content to load
-        print("⏳ Waiting for page content to fully load...")
-        time.sleep(5)
-        
-        print("\n🔍 Attempting to extract visible content...")
+        jobs = []
+        for page in range(1, max_pages + 1):
+            if page > 1:
+                page_url = search_page_url(url, page)
+                print(f"\n📄 Opening page {page}: {page_url}")
+                if wait_turn:
+                    with timer.stage('wait'):
+                        wait_turn(page_url)
+                with timer.stage('navigation'):
+                    driver.get(page_url)
+            
+            # Wait a bit more for dynamic content to load
+            print("⏳ Waiting for page content to fully load...")
+            with timer.stage('wait'):
+                time.sleep(5)
+            
+            if blocking_profile != 'off':
+                report_network_savings(driver)
+            
+            if fixture_dir:
+                from scrapper.html_extractor import save_page_fixture
+                fixture_path = save_page_fixture(driver.page_source, driver.current_url, fixture_dir)
+                print(f"💾 Recorded page fixture: {fixture_path}")
+            
+            print("\n🔍 Attempting to extract visible content...")
+            
+            # Extract comprehensive job data
+            with timer.stage('extraction'):
+                page_jobs = extract_comprehensive_job_data(driver, known_ids=known_ids, on_job=on_job)
+            
+            # If no jobs found, try waiting longer and retry
+            if not page_jobs:
+                print("⏳ No jobs found, waiting 10 more seconds and retrying...")
+                with timer.stage('wait'):
+                    time.sleep(10)
+                with timer.stage('extraction'):
+                    page_jobs = extract_comprehensive_job_data(driver, known_ids=known_ids, on_job=on_job)
+            
+            # An unsolved verification is a failed scrape, not a search without results
+            if not page_jobs and is_challenge_page(driver):
+                raise RuntimeError(f"Verification page not solved on page {page}")
+            
+            jobs.extend(page_jobs)
+            new_count = sum(1 for job in page_jobs if not job.get('known'))
+            print(f"📊 Page {page}: {len(page_jobs)} tiles, {new_count} new")
+            if new_count == 0:
+                # Nothing new here, so later (older) pages have nothing new either
+                break
         
-        # Extract comprehensive job data
-        jobs = extract_comprehensive_job_data(driver)
+        selector_cache = get_selector_cache()
+        selector_cache.print_summary()
+        try:
+            selector_cache.save()
+        except OSError as e:
+            # Only costs the ordering hints, not this scrape's jobs
+            print(f"⚠️ Could not save selector cache: {e}")
         
-        # If no jobs found, try waiting longer and retry
-        if not jobs:
-            print("⏳ No jobs found, waiting 10 more seconds and retrying...")
-            time.sleep(10)
-            jobs = extract_comprehensive_job_data(driver)
+        # Only a session that reached real results is worth reusing
+        if session and jobs and not is_challenge_page(driver):
+            saved = session.save(driver)
+            print(f"🍪 Saved {saved} cookies for the next session")
         
         return jobs
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        return []
+        raise
     
     finally:
         print("\n🔄 Keeping browser open for 30 more seconds...")
         print("   You can manually copy any job information you see")
-        time.sleep(30)
-        driver.quit()
+        with timer.stage('wait'):
+            time.sleep(30)
+        with timer.stage('driver_stop'):
+            driver.quit()
         print("✅ Browser closed")
 
 
-def extract_comprehensive_job_data(driver):
-    """Extract comprehensive job data from the loaded page"""
+# Selector cascades, most specific first. The selector cache reorders them
+# per field based on what matched on previous cards and runs.
+JOB_CONTAINER_SELECTORS = [
+    "article[data-test='JobTile']",  # From new HTML structure
+    "article[data-test='job-tile']",
+    "[data-test='JobTile']",
+    "section[data-test='job-tile']",
+    "div[data-cy='job-tile']",
+    ".job-tile",
+    "article[data-testid*='job']",
+    "div[data-testid*='job']",
+    ".job-card",
+    ".up-card-section",
+    "article",
+    "section",
+    "div[class*='job']",
+    "div[class*='card']"
+]
+
+TITLE_SELECTORS = [
+    "a[data-test='job-tile-title-link UpLink']",  # New selector from HTML
+    ".job-tile-title a",  # New selector from HTML
+    "h2 a", "h3 a", "h4 a", "h5 a",
+    "[data-test='JobTileTitle'] a",
+    "[data-test='job-title'] a",
+    "a[href*='/jobs/']",
+    "a"
+]
+
+DESCRIPTION_SELECTORS = [
+    "[data-test='UpCLineClamp JobDescription'] p",  # New selector from HTML
+    "[data-test='JobDescription']",
+    "[data-test='job-description']",
+    ".job-description",
+    "p",
+    "div p"
+]
+
+BUDGET_SELECTORS = [
+    "li[data-test='job-type-label']",  # New selector from HTML
+    "li[data-test='is-fixed-price']",  # New selector from HTML
+    "[data-test='BudgetAmount']",
+    "[data-test='budget']",
+    ".budget",
+    ".rate",
+    "*[class*='budget']",
+    "*[class*='rate']"
+]
+
+SKILLS_SELECTORS = [
+    "button[data-test='token']",  # New selector from HTML
+    "[data-test='SkillItem']",
+    "[data-test='skill']",
+    ".skill",
+    ".tag",
+    "*[class*='skill']",
+    "*[class*='tag']"
+]
+
+JOB_TYPE_SELECTORS = [
+    "li[data-test='job-type-label']",  # New selector from HTML
+    "[data-test='JobType']",
+    "[data-test='job-type']",
+    "*[class*='type']"
+]
+
+CLIENT_SELECTORS = [
+    "[data-test='ClientSpendingAndHistory']",
+    "[data-test='client']",
+    "*[class*='client']",
+    "*[class*='spending']"
+]
+
+POSTED_TIME_SELECTORS = [
+    "small[data-test='job-pubilshed-date']",  # New selector from HTML
+    "[data-test='PostedTime']",
+    "[data-test='posted']",
+    "*[class*='posted']",
+    "*[class*='time']",
+    "time"
+]
+
+
+def query_first(context, field, selectors, parse, selector_cache=None):
+    """Try selectors in cached best-first order and return the first parsed match.
+
+    parse receives the matched elements and returns a value, or a falsy value
+    if the match is unusable. Every attempt is recorded in the selector cache.
+    """
+    cache = selector_cache or get_selector_cache()
+    for selector in cache.order(field, selectors):
+        started = time.perf_counter()
+        try:
+            value = parse(context.find_elements(By.CSS_SELECTOR, selector))
+        except Exception:
+            value = None
+        cache.record(field, selector, bool(value), time.perf_counter() - started)
+        if value:
+            return value
+    return None
+
+
+def _parse_containers(elements):
+    return elements if len(elements) > 2 else None  # Found meaningful results
+
+
+def _parse_title(elements):
+    title = elements[0].text.strip() if elements else ''
+    return (title, elements[0].get_attribute('href')) if title else None
+
+
+def _parse_description(elements):
+    parts = [text for text in (elem.text.strip() for elem in elements) if len(text) > 10]
+    return ' '.join(parts[:3])
+
+
+def _parse_budget(elements):
+    texts = (elem.text.strip() for elem in elements)
+    return ', '.join(text for text in texts if '$' in text or 'hour' in text.lower())
+
+
+def _parse_skills(elements):
+    skills = [text for text in (elem.text.strip() for elem in elements) if text and len(text) < 50]
+    return ', '.join(skills[:10])  # Limit to 10 skills
+
+
+def _parse_job_type(elements):
+    for elem in elements:
+        text = elem.text.strip().lower()
+        if 'hourly' in text or 'fixed' in text:
+            return text.title()
+    return None
+
+
+def _parse_client_info(elements):
+    return ', '.join(text for text in (elem.text.strip() for elem in elements) if text)
+
+
+def _parse_posted_time(elements):
+    for elem in elements:
+        text = elem.text.strip()
+        if 'ago' in text.lower() or 'hour' in text.lower() or 'day' in text.lower():
+            return text
+    return None
+
+
+def extract_comprehensive_job_data(driver, selector_cache=None, known_ids=None, on_job=None):
+    """Extract comprehensive job data from the loaded page
+
+    on_job, if given, is called with each new (not known) job as soon as its
+    card is extracted, before the rest of the page is processed.
+    """
     print("🔍 Extracting comprehensive job data...")
     jobs = []
+    cache = selector_cache or get_selector_cache()
     
     try:
         # Strategy 1: Look for job cards/containers
-        job_containers = []
-        
-        # Try multiple selectors for job containers
-        selectors = [
-            "article[data-test='JobTile']",  # From new HTML structure
-            "article[data-test='job-tile']",
-            "[data-test='JobTile']",
-            "section[data-test='job-tile']",
-            "div[data-cy='job-tile']",
-            ".job-tile",
-            "article[data-testid*='job']",
-            "div[data-testid*='job']",
-            ".job-card",
-            ".up-card-section",
-            "article",
-            "section",
-            "div[class*='job']",
-            "div[class*='card']"
-        ]
-        
-        for selector in selectors:
-            try:
-                containers = driver.find_elements(By.CSS_SELECTOR, selector)
-                if containers and len(containers) > 2:  # Found meaningful results
-                    job_containers = containers
-                    print(f"   ✅ Found {len(containers)} job containers using: {selector}")
-                    break
-            except:
-                continue
+        job_containers = query_first(driver, 'job_containers', JOB_CONTAINER_SELECTORS, _parse_containers, cache)
         
         if not job_containers:
             print("   ⚠️ No job containers found, trying text extraction...")
-            return extract_jobs_from_text(driver)
+            return _emit_jobs(extract_jobs_from_text(driver), on_job)
+        print(f"   ✅ Found {len(job_containers)} job containers")
         
         # Extract data from each job container
         for i, container in enumerate(job_containers, 1):
             try:
-                job_data = extract_single_job(container, i)
+                job_data = extract_single_job(container, i, cache, known_ids)
                 if job_data and job_data.get('title') and job_data['title'] != 'N/A':
                     jobs.append(job_data)
-                    print(f"   ✓ Job {i}: {job_data['title'][:50]}...")
+                    if not job_data.get('known'):
+                        print(f"   ✓ Job {i}: {job_data['title'][:50]}...")
+                        if on_job:
+                            on_job(job_data)
             except Exception as e:
                 print(f"   ✗ Error extracting job {i}: {e}")
                 continue
@@ -216,183 +502,47 @@ def extract_comprehensive_job_data(driver):
         
     except Exception as e:
         print(f"❌ Error in comprehensive extraction: {e}")
-        return extract_jobs_from_text(driver)
+        return _emit_jobs(extract_jobs_from_text(driver), on_job)
+
 
+def _emit_jobs(jobs, on_job):
+    if on_job:
+        for job in jobs:
+            on_job(job)
+    return jobs
 
-def extract_single_job(container, position):
-    """Extract detailed data from a single job container"""
+
+def extract_single_job(container, position, selector_cache=None, known_ids=None):
+    """Extract detailed data from a single job container.
+
+    Each field costs one query when its cached best selector still matches.
+    Jobs whose ID is in known_ids stop after the title and are marked known.
+    """
+    cache = selector_cache or get_selector_cache()
     job_data = {
         'position': position,
         'scraped_at': datetime.now().isoformat()
     }
     
     # Extract title and URL
-    title_selectors = [
-        "a[data-test='job-tile-title-link UpLink']",  # New selector from HTML
-        ".job-tile-title a",  # New selector from HTML
-        "h2 a", "h3 a", "h4 a", "h5 a",
-        "[data-test='JobTileTitle'] a",
-        "[data-test='job-title'] a",
-        "a[href*='/jobs/']",
-        "a"
-    ]
-    
-    for selector in title_selectors:
-        try:
-            title_elem = container.find_element(By.CSS_SELECTOR, selector)
-            job_data['title'] = title_elem.text.strip()
-            job_data['job_url'] = title_elem.get_attribute('href')
-            if job_data['title']:
-                break
-        except:
-            continue
-    
-    if not job_data.get('title'):
-        job_data['title'] = 'N/A'
-        job_data['job_url'] = 'N/A'
-    
-    # Extract description
-    desc_selectors = [
-        "[data-test='UpCLineClamp JobDescription'] p",  # New selector from HTML
-        "[data-test='JobDescription']",
-        "[data-test='job-description']",
-        ".job-description",
-        "p",
-        "div p"
-    ]
-    
-    description_parts = []
-    for selector in desc_selectors:
-        try:
-            desc_elems = container.find_elements(By.CSS_SELECTOR, selector)
-            for elem in desc_elems:
-                text = elem.text.strip()
-                if text and len(text) > 10:
-                    description_parts.append(text)
-        except:
-            continue
-    
-    job_data['description'] = ' '.join(description_parts[:3]) if description_parts else 'N/A'
-    
-    # Extract budget/rate information
-    budget_selectors = [
-        "li[data-test='job-type-label']",  # New selector from HTML
-        "li[data-test='is-fixed-price']",  # New selector from HTML
-        "[data-test='BudgetAmount']",
-        "[data-test='budget']",
-        ".budget",
-        ".rate",
-        "*[class*='budget']",
-        "*[class*='rate']"
-    ]
-    
-    budget_info = []
-    for selector in budget_selectors:
-        try:
-            budget_elems = container.find_elements(By.CSS_SELECTOR, selector)
-            for elem in budget_elems:
-                text = elem.text.strip()
-                if '$' in text or 'hour' in text.lower():
-                    budget_info.append(text)
-        except:
-            continue
-    
-    job_data['budget'] = ', '.join(budget_info) if budget_info else 'N/A'
-    
-    # Extract skills
-    skills_selectors = [
-        "button[data-test='token']",  # New selector from HTML
-        "[data-test='SkillItem']",
-        "[data-test='skill']",
-        ".skill",
-        ".tag",
-        "*[class*='skill']",
-        "*[class*='tag']"
-    ]
-    
-    skills = []
-    for selector in skills_selectors:
-        try:
-            skill_elems = container.find_elements(By.CSS_SELECTOR, selector)
-            for elem in skill_elems:
-                text = elem.text.strip()
-                if text and len(text) < 50:
-                    skills.append(text)
-        except:
-            continue
-    
-    job_data['skills'] = ', '.join(skills[:10]) if skills else 'N/A'  # Limit to 10 skills
-    
-    # Extract job type (hourly/fixed)
-    type_selectors = [
-        "li[data-test='job-type-label']",  # New selector from HTML
-        "[data-test='JobType']",
-        "[data-test='job-type']",
-        "*[class*='type']"
-    ]
-    
-    job_type = 'N/A'
-    for selector in type_selectors:
-        try:
-            type_elems = container.find_elements(By.CSS_SELECTOR, selector)
-            for elem in type_elems:
-                text = elem.text.strip().lower()
-                if 'hourly' in text or 'fixed' in text:
-                    job_type = text.title()
-                    break
-        except:
-            continue
-        if job_type != 'N/A':
-            break
-    
-    job_data['job_type'] = job_type
-    
-    # Extract client information
-    client_selectors = [
-        "[data-test='ClientSpendingAndHistory']",
-        "[data-test='client']",
-        "*[class*='client']",
-        "*[class*='spending']"
-    ]
-    
-    client_info = []
-    for selector in client_selectors:
-        try:
-            client_elems = container.find_elements(By.CSS_SELECTOR, selector)
-            for elem in client_elems:
-                text = elem.text.strip()
-                if text:
-                    client_info.append(text)
-        except:
-            continue
-    
-    job_data['client_info'] = ', '.join(client_info) if client_info else 'N/A'
-    
-    # Extract posted time
-    time_selectors = [
-        "small[data-test='job-pubilshed-date']",  # New selector from HTML
-        "[data-test='PostedTime']",
-        "[data-test='posted']",
-        "*[class*='posted']",
-        "*[class*='time']",
-        "time"
-    ]
-    
-    posted_time = 'N/A'
-    for selector in time_selectors:
-        try:
-            time_elems = container.find_elements(By.CSS_SELECTOR, selector)
-            for elem in time_elems:
-                text = elem.text.strip()
-                if 'ago' in text.lower() or 'hour' in text.lower() or 'day' in text.lower():
-                    posted_time = text
-                    break
-        except:
-            continue
-        if posted_time != 'N/A':
-            break
+    title_link = query_first(container, 'title', TITLE_SELECTORS, _parse_title, cache)
+    job_data['title'], job_data['job_url'] = title_link or ('N/A', 'N/A')
+    
+    job_id = extract_job_id(job_data['job_url'])
+    if job_id:
+        job_data['id'] = job_id
+        if known_ids is not None and job_id in known_ids:
+            job_data['known'] = True
+            return job_data
+    
+    job_data['description'] = query_first(container, 'description', DESCRIPTION_SELECTORS, _parse_description, cache) or 'N/A'
+    job_data['budget'] = query_first(container, 'budget', BUDGET_SELECTORS, _parse_budget, cache) or 'N/A'
+    job_data['skills'] = query_first(container, 'skills', SKILLS_SELECTORS, _parse_skills, cache) or 'N/A'
+    job_data['job_type'] = query_first(container, 'job_type', JOB_TYPE_SELECTORS, _parse_job_type, cache) or 'N/A'
+    job_data['client_info'] = query_first(container, 'client_info', CLIENT_SELECTORS, _parse_client_info, cache) or 'N/A'
     
     # Convert relative time to actual timestamp
+    posted_time = query_first(container, 'posted_time', POSTED_TIME_SELECTORS, _parse_posted_time, cache) or 'N/A'
     job_data['posted_time'] = convert_relative_time_to_timestamp(posted_time)
     
     # Extract any additional text content for context
@@ -449,104 +599,22 @@ def extract_jobs_from_text(driver):
         return jobs
         
     except Exception as e:
+        # The last fallback; an unreadable page is a failed scrape, not an empty one
         print(f"   ❌ Text extraction failed: {e}")
-        return []
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return []
-    
-    finally:
-        print("\n🔄 Keeping browser open for 30 more seconds...")
-        print("   You can manually copy any job information you see")
-        time.sleep(30)
-        driver.quit()
-        print("✅ Browser closed")
+        raise
 
 
 def save_manual_results(jobs, filename="manual_upwork_extraction"):
-    """Save manually extracted results with duplicate prevention"""
+    """Append manually extracted results to the job store named filename.
+
+    Jobs already stored (by job ID, or title for jobs without one) are
+    skipped; use `python -m scrapper.job_store --export-csv` for a CSV.
+    """
     if not jobs:
         print("❌ No jobs to save")
         return
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    csv_file = f"{filename}_{timestamp}.csv"
-    json_file = f"{filename}_{timestamp}.json"
-    
-    # Check for existing CSV file to avoid duplicates
-    existing_jobs = []
-    existing_titles = set()
-    
-    # Look for existing CSV files
-    import glob
-    existing_csv_files = glob.glob(f"{filename}_*.csv")
-    
-    if existing_csv_files:
-        # Read the most recent existing file
-        latest_csv = max(existing_csv_files)
-        print(f"📄 Found existing file: {latest_csv}")
-        
-        try:
-            import pandas as pd
-            existing_df = pd.read_csv(latest_csv)
-            existing_jobs = existing_df.to_dict('records')
-            existing_titles = set(existing_df['title'].str.lower() if 'title' in existing_df.columns else [])
-            print(f"   Loaded {len(existing_jobs)} existing jobs")
-        except:
-            # Fallback to manual CSV reading
-            try:
-                with open(latest_csv, 'r', encoding='utf-8') as f:
-                    import csv as csv_module
-                    reader = csv_module.DictReader(f)
-                    existing_jobs = list(reader)
-                    existing_titles = set(job.get('title', '').lower() for job in existing_jobs)
-                    print(f"   Loaded {len(existing_jobs)} existing jobs (manual)")
-            except Exception as e:
-                print(f"   ⚠️ Could not read existing file: {e}")
-    
-    # Filter out duplicates
-    new_jobs = []
-    duplicate_count = 0
-    
-    for job in jobs:
-        job_title = job.get('title', '').lower().strip()
-        if job_title and job_title not in existing_titles and job_title != 'n/a':
-            new_jobs.append(job)
-            existing_titles.add(job_title)
-        else:
-            duplicate_count += 1
-    
-    print(f"📊 Duplicate check results:")
-    print(f"   Total extracted: {len(jobs)}")
-    print(f"   Duplicates found: {duplicate_count}")
-    print(f"   New jobs to save: {len(new_jobs)}")
-    
-    # Combine existing and new jobs
-    all_jobs = existing_jobs + new_jobs
-    
-    # Save to CSV
-    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-        if all_jobs:
-            fieldnames = set()
-            for job in all_jobs:
-                fieldnames.update(job.keys())
-            fieldnames = sorted(list(fieldnames))
-            
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for job in all_jobs:
-                writer.writerow(job)
-    
-    # Save to JSON
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-    
-    print(f"💾 Results saved to: {csv_file}")
-    print(f"💾 Results saved to: {json_file}")
-    print(f"📈 Total jobs in database: {len(all_jobs)}")
-    
-    return csv_file, json_file
+    return save_jobs(jobs, os.path.join(os.path.dirname(DEFAULT_STORE_DIR), filename))
 
 
 if __name__ == "__main__":
@@ -563,7 +631,10 @@ if __name__ == "__main__":
     proceed = input("\n❓ Do you want to proceed? (y/N): ").strip().lower()
     
     if proceed in ['y', 'yes']:
-        jobs = manual_upwork_viewer(url)
+        try:
+            jobs = manual_upwork_viewer(url)
+        except Exception:
+            jobs = []
         
         if jobs:
             save_manual_results(jobs)
@@ -0,0 +1,246 @@
+"""
+Skill Index
+Mines a ranked, weighted skill list from the stored GitHub corpus (README
+texts, descriptions, topics) against a skill vocabulary. The index is cached
+per corpus hash, so it is only recomputed after a refresh changes READMEs.
+"""
+
+import hashlib
+import json
+import math
+import re
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+# Canonical skill -> phrases that count as a mention (lowercase, space separated)
+SKILL_VOCABULARY = {
+    'python': ['python', 'python3'],
+    'javascript': ['javascript', 'js'],
+    'typescript': ['typescript'],
+    'react': ['react', 'reactjs', 'react js'],
+    'next.js': ['next.js', 'nextjs'],
+    'vue': ['vue', 'vuejs', 'vue.js'],
+    'node.js': ['nodejs', 'node.js', 'express'],
+    'fastapi': ['fastapi'],
+    'django': ['django'],
+    'flask': ['flask'],
+    'golang': ['golang'],
+    'rust': ['rust'],
+    'java': ['java'],
+    'c++': ['c++', 'cpp'],
+    'c#': ['c#', 'csharp', 'dotnet', 'asp.net'],
+    'php': ['php', 'laravel'],
+    'sql': ['sql', 'sqlite', 'mysql'],
+    'postgres': ['postgres', 'postgresql'],
+    'mongodb': ['mongodb', 'mongo'],
+    'redis': ['redis'],
+    'docker': ['docker', 'dockerfile', 'docker compose'],
+    'kubernetes': ['kubernetes', 'k8s', 'helm'],
+    'aws': ['aws', 'amazon web services', 'aws lambda'],
+    'gcp': ['gcp', 'google cloud'],
+    'azure': ['azure'],
+    'terraform': ['terraform'],
+    'github-actions': ['github actions', 'github-actions'],
+    'api': ['api', 'rest api', 'restful', 'graphql'],
+    'automation': ['automation', 'automate', 'automated', 'workflow automation'],
+    'n8n': ['n8n'],
+    'web scraping': ['web scraping', 'scraper', 'scraping', 'selenium', 'playwright', 'beautifulsoup'],
+    'machine learning': ['machine learning', 'ml', 'scikit-learn', 'sklearn', 'xgboost'],
+    'deep learning': ['deep learning', 'pytorch', 'tensorflow', 'keras', 'neural network'],
+    'llm': ['llm', 'llms', 'openai', 'gpt', 'langchain', 'rag', 'large language model'],
+    'nlp': ['nlp', 'natural language processing', 'transformers', 'spacy'],
+    'computer vision': ['computer vision', 'opencv', 'yolo', 'image classification'],
+    'data science': ['data science', 'pandas', 'numpy', 'jupyter', 'data analysis'],
+    'data engineering': ['etl', 'airflow', 'spark', 'data pipeline', 'dbt'],
+    'chatbot': ['chatbot', 'chat bot', 'telegram bot', 'discord bot'],
+    'mobile': ['android', 'ios', 'flutter', 'react native', 'kotlin', 'swift'],
+}
+FIELD_WEIGHTS = {'topics': 3.0, 'description': 2.0, 'readme': 1.0}
+README_MENTION_CAP = 8  # more mentions in one README add nothing
+RECENCY_HALF_LIFE_DAYS = 365  # relative to the most recently pushed repo
+INDEX_SIZE = 50
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_MAX_PHRASE_WORDS = 3
+
+
+def init_skill_index_table(cursor):
+    """Create the skill index cache (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS github_skill_index (
+            username TEXT PRIMARY KEY,  -- lowercased GitHub username
+            corpus_hash TEXT NOT NULL,
+            skills TEXT NOT NULL,  -- JSON list of {skill, weight, repos}
+            computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def build_phrase_map(extra_skills: Iterable[str] = ()) -> Dict[str, str]:
+    """Phrase -> canonical skill, with extra skills (e.g. typed profile skills) added as themselves"""
+    phrases = {}
+    for skill, aliases in SKILL_VOCABULARY.items():
+        for phrase in [skill, *aliases]:
+            phrases[' '.join(tokenize(phrase))] = skill
+    for skill in extra_skills:
+        key = ' '.join(tokenize(skill))
+        if key:
+            phrases.setdefault(key, skill.lower())
+    return phrases
+
+
+def tokenize(text: str) -> List[str]:
+    # Hyphens and underscores split words so "machine-learning" topics match
+    tokens = _TOKEN.findall(text.lower().replace('-', ' ').replace('_', ' '))
+    return [token.rstrip('.') for token in tokens if token.rstrip('.')]
+
+
+def count_mentions(text: str, phrases: Dict[str, str]) -> Dict[str, int]:
+    """Mentions per canonical skill, matching phrases of up to three words"""
+    tokens = tokenize(text)
+    counts = defaultdict(int)
+    for i in range(len(tokens)):
+        for n in range(_MAX_PHRASE_WORDS, 0, -1):
+            skill = phrases.get(' '.join(tokens[i:i + n]))
+            if skill:
+                counts[skill] += 1
+                break
+    return counts
+
+
+def _days_between(later: Optional[str], earlier: Optional[str]) -> float:
+    try:
+        parse = lambda value: datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return max(0.0, (parse(later) - parse(earlier)).total_seconds() / 86400)
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+def mine_skills(entries: Iterable[Dict], phrases: Dict[str, str], limit: int = INDEX_SIZE,
+                newest: Optional[str] = None) -> List[Dict]:
+    """Ranked skills for corpus entries (repo metadata plus readme_text).
+
+    A repo contributes its mention score times a repo weight: recency halves
+    every RECENCY_HALF_LIFE_DAYS before the newest push, and larger READMEs
+    count more (logarithmically). Forks are skipped. Weights are scaled so
+    the top skill is 1.0. Pass `newest` to consume entries as a stream.
+    """
+    if newest is None:
+        entries = list(entries)
+        newest = max((entry.get('pushed_at') or '' for entry in entries), default='')
+
+    weights = defaultdict(float)
+    repos = defaultdict(int)
+    for entry in entries:
+        if entry.get('fork'):
+            continue
+        age_days = _days_between(newest, entry.get('pushed_at'))
+        repo_weight = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        repo_weight *= 1 + math.log10(1 + (entry.get('size') or 0) / 1000)
+
+        mention_scores = defaultdict(float)
+        fields = {
+            'topics': ' , '.join(entry.get('topics') or []),
+            'description': entry.get('description') or '',
+            'readme': entry.get('readme_text') or '',
+        }
+        for field, text in fields.items():
+            for skill, count in count_mentions(text, phrases).items():
+                if field == 'readme':
+                    count = min(count, README_MENTION_CAP)
+                    mention_scores[skill] += FIELD_WEIGHTS[field] * (1 + math.log2(count))
+                else:
+                    mention_scores[skill] += FIELD_WEIGHTS[field]
+        for skill, score in mention_scores.items():
+            weights[skill] += repo_weight * score
+            repos[skill] += 1
+
+    top = max(weights.values(), default=0.0)
+    ranked = sorted(weights.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [
+        {"skill": skill, "weight": round(weight / top, 4), "repos": repos[skill]}
+        for skill, weight in ranked
+    ]
+
+
+def corpus_hash(conn, username: str, phrases: Dict[str, str]) -> str:
+    """Hash of the stored READMEs' identity and the vocabulary; changes when either does"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT full_name, readme_sha, fetched_at, pushed_at, topics, description FROM github_readmes
+        WHERE username = ? ORDER BY full_name
+    """, (username.lower(),))
+    digest = hashlib.sha1(json.dumps(sorted(phrases.items())).encode('utf-8'))
+    for row in cursor:
+        digest.update(json.dumps(row).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _iter_corpus(conn, username: str):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT pushed_at, size, fork, topics, description, readme_zlib FROM github_readmes
+        WHERE username = ?
+    """, (username.lower(),))
+    for pushed_at, size, fork, topics, description, readme_zlib in cursor:
+        yield {
+            'pushed_at': pushed_at,
+            'size': size,
+            'fork': bool(fork),
+            'topics': json.loads(topics) if topics else [],
+            'description': description,
+            'readme_text': zlib.decompress(readme_zlib).decode('utf-8') if readme_zlib else '',
+        }
+
+
+def get_skill_index(conn, username: Optional[str], extra_skills: Iterable[str] = ()) -> Dict:
+    """The cached skill index of username, recomputed if the corpus changed"""
+    if not username:
+        return {"corpus_hash": None, "computed_at": None, "cached": False, "skills": []}
+    phrases = build_phrase_map(extra_skills)
+    current_hash = corpus_hash(conn, username, phrases)
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT corpus_hash, skills, computed_at FROM github_skill_index WHERE username = ?",
+                   (username.lower(),))
+    row = cursor.fetchone()
+    if row and row[0] == current_hash:
+        return {"corpus_hash": current_hash, "computed_at": row[2], "cached": True, "skills": json.loads(row[1])}
+
+    started = time.time()
+    cursor.execute("SELECT MAX(pushed_at) FROM github_readmes WHERE username = ? AND NOT COALESCE(fork, 0)",
+                   (username.lower(),))
+    newest = cursor.fetchone()[0] or ''
+    skills = mine_skills(_iter_corpus(conn, username), phrases, newest=newest)
+    cursor.execute("""
+        INSERT OR REPLACE INTO github_skill_index (username, corpus_hash, skills, computed_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    """, (username.lower(), current_hash, json.dumps(skills)))
+    conn.commit()
+    return {
+        "corpus_hash": current_hash,
+        "computed_at": datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+        "cached": False,
+        "seconds": round(time.time() - started, 3),
+        "skills": skills,
+    }
+
+
+def suggest_skills(typed_skills: List[str], index_skills: List[Dict], limit: Optional[int] = None) -> List[str]:
+    """Mined skills the user has not typed, best evidenced first"""
+    phrases = build_phrase_map(typed_skills)
+    typed = {phrases.get(' '.join(tokenize(skill)), skill.lower()) for skill in typed_skills}
+    suggested = [entry['skill'] for entry in index_skills if entry['skill'] not in typed]
+    return suggested if limit is None else suggested[:max(0, limit)]
+
+
+def merge_skills(typed_skills: List[str], index_skills: List[Dict], extra: int) -> List[str]:
+    """Typed skills ranked by GitHub evidence, then up to `extra` mined skills not typed"""
+    phrases = build_phrase_map(typed_skills)
+    canonical = lambda skill: phrases.get(' '.join(tokenize(skill)), skill.lower())
+    weight = {entry['skill']: entry['weight'] for entry in index_skills}
+    ranked = sorted(typed_skills, key=lambda skill: -weight.get(canonical(skill), 0.0))
+    return ranked + suggest_skills(typed_skills, index_skills, extra)
@@ -0,0 +1,164 @@
+"""
+Search Term Scheduler
+Tracks how many new jobs each search term yields and schedules every term on
+its own interval: productive terms run more often, stale ones less, failing
+ones back off exponentially, and all of them share an hourly scrape budget
+"""
+
+import random
+import time
+from typing import Dict, List, Optional
+
+# Weight of the latest run in the new-jobs moving average
+YIELD_EMA_ALPHA = 0.3
+# New jobs per run at which a term keeps the base interval
+TARGET_NEW_JOBS = 3.0
+# Interval multiplier bounds for high- and low-yield terms
+MIN_INTERVAL_FACTOR = 0.5
+MAX_INTERVAL_FACTOR = 8.0
+MAX_BACKOFF_SECONDS = 24 * 3600
+JITTER_FRACTION = 0.2
+RUN_HISTORY_SECONDS = 7 * 24 * 3600
+
+
+def init_term_tables(cursor):
+    """Create the per-term stats and run log tables (called from init_database)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_term_stats (
+            term TEXT PRIMARY KEY,
+            runs INTEGER DEFAULT 0,
+            new_jobs_total INTEGER DEFAULT 0,
+            yield_ema REAL,  -- moving average of new jobs per run
+            consecutive_failures INTEGER DEFAULT 0,
+            last_run_at REAL,
+            next_run_at REAL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_term_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            term TEXT NOT NULL,
+            ran_at REAL NOT NULL,
+            new_jobs INTEGER DEFAULT 0,
+            failed BOOLEAN DEFAULT FALSE
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_search_term_runs_ran_at ON search_term_runs(ran_at)")
+
+
+def next_interval_seconds(base_seconds: float, yield_ema: Optional[float], failures: int) -> float:
+    """Interval until a term's next run, before jitter"""
+    if failures:
+        return min(base_seconds * 2 ** failures, MAX_BACKOFF_SECONDS)
+    if yield_ema is None:
+        return base_seconds
+    factor = TARGET_NEW_JOBS / max(yield_ema, TARGET_NEW_JOBS / MAX_INTERVAL_FACTOR)
+    return base_seconds * max(MIN_INTERVAL_FACTOR, factor)
+
+
+def _jittered(seconds: float) -> float:
+    # Spread terms out so they don't all come due in the same tick
+    return seconds * random.uniform(1 - JITTER_FRACTION, 1 + JITTER_FRACTION)
+
+
+def record_term_result(conn, term: str, new_jobs: int, failed: bool, base_seconds: float):
+    """Update a term's yield after a scrape and schedule its next run"""
+    now = time.time()
+    cursor = conn.cursor()
+    cursor.execute("SELECT yield_ema, consecutive_failures FROM search_term_stats WHERE term = ?", (term,))
+    row = cursor.fetchone()
+    yield_ema, failures = row if row else (None, 0)
+
+    if failed:
+        failures = (failures or 0) + 1
+    else:
+        failures = 0
+        yield_ema = new_jobs if yield_ema is None else (
+            YIELD_EMA_ALPHA * new_jobs + (1 - YIELD_EMA_ALPHA) * yield_ema
+        )
+
+    next_run_at = now + _jittered(next_interval_seconds(base_seconds, yield_ema, failures))
+    cursor.execute("""
+        INSERT INTO search_term_stats (term, runs, new_jobs_total, yield_ema, consecutive_failures, last_run_at, next_run_at)
+        VALUES (?, 1, ?, ?, ?, ?, ?)
+        ON CONFLICT(term) DO UPDATE SET
+            runs = runs + 1,
+            new_jobs_total = new_jobs_total + excluded.new_jobs_total,
+            yield_ema = excluded.yield_ema,
+            consecutive_failures = excluded.consecutive_failures,
+            last_run_at = excluded.last_run_at,
+            next_run_at = excluded.next_run_at
+    """, (term, 0 if failed else new_jobs, yield_ema, failures, now, next_run_at))
+    cursor.execute("""
+        INSERT INTO search_term_runs (term, ran_at, new_jobs, failed) VALUES (?, ?, ?, ?)
+    """, (term, now, new_jobs, failed))
+    cursor.execute("DELETE FROM search_term_runs WHERE ran_at < ?", (now - RUN_HISTORY_SECONDS,))
+    conn.commit()
+
+
+def postpone_term(conn, term: str, until: float):
+    """Push a term's next run back without recording a run (e.g. served from cache)"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE search_term_stats SET next_run_at = MAX(COALESCE(next_run_at, 0), ?) WHERE term = ?
+    """, (until, term))
+    conn.commit()
+
+
+def runs_in_last_hour(conn) -> int:
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM search_term_runs WHERE ran_at > ?", (time.time() - 3600,))
+    return cursor.fetchone()[0]
+
+
+def due_terms(conn, terms: List[str], hourly_budget: int) -> List[str]:
+    """Terms whose next run has come, highest yield first, within the hourly budget.
+
+    Terms never scraped before are due immediately.
+    """
+    if not terms:
+        return []
+    remaining = hourly_budget - runs_in_last_hour(conn)
+    if remaining <= 0:
+        return []
+
+    now = time.time()
+    cursor = conn.cursor()
+    placeholders = ",".join("?" * len(terms))
+    cursor.execute(f"""
+        SELECT term, yield_ema, next_run_at FROM search_term_stats
+        WHERE term IN ({placeholders})
+    """, terms)
+    stats = {term: (yield_ema, next_run_at) for term, yield_ema, next_run_at in cursor.fetchall()}
+
+    due = []
+    for term in terms:
+        yield_ema, next_run_at = stats.get(term, (None, None))
+        if next_run_at is None or next_run_at <= now:
+            # Unknown yield sorts first so new terms get measured
+            due.append((float('inf') if yield_ema is None else yield_ema, term))
+    due.sort(key=lambda item: -item[0])
+    return [term for _, term in due[:remaining]]
+
+
+def term_schedule(conn) -> List[Dict]:
+    """Per-term yield and schedule, soonest first"""
+    now = time.time()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT term, runs, new_jobs_total, yield_ema, consecutive_failures, last_run_at, next_run_at
+        FROM search_term_stats
+        ORDER BY next_run_at
+    """)
+    return [
+        {
+            "term": term,
+            "runs": runs,
+            "new_jobs_total": new_jobs_total,
+            "avg_new_jobs": round(yield_ema, 2) if yield_ema is not None else None,
+            "consecutive_failures": failures,
+            "last_run_seconds_ago": round(now - last_run_at) if last_run_at else None,
+            "next_run_in_seconds": round(next_run_at - now) if next_run_at else None,
+        }
+        for term, runs, new_jobs_total, yield_ema, failures, last_run_at, next_run_at in cursor.fetchall()
+    ]
@@ -0,0 +1,128 @@
+"""
+GitHub Rate Limit Bucket
+Refill from X-RateLimit headers, in-flight accounting, and waiting for (or
+failing at) the reset of the RateLimitBucket used by AsyncGitHubReadmeExtractor
+
+Usage:
+    python -m pytest tests/test_async_github.py
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+# The repo's profile package shadows the stdlib module of the same name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profile import async_github  # noqa: E402
+from profile.async_github import RateLimitBucket  # noqa: E402
+from profile.github_scrapper import GitHubRateLimitError  # noqa: E402
+
+NOW = 1_000_000.0
+
+
+def headers(remaining, reset_at):
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(reset_at))}
+
+
+class RateLimitBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.now = NOW
+        self.sleeps = []
+        clock = mock.patch.object(async_github.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def _acquire(self, bucket, times=1):
+        async def fake_sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        async def acquire_all():
+            for _ in range(times):
+                await bucket.acquire()
+
+        with mock.patch.object(async_github.asyncio, "sleep", fake_sleep):
+            asyncio.run(acquire_all())
+
+    def test_unknown_budget_passes(self):
+        bucket = RateLimitBucket()
+        self._acquire(bucket, 50)
+        self.assertEqual(bucket.snapshot(), {"remaining": None, "reset_at": None, "in_flight": 50})
+        self.assertEqual(self.sleeps, [])
+
+    def test_release_refills_from_headers(self):
+        bucket = RateLimitBucket()
+        self._acquire(bucket, 3)
+        bucket.release(headers(10, NOW + 60))
+        self.assertEqual((bucket.remaining, bucket.reset_at, bucket.in_flight), (10, NOW + 60, 2))
+
+        # A response of the same window that arrives late does not add tokens back
+        bucket.release(headers(12, NOW + 60))
+        self.assertEqual(bucket.remaining, 10)
+        # Unusable headers only return the slot
+        bucket.release({"X-RateLimit-Remaining": "lots"})
+        bucket.release(None)
+        self.assertEqual((bucket.remaining, bucket.in_flight), (10, 0))
+
+        # The next window replaces the budget
+        bucket.release(headers(5000, NOW + 3600))
+        self.assertEqual((bucket.remaining, bucket.reset_at, bucket.in_flight), (5000, NOW + 3600, 0))
+
+    def test_in_flight_requests_spend_tokens(self):
+        bucket = RateLimitBucket(wait=False)
+        bucket.release(headers(2, NOW + 60))
+        self._acquire(bucket, 2)
+        with self.assertRaises(GitHubRateLimitError):
+            self._acquire(bucket)
+
+        # A finished request without headers frees its token again
+        bucket.release()
+        self._acquire(bucket)
+        self.assertEqual(bucket.in_flight, 2)
+
+    def test_reserve_is_kept_back(self):
+        bucket = RateLimitBucket(wait=False, reserve=1)
+        bucket.release(headers(3, NOW + 60))
+        self._acquire(bucket, 2)
+        with self.assertRaises(GitHubRateLimitError):
+            self._acquire(bucket)
+
+    def test_waits_for_the_reset(self):
+        bucket = RateLimitBucket()
+        bucket.release(headers(0, NOW + 30))
+        self._acquire(bucket)
+        self.assertEqual(self.sleeps, [31])
+        # The window has reset: requests pass until the next response refills it
+        self.assertEqual((bucket.remaining, bucket.in_flight), (None, 1))
+
+    def test_reset_too_far_away_raises(self):
+        bucket = RateLimitBucket(max_sleep=60)
+        bucket.release(headers(0, NOW + 600))
+        with self.assertRaises(GitHubRateLimitError):
+            self._acquire(bucket)
+        self.assertEqual((self.sleeps, bucket.in_flight), ([], 0))
+
+    def test_past_reset_clears_the_budget(self):
+        bucket = RateLimitBucket(wait=False)
+        bucket.release(headers(0, NOW - 5))
+        self._acquire(bucket)
+        self.assertEqual((bucket.remaining, self.sleeps), (None, []))
+
+    def test_exhaust(self):
+        bucket = RateLimitBucket(wait=False)
+        bucket.release(headers(4000, NOW + 600))
+        # A secondary limit hit with an earlier retry time keeps the later reset
+        bucket.exhaust(NOW + 60)
+        self.assertEqual((bucket.remaining, bucket.reset_at), (0, NOW + 600))
+        with self.assertRaises(GitHubRateLimitError):
+            self._acquire(bucket)
+
+        bucket.exhaust(NOW + 900)
+        self.assertEqual(bucket.reset_at, NOW + 900)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+GitHub README Strategies
+Runs GitHubReadmeExtractor against a fake GitHub API (http.server) and checks
+how many requests each README strategy makes per repo, and that a second
+refresh through the HTTP cache is served by ETag revalidation (304s)
+
+Usage:
+    python -m pytest tests/test_github_strategies.py
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The repo's profile package shadows the stdlib module of the same name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from profile.github_scrapper import README_CANDIDATE_PATHS, GitHubReadmeExtractor  # noqa: E402
+from profile.http_cache import HttpCache  # noqa: E402
+
+OWNER = "octocat"
+# repo -> README path (None: the repo has no README)
+README_PATHS = {
+    "root": "README.md",
+    "lowercase": "readme.md",
+    "rst": "README.rst",
+    "docs": "docs/README.md",
+    "capital-docs": "Docs/README.md",  # outside what the readme endpoint searches
+    "missing": None,
+}
+
+# Requests per repo for each strategy
+PROBE_REQUESTS = {
+    repo: README_CANDIDATE_PATHS.index(path) + 1 if path else len(README_CANDIDATE_PATHS)
+    for repo, path in README_PATHS.items()
+}
+REST_REQUESTS = {"root": 1, "lowercase": 1, "rst": 1, "docs": 1, "capital-docs": 2, "missing": 2}
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Repo listing, readme and contents endpoints, and GraphQL blob lookups.
+
+    Responses carry an ETag; a matching If-None-Match gets a 304.
+    """
+
+    requests_by_repo = Counter()
+    statuses = Counter()
+    graphql_requests = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        with self.lock:
+            self.statuses[status] += 1
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        if body:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _file(self, repo, path):
+        content = base64.b64encode(f"# {repo}".encode()).decode()
+        return {"type": "file", "encoding": "base64", "path": path, "sha": f"sha-{repo}", "content": content}
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == f"/users/{OWNER}/repos":
+            return self._send_json(200, [
+                {"name": repo, "full_name": f"{OWNER}/{repo}", "owner": {"login": OWNER}, "fork": False}
+                for repo in README_PATHS
+            ])
+        match = re.match(rf"/repos/{OWNER}/([^/]+)/(readme|contents/(.+))$", path)
+        repo, readme = match.group(1), README_PATHS[match.group(1)]
+        with self.lock:
+            self.requests_by_repo[repo] += 1
+        if match.group(2) == "readme":
+            # GitHub's readme endpoint searches the root, docs/ and .github/ only
+            found = readme is not None and os.path.dirname(readme) in ("", "docs", ".github")
+        else:
+            found = readme == match.group(3)
+        if found:
+            return self._send_json(200, self._file(repo, readme))
+        self._send_json(404, {"message": "Not Found"})
+
+    def do_POST(self):
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["query"]
+        with self.lock:
+            type(self).graphql_requests += 1
+        data = {}
+        for alias, repo in re.findall(rf'(r\d+): repository\(owner: "{OWNER}", name: "([^"]+)"\)', query):
+            data[alias] = {
+                f"p{j}": {"oid": f"sha-{repo}", "text": f"# {repo}"} if README_PATHS[repo] == path else None
+                for j, path in enumerate(README_CANDIDATE_PATHS)
+            }
+        self._send_json(200, {"data": data})
+
+
+class GitHubStrategyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.api_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        # A GITHUB_TOKEN from the environment would switch "auto" to GraphQL
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop("GITHUB_TOKEN", None)
+        FakeGitHub.requests_by_repo.clear()
+        FakeGitHub.statuses.clear()
+        FakeGitHub.graphql_requests = 0
+
+    def _fetch(self, strategy, token=None, http_cache=None):
+        extractor = GitHubReadmeExtractor(
+            OWNER, token=token, strategy=strategy, api_url=self.api_url, http_cache=http_cache, max_workers=2,
+        )
+        results = extractor.fetch()
+        self.assertEqual({result["repo"]: result["readme_path"] for result in results}, README_PATHS)
+        for result in results:
+            self.assertEqual(result["readme_text"], f"# {result['repo']}" if result["readme_path"] else "")
+        return extractor, results
+
+    def test_probe_tries_each_candidate_path(self):
+        extractor, _ = self._fetch("probe")
+        self.assertEqual(dict(FakeGitHub.requests_by_repo), PROBE_REQUESTS)
+        self.assertEqual(extractor.requests_made, 1 + sum(PROBE_REQUESTS.values()))
+
+    def test_rest_uses_the_readme_endpoint(self):
+        extractor, _ = self._fetch("rest")
+        self.assertEqual(dict(FakeGitHub.requests_by_repo), REST_REQUESTS)
+        self.assertEqual(extractor.requests_made, 1 + sum(REST_REQUESTS.values()))
+
+    def test_graphql_batches_repos_into_one_query(self):
+        extractor, _ = self._fetch("graphql", token="test-token")
+        self.assertEqual(FakeGitHub.requests_by_repo, Counter())
+        self.assertEqual(FakeGitHub.graphql_requests, 1)
+        self.assertEqual(extractor.requests_made, 2)
+
+    def test_auto_picks_graphql_only_with_a_token(self):
+        self._fetch("auto")
+        self.assertEqual(dict(FakeGitHub.requests_by_repo), REST_REQUESTS)
+        self.setUp()
+        self._fetch("auto", token="test-token")
+        self.assertEqual(FakeGitHub.graphql_requests, 1)
+
+    def test_second_refresh_revalidates_with_etags(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = HttpCache(cache_dir)
+            try:
+                self._fetch("rest", http_cache=cache)
+                first_requests = sum(FakeGitHub.statuses.values())
+                self.assertEqual(FakeGitHub.statuses[304], 0)
+
+                FakeGitHub.statuses.clear()
+                extractor, results = self._fetch("rest", http_cache=cache)
+            finally:
+                cache.close()
+        # Same requests again, but every 200 from the first refresh (the listing
+        # and one per README) is now a 304 served from the cache, with the same
+        # README bodies; the 404s of the missing paths are repeated
+        readmes = sum(1 for path in README_PATHS.values() if path)
+        self.assertEqual(extractor.requests_made, first_requests)
+        self.assertEqual(FakeGitHub.statuses[200], 0)
+        self.assertEqual(FakeGitHub.statuses[304], 1 + readmes)
+        self.assertEqual(FakeGitHub.statuses[404], sum(REST_REQUESTS.values()) - readmes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Job Dump Import
+Streaming of JSON arrays across read-chunk boundaries, record normalization
+and confinement of imports to the import directory
+
+Usage:
+    python -m pytest tests/test_job_import.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_import import iter_import_records, iter_json_array, normalize_record, resolve_import_paths  # noqa: E402
+
+# Strings with brackets, commas, escapes and non-ASCII text, nested values and
+# uneven whitespace, so items and separators end up split at every offset
+ITEMS = [
+    {"id": "~01a", "title": "Scraper [urgent], \"fast\"", "skills": ["Python", "Selenium"]},
+    {"id": "~01b", "title": "Données ✓ \\ backslash", "nested": {"list": [1, [2, {"three": 3}]], "empty": {}}},
+    [],
+    "a ] string",
+    12.5,
+    None,
+    {"id": "~01c", "title": "Last"},
+]
+DOCUMENT = "  \n[\n  " + ",\n  \t".join(json.dumps(item, ensure_ascii=False) for item in ITEMS) + " \n]\n"
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    def test_every_chunk_size(self):
+        for chunk_size in range(1, len(DOCUMENT) + 2):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_json_array(io.StringIO(DOCUMENT), chunk_size)), ITEMS)
+
+    def test_empty_array(self):
+        for chunk_size in (1, 2, 64):
+            self.assertEqual(list(iter_json_array(io.StringIO(" [ ] "), chunk_size)), [])
+
+    def test_reads_one_chunk_at_a_time(self):
+        source = io.StringIO(json.dumps([{"n": n, "text": "x" * 50} for n in range(1000)]))
+        items = iter_json_array(source, 256)
+        self.assertEqual(next(items)["n"], 0)
+        # Only the chunks the first item needed were read
+        self.assertLess(source.tell(), 512)
+        self.assertEqual(sum(1 for _ in items), 999)
+
+    def test_not_an_array(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO('{"id": "~01a"}'), 4))
+
+    def test_truncated_array(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(io.StringIO(DOCUMENT[:DOCUMENT.index('"Last"') + 3]), 8))
+
+
+class ImportRecordsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, "imports")
+        os.makedirs(self.root)
+
+    def _write(self, path, text):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_normalize_record(self):
+        self.assertIsNone(normalize_record({"id": "~01a", "title": "Known", "known": True}))
+        self.assertIsNone(normalize_record({"title": "N/A"}))
+        job_id, job = normalize_record({"title": " Bot ", "skills": "['Python', 'n8n']", "proposals": "x", "budget": ""})
+        self.assertTrue(job_id.startswith("import_"))
+        self.assertEqual(job, {"title": "Bot", "skills": ["Python", "n8n"], "proposals": 0})
+        # Stable, so importing a dump twice does not duplicate the job
+        self.assertEqual(normalize_record({"title": "Bot"})[0], job_id)
+
+    def test_reads_every_format_under_a_directory(self):
+        self._write(os.path.join(self.root, "a.json"), json.dumps([{"id": "~01a", "title": "A"}]))
+        self._write(os.path.join(self.root, "b.ndjson"), '{"id": "~01b", "title": "B"}\n\n')
+        self._write(os.path.join(self.root, "c.csv"), "id,title,skills\n~01c,C,\"['SQL']\"\n")
+        self._write(os.path.join(self.root, "bad.json"), '{"not": "an array"}')
+        self._write(os.path.join(self.root, "notes.txt"), "ignored")
+
+        errors = []
+        records = list(iter_import_records([self.root], errors, root=self.root))
+        self.assertEqual([job_id for job_id, _ in records], ["~01a", "~01b", "~01c"])
+        self.assertEqual(records[2][1]["skills"], ["SQL"])
+        self.assertEqual(errors, ["bad.json: expected a JSON array"])
+
+    def test_paths_outside_the_import_directory(self):
+        outside = self._write(os.path.join(self.tmp.name, "secret.json"), json.dumps([{"id": "~01s", "title": "S"}]))
+        for path in ("../secret.json", outside):
+            with self.assertRaises(ValueError):
+                resolve_import_paths([path], self.root)
+
+        # Symlinks found while walking a directory are not followed out of it
+        os.symlink(outside, os.path.join(self.root, "link.json"))
+        self._write(os.path.join(self.root, "inside.json"), json.dumps([{"id": "~01i", "title": "I"}]))
+        paths = resolve_import_paths(["."], self.root)
+        self.assertEqual([job_id for job_id, _ in iter_import_records(paths, [], root=self.root)], ["~01i"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Append-only Job Store
+Dedup on append, compaction of small segments, and compaction shared by
+processes saving to the same store
+
+Usage:
+    python -m pytest tests/test_job_store.py
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapper.file_lock import file_lock  # noqa: E402
+from scrapper.job_store import JobStore  # noqa: E402
+
+
+def _append_batches(store_dir, worker, batches):
+    store = JobStore(store_dir, compact_min_segments=2)
+    try:
+        for batch in range(batches):
+            store.append([{"id": f"~01w{worker}b{batch}j{n}", "title": "Job"} for n in range(3)])
+    finally:
+        store.close()
+
+
+class JobStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = JobStore(self.tmp.name, compact_min_segments=100)
+        self.addCleanup(self.store.close)
+
+    def _ids(self):
+        return [job.get("id") or job["title"] for job in self.store.iter_jobs()]
+
+    def test_append_skips_stored_and_repeated_jobs(self):
+        self.assertEqual(self.store.append([{"id": "~01a", "title": "A"}, {"id": "~01b", "title": "B"}]), (2, 0))
+        self.assertEqual(self.store.append([
+            {"id": "~01b", "title": "B again"},
+            {"id": "~01c", "title": "C"},
+            {"id": "~01c", "title": "C twice in one batch"},
+            {"title": "No ID"},
+            {"title": "no id "},  # same title key
+            {"title": "N/A"},  # no key at all
+        ]), (2, 4))
+        self.assertEqual(self.store.append([{"id": "~01a", "title": "A"}]), (0, 1))
+        self.assertEqual(self._ids(), ["~01a", "~01b", "~01c", "No ID"])
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(len(self.store.segments()), 2)
+
+    def test_compaction_merges_small_segments_in_order(self):
+        for n in range(5):
+            self.store.append([{"id": f"~01{n}", "title": "Job"}])
+        before = self._ids()
+
+        self.assertEqual(self.store.compact(), 5)
+        self.assertEqual(len(self.store.segments()), 1)
+        self.assertEqual(self._ids(), before)
+        # Every index entry points at the merged segment
+        indexed = {segment for (segment,) in self.store._index.execute("SELECT DISTINCT segment FROM jobs")}
+        self.assertEqual(indexed, set(self.store.segments()))
+
+        # Later appends sort after the merged segment
+        self.store.append([{"id": "~01new", "title": "Job"}])
+        self.assertEqual(self._ids(), before + ["~01new"])
+
+    def test_append_compacts_once_past_the_segment_limit(self):
+        store = JobStore(self.tmp.name, compact_min_segments=3)
+        try:
+            for n in range(4):
+                store.append([{"id": f"~01{n}", "title": "Job"}])
+            self.assertEqual(len(store.segments()), 1)
+        finally:
+            store.close()
+
+    def test_compaction_is_skipped_while_another_holds_the_lock(self):
+        for n in range(3):
+            self.store.append([{"id": f"~01{n}", "title": "Job"}])
+        with file_lock(self.store.lock_path):
+            self.assertEqual(self.store.compact(wait=False), 0)
+        self.assertEqual(self.store.compact(wait=False), 3)
+
+    def test_processes_saving_to_one_store(self):
+        workers, batches = 4, 15
+        processes = [
+            multiprocessing.Process(target=_append_batches, args=(self.tmp.name, worker, batches))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.assertEqual([process.exitcode for process in processes], [0] * workers)
+        self.assertEqual(len(self.store), workers * batches * 3)
+        self.assertEqual(len(set(self._ids())), workers * batches * 3)
+        indexed = {segment for (segment,) in self.store._index.execute("SELECT DISTINCT segment FROM jobs")}
+        self.assertTrue(indexed <= set(self.store.segments()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Database Leases
+Exclusive acquisition, renewal, expiry takeover and release of the named
+SQLite leases behind the scrape lock and scheduler leader election
+
+Usage:
+    python -m pytest tests/test_leases.py
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import leases  # noqa: E402
+from leases import acquire_lease, get_lease, init_lease_table, keep_lease_alive, release_lease  # noqa: E402
+
+TTL_SECONDS = 30
+
+
+class LeaseTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        init_lease_table(self.conn.cursor())
+        self.now = 1_000_000.0
+        clock = mock.patch.object(leases.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_only_one_holder_at_a_time(self):
+        self.assertTrue(acquire_lease(self.conn, "scrape", TTL_SECONDS, "a"))
+        self.assertFalse(acquire_lease(self.conn, "scrape", TTL_SECONDS, "b"))
+        # Other names are independent
+        self.assertTrue(acquire_lease(self.conn, "leader", TTL_SECONDS, "b"))
+        self.assertEqual(get_lease(self.conn, "scrape")["holder"], "a")
+
+    def test_holder_renews_and_keeps_acquired_at(self):
+        acquire_lease(self.conn, "scrape", TTL_SECONDS, "a")
+        self.now += TTL_SECONDS - 1
+        self.assertTrue(acquire_lease(self.conn, "scrape", TTL_SECONDS, "a"))
+        self.now += TTL_SECONDS - 1
+        self.assertFalse(acquire_lease(self.conn, "scrape", TTL_SECONDS, "b"))
+        lease = get_lease(self.conn, "scrape")
+        self.assertTrue(lease["active"])
+        self.assertEqual(lease["held_for_seconds"], 2 * (TTL_SECONDS - 1))
+
+    def test_expired_lease_is_taken_over(self):
+        acquire_lease(self.conn, "scrape", TTL_SECONDS, "a")
+        self.now += TTL_SECONDS + 1
+        self.assertFalse(get_lease(self.conn, "scrape")["active"])
+        self.assertTrue(acquire_lease(self.conn, "scrape", TTL_SECONDS, "b"))
+        self.assertEqual(get_lease(self.conn, "scrape")["holder"], "b")
+        self.assertEqual(get_lease(self.conn, "scrape")["held_for_seconds"], 0)
+        # The old holder lost it and cannot renew
+        self.assertFalse(acquire_lease(self.conn, "scrape", TTL_SECONDS, "a"))
+
+    def test_only_the_holder_releases(self):
+        acquire_lease(self.conn, "scrape", TTL_SECONDS, "a")
+        release_lease(self.conn, "scrape", "b")
+        self.assertEqual(get_lease(self.conn, "scrape")["holder"], "a")
+        release_lease(self.conn, "scrape", "a")
+        self.assertIsNone(get_lease(self.conn, "scrape"))
+        self.assertTrue(acquire_lease(self.conn, "scrape", TTL_SECONDS, "b"))
+
+
+class KeepLeaseAliveTest(unittest.TestCase):
+    def test_renews_until_the_lease_is_lost(self):
+        ttl = 0.3
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "leases.db")
+            conn = sqlite3.connect(path)
+            init_lease_table(conn.cursor())
+            acquire_lease(conn, "scrape", ttl, "a")
+
+            async def scenario():
+                renewal = asyncio.create_task(keep_lease_alive(lambda: sqlite3.connect(path), "scrape", ttl, "a"))
+                # Outlives the TTL only because it is renewed
+                await asyncio.sleep(ttl * 2)
+                self.assertFalse(acquire_lease(conn, "scrape", ttl, "b"))
+                self.assertFalse(renewal.done())
+
+                # Another holder takes over: the renewal loop notices and returns
+                conn.execute("UPDATE leases SET holder = 'b' WHERE name = 'scrape'")
+                conn.commit()
+                await asyncio.wait_for(renewal, ttl * 2)
+
+            try:
+                asyncio.run(scenario())
+            finally:
+                conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Scrape Result Cache
+Fresh, stale and expired lookups of the per-URL result cache, and the
+stale-while-revalidate refresh tasks queued by scrape_jobs_background
+
+Usage:
+    python -m pytest tests/test_scrape_cache.py
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scrape_cache  # noqa: E402
+from scrape_cache import cache_stats, init_cache_table, lookup_cached_result, normalize_url, store_result  # noqa: E402
+
+TTL_SECONDS = 600
+STALE_SECONDS = 1800
+URL = "https://www.upwork.com/nx/search/jobs/?q=Python&sort=recency"
+JOBS = [{"id": "~01aaa", "title": "Python scraper"}]
+
+
+class ScrapeCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        init_cache_table(self.conn.cursor())
+        self.now = 1_000_000.0
+        clock = mock.patch.object(scrape_cache.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _lookup(self, url=URL):
+        return lookup_cached_result(self.conn, url, TTL_SECONDS, STALE_SECONDS)
+
+    def test_fresh_then_stale_then_expired(self):
+        self.assertIsNone(self._lookup())
+        store_result(self.conn, URL, JOBS, 12.5)
+
+        self.now += TTL_SECONDS
+        self.assertEqual(self._lookup(), {"jobs": JOBS, "age_seconds": TTL_SECONDS, "fresh": True})
+        self.now += 1
+        self.assertFalse(self._lookup()["fresh"])
+        self.now += STALE_SECONDS
+        self.assertIsNone(self._lookup())
+
+        stats = cache_stats(self.conn)
+        self.assertEqual((stats["hits"], stats["stale_hits"], stats["misses"]), (1, 1, 2))
+        # Only fresh hits replace a browser session
+        self.assertEqual(stats["browser_seconds_saved"], 12.5)
+
+    def test_equivalent_urls_share_an_entry(self):
+        store_result(self.conn, URL, JOBS, 1.0)
+        self.assertEqual(normalize_url("HTTPS://WWW.Upwork.com/nx/search/jobs?sort=recency&q=python+"), normalize_url(URL))
+        self.assertTrue(self._lookup("https://www.upwork.com/nx/search/jobs/?sort=recency&q=PYTHON")["fresh"])
+        self.assertIsNone(self._lookup("https://www.upwork.com/nx/search/jobs/?q=python&sort=relevance"))
+
+    def test_store_replaces_the_entry(self):
+        store_result(self.conn, URL, JOBS, 1.0)
+        self.now += TTL_SECONDS + 1
+        store_result(self.conn, URL, [], 2.0)
+        self.assertEqual(self._lookup(), {"jobs": [], "age_seconds": 0, "fresh": True})
+
+
+class StaleRefreshTest(unittest.TestCase):
+    """scrape_jobs_background serves stale entries and queues their refresh"""
+
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(os.chdir, self.previous_dir)
+
+        import main
+        self.main = main
+        main.init_database()
+        self.conn = main.get_db_connection()
+        self.addCleanup(self.conn.close)
+
+    def _cache_stale(self, config, term):
+        url = self.main.search_url(term, config)
+        store_result(self.conn, url, [{"id": f"~01{term}", "title": f"{term} job", "job_url": url}], 5.0)
+        self.conn.execute("UPDATE scrape_url_cache SET scraped_at = scraped_at - ? WHERE url_key = ?",
+                          (self.main.SCRAPE_CACHE_TTL_SECONDS + 1, normalize_url(url)))
+        self.conn.commit()
+
+    def _refresh_terms(self):
+        rows = self.conn.execute("SELECT config FROM scrape_tasks WHERE source = 'refresh' ORDER BY id").fetchall()
+        return [json.loads(config)["search_terms"] for (config,) in rows]
+
+    def test_refresh_is_queued_for_terms_not_already_refreshing(self):
+        config = self.main.ScrapingConfig(search_terms=["python", "sql"], auto_scrape=True)
+        for term in config.search_terms:
+            self._cache_stale(config, term)
+        self.main.enqueue_task(self.conn, {"search_terms": ["python"], "use_cache": False}, source="refresh")
+
+        with mock.patch.object(self.main, "manual_upwork_viewer", side_effect=AssertionError("browser opened")):
+            self.assertTrue(asyncio.run(self.main.scrape_jobs_background(config)))
+            self.assertEqual(self._refresh_terms(), [["python"], ["sql"]])
+
+            # Both terms are now pending a refresh, so nothing more is queued
+            self.assertTrue(asyncio.run(self.main.scrape_jobs_background(config)))
+            self.assertEqual(self._refresh_terms(), [["python"], ["sql"]])
+
+        # The stale jobs were served right away
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
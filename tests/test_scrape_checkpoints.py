@@ -0,0 +1,150 @@
+"""
+Scrape Run Checkpoints
+Per-URL checkpoints of a scraping run, and the resume of an interrupted or
+failed queue task at its incomplete URLs
+
+Usage:
+    python -m pytest tests/test_scrape_checkpoints.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrape_checkpoints import complete_url, incomplete_urls, run_totals, start_run  # noqa: E402
+
+URL_TERMS = {f"https://www.upwork.com/nx/search/jobs/?q={term}": term for term in ("python", "sql", "react")}
+URLS = list(URL_TERMS)
+
+
+class DatabaseTest(unittest.TestCase):
+    """Runs against a database created by main.init_database in a temp dir"""
+
+    def setUp(self):
+        self.previous_dir = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(os.chdir, self.previous_dir)
+
+        import main
+        self.main = main
+        main.init_database()
+        self.conn = main.get_db_connection()
+        self.addCleanup(self.conn.close)
+
+    def _log(self, log_id):
+        return self.conn.execute("SELECT status, resumed FROM scraping_logs WHERE id = ?", (log_id,)).fetchone()
+
+
+class CheckpointTest(DatabaseTest):
+    def test_new_run_has_a_pending_checkpoint_per_url(self):
+        log_id, resumed = start_run(self.conn, URL_TERMS, task_id=1)
+        self.assertFalse(resumed)
+        self.assertEqual(self._log(log_id), ("in_progress", 0))
+        self.assertEqual(incomplete_urls(self.conn, log_id), URLS)
+        self.assertEqual(run_totals(self.conn, log_id),
+                         {"pending": 3, "done": 0, "failed": 0, "jobs_found": 0, "jobs_added": 0})
+
+    def test_incomplete_urls_keep_their_order(self):
+        log_id, _ = start_run(self.conn, URL_TERMS)
+        complete_url(self.conn, log_id, URLS[1], "done", "browser", jobs_found=4, jobs_added=2)
+        complete_url(self.conn, log_id, URLS[2], "failed", "browser", error="timeout")
+        self.assertEqual(incomplete_urls(self.conn, log_id), [URLS[0], URLS[2]])
+        self.assertEqual(run_totals(self.conn, log_id),
+                         {"pending": 1, "done": 1, "failed": 1, "jobs_found": 4, "jobs_added": 2})
+
+    def test_crashed_run_resumes_for_the_same_task(self):
+        log_id, _ = start_run(self.conn, URL_TERMS, task_id=7)
+        complete_url(self.conn, log_id, URLS[0], "done", "browser", jobs_found=3, jobs_added=3)
+
+        # The process died with the run still in_progress
+        self.assertEqual(start_run(self.conn, URL_TERMS, task_id=7), (log_id, True))
+        self.assertEqual(self._log(log_id), ("in_progress", 1))
+        self.assertEqual(incomplete_urls(self.conn, log_id), URLS[1:])
+        # Jobs added by the first attempt still count towards the run
+        self.assertEqual(run_totals(self.conn, log_id)["jobs_added"], 3)
+
+    def test_failed_run_resumes_and_counts_attempts(self):
+        log_id, _ = start_run(self.conn, URL_TERMS, task_id=7)
+        complete_url(self.conn, log_id, URLS[0], "failed", "browser", error="blocked")
+        self.conn.execute("UPDATE scraping_logs SET status = 'failed' WHERE id = ?", (log_id,))
+
+        self.assertEqual(start_run(self.conn, URL_TERMS, task_id=7), (log_id, True))
+        complete_url(self.conn, log_id, URLS[0], "done", "browser", jobs_found=1, jobs_added=1)
+        self.assertEqual(incomplete_urls(self.conn, log_id), URLS[1:])
+        attempts = self.conn.execute("SELECT attempts FROM scrape_checkpoints WHERE log_id = ? AND url = ?",
+                                     (log_id, URLS[0])).fetchone()[0]
+        self.assertEqual(attempts, 2)
+
+    def test_other_runs_are_not_resumed(self):
+        completed, _ = start_run(self.conn, URL_TERMS, task_id=7)
+        self.conn.execute("UPDATE scraping_logs SET status = 'completed' WHERE id = ?", (completed,))
+        crashed, _ = start_run(self.conn, URL_TERMS, task_id=8)
+
+        # A completed run is not resumed, and neither is another task's run,
+        # which is marked interrupted because its process is gone
+        for task_id in (7, 9, None):
+            with self.subTest(task_id=task_id):
+                log_id, resumed = start_run(self.conn, URL_TERMS, task_id=task_id)
+                self.assertFalse(resumed)
+                self.assertNotIn(log_id, (completed, crashed))
+                self.conn.execute("UPDATE scraping_logs SET status = 'completed' WHERE id = ?", (log_id,))
+        self.assertEqual(self._log(crashed), ("interrupted", 0))
+        self.assertEqual(start_run(self.conn, URL_TERMS, task_id=8), (crashed, True))
+
+
+class ResumeScrapeTest(DatabaseTest):
+    """A failed queue task's retry scrapes only the URLs that failed"""
+
+    def setUp(self):
+        super().setUp()
+        self.visited = []
+        self.blocked = {"sql"}
+        self.visited_lock = threading.Lock()
+        self.config = self.main.ScrapingConfig(search_terms=["python", "sql", "react"], auto_scrape=True, use_cache=False)
+        self.url_terms = {self.main.search_url(term, self.config): term for term in self.config.search_terms}
+
+    def _viewer(self, url, on_job=None, **kwargs):
+        term = self.url_terms[url]
+        with self.visited_lock:
+            self.visited.append(term)
+        if term in self.blocked:
+            raise RuntimeError("verification page")
+        jobs = [{"id": f"~01{term}", "title": f"{term} job", "job_url": f"https://www.upwork.com/jobs/{term}_~01{term}"}]
+        for job in jobs:
+            on_job(job)
+        return jobs
+
+    def _scrape(self):
+        with mock.patch.object(self.main, "manual_upwork_viewer", self._viewer), \
+                mock.patch.object(self.main, "SessionStore", mock.MagicMock()), \
+                mock.patch.object(self.main, "SCRAPE_DOMAIN_MIN_INTERVAL_SECONDS", 0):
+            return asyncio.run(self.main.scrape_jobs_background(self.config, task_id=5))
+
+    def test_retry_resumes_at_the_failed_url(self):
+        with self.assertRaisesRegex(RuntimeError, "1 of 3 URLs failed"):
+            self._scrape()
+        self.assertEqual(sorted(self.visited), ["python", "react", "sql"])
+        log_id = self.conn.execute("SELECT id FROM scraping_logs WHERE task_id = 5").fetchone()[0]
+        self.assertEqual(incomplete_urls(self.conn, log_id), [self.main.search_url("sql", self.config)])
+
+        self.visited.clear()
+        self.blocked.clear()
+        self.assertTrue(self._scrape())
+        self.assertEqual(self.visited, ["sql"])
+        self.assertEqual(self._log(log_id), ("completed", 1))
+        self.assertEqual(incomplete_urls(self.conn, log_id), [])
+        # The run's total covers the jobs added by both attempts
+        self.assertEqual(self.conn.execute("SELECT jobs_found FROM scraping_logs WHERE id = ?", (log_id,)).fetchone()[0], 3)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
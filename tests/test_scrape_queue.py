@@ -0,0 +1,140 @@
+"""
+Scrape Task Queue
+Claims, lease expiry, requeue and retry accounting of the SQLite task queue
+consumed by scrape_worker.py
+
+Usage:
+    python -m pytest tests/test_scrape_queue.py
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scrape_queue  # noqa: E402
+from scrape_queue import (  # noqa: E402
+    claim_task, complete_task, enqueue_task, fail_task, init_queue_tables, queue_status, renew_lease, requeue_task,
+)
+
+LEASE_SECONDS = 60
+
+
+class ScrapeQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        init_queue_tables(self.conn.cursor())
+        self.now = 1_000_000.0
+        clock = mock.patch.object(scrape_queue.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _row(self, task_id):
+        return self.conn.execute(
+            "SELECT status, attempts, lease_owner FROM scrape_tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+
+    def test_claims_oldest_task_once(self):
+        first = enqueue_task(self.conn, {"search_terms": ["python"]})
+        second = enqueue_task(self.conn, {"search_terms": ["sql"]})
+
+        claimed = claim_task(self.conn, "worker-a", LEASE_SECONDS)
+        self.assertEqual(claimed, {"id": first, "config": {"search_terms": ["python"]}, "attempt": 1})
+        self.assertEqual(claim_task(self.conn, "worker-b", LEASE_SECONDS)["id"], second)
+        self.assertIsNone(claim_task(self.conn, "worker-c", LEASE_SECONDS))
+        self.assertEqual(self._row(first), ("running", 1, "worker-a"))
+
+    def test_expired_lease_is_claimed_by_another_worker(self):
+        task_id = enqueue_task(self.conn, {})
+        claim_task(self.conn, "worker-a", LEASE_SECONDS)
+        self.assertIsNone(claim_task(self.conn, "worker-b", LEASE_SECONDS))
+
+        self.now += LEASE_SECONDS + 1
+        claimed = claim_task(self.conn, "worker-b", LEASE_SECONDS)
+        self.assertEqual((claimed["id"], claimed["attempt"]), (task_id, 2))
+        # The old holder can no longer renew or complete it
+        self.assertFalse(renew_lease(self.conn, task_id, "worker-a", LEASE_SECONDS))
+        complete_task(self.conn, task_id, "worker-a")
+        self.assertEqual(self._row(task_id), ("running", 2, "worker-b"))
+
+    def test_renewed_lease_is_not_reclaimed(self):
+        enqueue_task(self.conn, {})
+        task_id = claim_task(self.conn, "worker-a", LEASE_SECONDS)["id"]
+        self.now += LEASE_SECONDS - 1
+        self.assertTrue(renew_lease(self.conn, task_id, "worker-a", LEASE_SECONDS))
+        self.now += LEASE_SECONDS - 1
+        self.assertIsNone(claim_task(self.conn, "worker-b", LEASE_SECONDS))
+
+    def test_requeue_does_not_count_the_attempt(self):
+        task_id = enqueue_task(self.conn, {})
+        claim_task(self.conn, "worker-a", LEASE_SECONDS)
+        requeue_task(self.conn, task_id, "worker-a")
+        self.assertEqual(self._row(task_id), ("queued", 0, None))
+        self.assertEqual(claim_task(self.conn, "worker-b", LEASE_SECONDS)["attempt"], 1)
+
+    def test_failures_retry_until_max_attempts(self):
+        task_id = enqueue_task(self.conn, {}, max_attempts=2)
+        claim_task(self.conn, "worker-a", LEASE_SECONDS)
+        fail_task(self.conn, task_id, "worker-a", "boom")
+        self.assertEqual(self._row(task_id), ("queued", 1, None))
+
+        claim_task(self.conn, "worker-a", LEASE_SECONDS)
+        fail_task(self.conn, task_id, "worker-a", "boom again")
+        self.assertEqual(self._row(task_id), ("failed", 2, None))
+        self.assertIsNone(claim_task(self.conn, "worker-a", LEASE_SECONDS))
+
+    def test_expired_lease_on_final_attempt_fails_the_task(self):
+        dead = enqueue_task(self.conn, {}, max_attempts=1)
+        claim_task(self.conn, "worker-a", LEASE_SECONDS)
+        waiting = enqueue_task(self.conn, {})
+
+        self.now += LEASE_SECONDS + 1
+        # The dead task is failed and the next one claimed in the same call
+        self.assertEqual(claim_task(self.conn, "worker-b", LEASE_SECONDS)["id"], waiting)
+        self.assertEqual(self._row(dead), ("failed", 1, None))
+        self.assertEqual(queue_status(self.conn, LEASE_SECONDS)["queue"],
+                         {"queued": 0, "running": 1, "completed": 0, "failed": 1})
+
+
+class ConcurrentClaimTest(unittest.TestCase):
+    def test_each_task_is_claimed_by_one_worker(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "queue.db")
+            conn = sqlite3.connect(path)
+            init_queue_tables(conn.cursor())
+            task_ids = [enqueue_task(conn, {"n": n}) for n in range(40)]
+            conn.close()
+
+            claims = []
+            lock = threading.Lock()
+
+            def worker(name):
+                worker_conn = sqlite3.connect(path, timeout=30)
+                try:
+                    while True:
+                        task = claim_task(worker_conn, name, LEASE_SECONDS)
+                        if task is None:
+                            return
+                        with lock:
+                            claims.append(task["id"])
+                finally:
+                    worker_conn.close()
+
+            threads = [threading.Thread(target=worker, args=(f"worker-{n}",)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(sorted(claims), task_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()